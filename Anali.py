@@ -2,7 +2,57 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
 import re
+import sys
+import time
 from pathlib import Path
+import Scanutils
+import Javalexer
+
+# Expresión usada antes del analizador léxico; solo se mantiene como referencia en el benchmark
+METHOD_PATTERN = re.compile(r'(public|protected|private|static|\s) +([\w\<\>\[\]]+)\s+(\w+) *\([^\)]*\) *(\{?|[^;])')
+
+class SymbolIndex:
+    """Índice en memoria del proyecto analizado: clase -> archivo y métodos, paquete -> clases.
+    
+    Guarda los tokens de cada archivo, con la tabla de parejas de llaves calculada en la misma
+    pasada del analizador léxico. Seleccionar un método es una búsqueda en diccionario: el
+    cuerpo va de body_open a body_close, sin volver a recorrer el texto ni leer el disco.
+    """
+    
+    def __init__(self):
+        self.files = {}         # clase -> ruta del archivo
+        self.tokens = {}        # ruta -> JavaTokens (texto, tokens y parejas de llaves)
+        self.methods = {}       # clase -> {nombre de método -> MethodDeclaration} (primera declaración con cuerpo)
+        self.packages = {}      # paquete -> [clases]
+    
+    def add(self, class_name, file_path, tokens):
+        """Indexa un archivo ya analizado; devuelve todas sus declaraciones de método"""
+        declarations = self.method_declarations(tokens)
+        methods = {}
+        for method in declarations:
+            if method.body_open is not None:
+                methods.setdefault(method.name, method)
+        self.files[class_name] = file_path
+        self.tokens[file_path] = tokens
+        self.methods[class_name] = methods
+        self.packages.setdefault(Javalexer.package_name(tokens), []).append(class_name)
+        return declarations
+    
+    @staticmethod
+    def method_declarations(tokens):
+        """Métodos y constructores de todos los tipos del archivo (anidados incluidos)"""
+        return [method for declaration in Javalexer.type_declarations(tokens)
+                for method in Javalexer.method_declarations(tokens, declaration)]
+    
+    def lookup(self, class_name, method_name):
+        """(JavaTokens del archivo, MethodDeclaration) del método, o None si no se conoce"""
+        method = self.methods.get(class_name, {}).get(method_name)
+        if method is None:
+            return None
+        return self.tokens[self.files[class_name]], method
+    
+    def __contains__(self, class_name):
+        return class_name in self.files
 
 class JavaProjectAnalyzer:
     def __init__(self, root):
@@ -14,6 +64,7 @@ class JavaProjectAnalyzer:
         self.project_path = None
         self.classes = []
         self.methods = {}
+        self.index = SymbolIndex()
         self.current_class = None
         
         # UI Components
@@ -110,13 +161,14 @@ class JavaProjectAnalyzer:
         # Clear previous data
         self.classes = []
         self.methods = {}
+        self.index = SymbolIndex()
         self.classes_listbox.delete(0, tk.END)
         self.methods_listbox.delete(0, tk.END)
         self.deps_tree.delete(*self.deps_tree.get_children())
         
         # Find all Java files
         java_files = []
-        for root, dirs, files in os.walk(self.project_path):
+        for root, dirs, files in Scanutils.walk(self.project_path):
             # Skip test directories and hidden directories
             if any(x in root for x in ['/test', '/Test', '\\test', '\\Test']) or any(x.startswith('.') for x in root.split(os.sep)):
                 continue
@@ -137,14 +189,17 @@ class JavaProjectAnalyzer:
                 except:
                     continue
             
+            # Single lexer pass per file: tokens and brace pairs are reused by every lookup
+            tokens = Javalexer.tokenize(content)
+            
             # Extract class name
-            class_name = self.extract_class_name(content, java_file)
+            class_name = self.extract_class_name(tokens, java_file)
             if class_name and 'test' not in class_name.lower():
                 self.classes.append(class_name)
                 
-                # Extract methods
-                class_methods = self.extract_methods(content)
-                self.methods[class_name] = class_methods
+                # Keep the tokens and method declarations for method selection, then list the methods
+                declarations = self.index.add(class_name, java_file, tokens)
+                self.methods[class_name] = self.extract_methods(declarations)
         
         # Sort and display classes
         self.classes.sort()
@@ -153,36 +208,19 @@ class JavaProjectAnalyzer:
         
         self.status_var.set(f"Proyecto analizado. Encontradas {len(self.classes)} clases.")
     
-    def extract_class_name(self, content, file_path):
-        # Try to find class declaration
-        class_patterns = [
-            r'class\s+(\w+)',
-            r'interface\s+(\w+)',
-            r'enum\s+(\w+)',
-            r'record\s+(\w+)'
-        ]
-        
-        for pattern in class_patterns:
-            match = re.search(pattern, content)
-            if match:
-                return match.group(1)
+    def extract_class_name(self, tokens, file_path):
+        # Main type declaration (comments and strings are skipped by the lexer)
+        declaration = Javalexer.primary_type(tokens)
+        if declaration:
+            return declaration.name
         
         # If no match, use filename
         return os.path.basename(file_path).replace('.java', '')
     
-    def extract_methods(self, content):
-        methods = []
-        # Pattern to match method declarations
-        method_pattern = r'(public|protected|private|static|\s) +[\w\<\>\[\]]+\s+(\w+) *\([^\)]*\) *(\{?|[^;])'
-        
-        matches = re.finditer(method_pattern, content)
-        for match in matches:
-            method_name = match.group(2)
-            # Skip constructors
-            if not any(cls in method_name for cls in self.classes):
-                methods.append(method_name)
-        
-        return methods
+    @staticmethod
+    def extract_methods(declarations):
+        # Methods declared in every type of the file (nested ones included), constructors excluded
+        return [method.name for method in declarations if not method.is_constructor]
     
     def on_class_select(self, event):
         if not self.classes_listbox.curselection():
@@ -206,34 +244,9 @@ class JavaProjectAnalyzer:
         selected_index = self.methods_listbox.curselection()[0]
         method_name = self.methods[self.current_class][selected_index]
         
-        # Find the Java file for the current class
-        java_file = None
-        for root, dirs, files in os.walk(self.project_path):
-            for file in files:
-                if file.endswith('.java') and self.current_class in file:
-                    java_file = os.path.join(root, file)
-                    break
-            if java_file:
-                break
-        
-        if not java_file:
-            self.status_var.set("No se pudo encontrar el archivo de la clase")
-            return
-        
-        # Read the file content
-        try:
-            with open(java_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except:
-            try:
-                with open(java_file, 'r', encoding='latin-1') as f:
-                    content = f.read()
-            except:
-                self.status_var.set("Error al leer el archivo de la clase")
-                return
-        
-        # Find the method and extract involved classes
-        involved_classes = self.find_involved_classes(content, method_name)
+        # Method declaration and file tokens come from the index built by analyze_project
+        found = self.index.lookup(self.current_class, method_name)
+        involved_classes = self.find_involved_classes(*found) if found else []
         
         # Display the involved classes
         self.deps_tree.delete(*self.deps_tree.get_children())
@@ -242,62 +255,31 @@ class JavaProjectAnalyzer:
         
         self.status_var.set(f"Método seleccionado: {self.current_class}.{method_name} - {len(involved_classes)} clases involucradas")
     
-    def find_involved_classes(self, content, method_name):
-        # Find the method in the content
-        method_pattern = rf'[\w\<\>\[\]]+\s+{method_name}\s*\([^\)]*\)\s*\{'
-        method_match = re.search(method_pattern, content)
-        
-        if not method_match:
-            return []
-        
-        # Find the method body
-        start_pos = method_match.end()
-        brace_count = 1
-        end_pos = start_pos
-        
-        while brace_count > 0 and end_pos < len(content):
-            if content[end_pos] == '{':
-                brace_count += 1
-            elif content[end_pos] == '}':
-                brace_count -= 1
-            end_pos += 1
-        
-        method_body = content[start_pos:end_pos]
+    def find_involved_classes(self, tokens, method):
+        # Method body: token range between the braces paired at indexing time
+        body_start, body_end = method.body_open + 1, method.body_close
         
         # Find all class references in the method body
         involved_classes = set()
         
-        # Look for object creation: new ClassName()
-        new_pattern = r'new\s+([\w\.]+)\s*\('
-        for match in re.finditer(new_pattern, method_body):
-            cls_name = match.group(1).split('.')[-1]  # Get just the class name without package
-            if cls_name in self.classes:
+        # Look for object creation: new ClassName() (the lexer already drops the package)
+        for cls_name, _ in Javalexer.instantiations(tokens, body_start, body_end):
+            if cls_name in self.index:
                 involved_classes.add((cls_name, 'Instanciación'))
         
-        # Look for method calls: object.method()
-        method_call_pattern = r'(\w+)\.\w+\s*\('
-        for match in re.finditer(method_call_pattern, method_body):
-            var_name = match.group(1)
-            
-            # Try to find the variable declaration to get its type
-            var_pattern = rf'([\w\.<>\[\]]+)\s+{var_name}\s*='
-            var_match = re.search(var_pattern, method_body)
-            if var_match:
-                cls_name = var_match.group(1).split('.')[-1].replace('[]', '')
-                if cls_name in self.classes:
-                    involved_classes.add((cls_name, 'Uso'))
-        
-        # Look for class references in parameters and return types
-        param_pattern = r'\(([^)]*)\)'
-        method_def_match = re.search(method_pattern[:-1] + param_pattern, content)
-        if method_def_match:
-            params = method_def_match.group(1).split(',')
-            for param in params:
-                param = param.strip()
-                if param:
-                    cls_name = param.split()[-1].replace('[]', '')
-                    if cls_name in self.classes:
-                        involved_classes.add((cls_name, 'Parámetro'))
+        # Look for method calls: object.method(), with the object declared in the body
+        local_types = {}
+        for type_name, var_name, _ in Javalexer.variable_declarations(tokens, body_start, body_end):
+            local_types.setdefault(var_name, type_name)
+        for qualifier, _, _ in Javalexer.calls(tokens, body_start, body_end):
+            cls_name = local_types.get(qualifier)
+            if cls_name in self.index:
+                involved_classes.add((cls_name, 'Uso'))
+        
+        # Look for class references in parameters
+        for cls_name, _ in Javalexer.parameters(tokens, method):
+            if cls_name in self.index:
+                involved_classes.add((cls_name, 'Parámetro'))
         
         return list(involved_classes)
     
@@ -307,7 +289,83 @@ class JavaProjectAnalyzer:
         self.current_class = None
         self.status_var.set("Seleccione una clase de la lista")
 
+def benchmark_extract_methods(sizes=(500, 1000, 2000, 4000, 8000), methods_per_class=20, legacy_limit=2000):
+    """Tiempo de extracción de métodos para proyectos sintéticos de tamaño creciente.
+    
+    Compara con el filtro anterior (any(cls in method_name for cls in classes) sobre la lista
+    creciente de clases), que es cuadrático; se mide solo hasta legacy_limit clases.
+    """
+    print(f"{'clases':>8} {'actual (s)':>12} {'us/clase':>10} {'anterior (s)':>14}")
+    for size in sizes:
+        sources = []
+        for i in range(size):
+            body = "".join(f"    public Result{j} handleRequest{i}x{j}(Request{j} request) {{ return new Result{j}(request); }}\n"
+                           for j in range(methods_per_class))
+            sources.append((f"Service{i}", f"package com.example.p{i % 50};\n\npublic class Service{i} {{\n"
+                                           f"    public Service{i}() {{ }}\n{body}}}\n"))
+        
+        start = time.perf_counter()
+        for class_name, content in sources:
+            JavaProjectAnalyzer.extract_methods(SymbolIndex.method_declarations(Javalexer.tokenize(content)))
+        elapsed = time.perf_counter() - start
+        
+        legacy = "-"
+        if size <= legacy_limit:
+            classes = []
+            start = time.perf_counter()
+            for class_name, content in sources:
+                classes.append(class_name)
+                for match in METHOD_PATTERN.finditer(content):
+                    any(cls in match.group(3) for cls in classes)
+            legacy = f"{time.perf_counter() - start:.3f}"
+        
+        print(f"{size:>8} {elapsed:>12.3f} {elapsed / size * 1e6:>10.1f} {legacy:>14}")
+
+def benchmark_method_lookup(lines=(2500, 5000, 10000, 20000), lookups=200):
+    """Indexado y búsqueda del cuerpo de métodos en una clase generada de muchas líneas.
+    
+    Compara con el recorrido anterior, carácter a carácter desde la declaración hasta la llave
+    de cierre, que se repetía en cada búsqueda.
+    """
+    print(f"{'líneas':>8} {'indexar (s)':>12} {'búsqueda (us)':>14} {'anterior (us)':>14}")
+    for size in lines:
+        methods = size // 5
+        body = "".join(f"    public String method{i}(String value) {{\n        if (value.isEmpty()) {{ return \"{{\"; }}\n"
+                       f"        return value + {i};\n    }}\n\n" for i in range(methods))
+        content = f"package com.example.generated;\n\npublic class Generated {{\n{body}}}\n"
+        
+        start = time.perf_counter()
+        index = SymbolIndex()
+        index.add("Generated", "Generated.java", Javalexer.tokenize(content))
+        indexing = time.perf_counter() - start
+        
+        names = [f"method{i * methods // lookups}" for i in range(lookups)]
+        start = time.perf_counter()
+        for name in names:
+            tokens, method = index.lookup("Generated", name)
+            tokens.source[tokens.ends[method.body_open]:tokens.starts[method.body_close]]
+        lookup = (time.perf_counter() - start) / lookups * 1e6
+        
+        start = time.perf_counter()
+        for name in names:
+            match = re.search(r'\s' + name + r'\s*\([^\)]*\)\s*\{', content)
+            brace_count = 1
+            end_pos = match.end()
+            while brace_count > 0 and end_pos < len(content):
+                if content[end_pos] == '{':
+                    brace_count += 1
+                elif content[end_pos] == '}':
+                    brace_count -= 1
+                end_pos += 1
+        legacy = (time.perf_counter() - start) / lookups * 1e6
+        
+        print(f"{size:>8} {indexing:>12.3f} {lookup:>14.1f} {legacy:>14.1f}")
+
 if __name__ == "__main__":
+    if '--benchmark' in sys.argv:
+        benchmark_extract_methods()
+        benchmark_method_lookup()
+        sys.exit(0)
     root = tk.Tk()
     app = JavaProjectAnalyzer(root)
     root.mainloop()
@@ -5,6 +5,7 @@ import threading
 import xml.etree.ElementTree as ET
 import yaml
 import re
+import Scanutils
 
 class SpringBootAnalyzerApp:
     def __init__(self, root):
@@ -118,7 +119,7 @@ class SpringBootAnalyzerApp:
     # Utility Methods
     def find_files(self, directory, filename_pattern):
         matches = []
-        for root, dirs, files in os.walk(directory):
+        for root, dirs, files in Scanutils.walk(directory):
             for file in files:
                 if filename_pattern.lower() in file.lower():
                     matches.append(os.path.join(root, file))
@@ -126,7 +127,7 @@ class SpringBootAnalyzerApp:
 
     def find_java_directories(self, project_path):
         java_dirs = []
-        for root, dirs, files in os.walk(project_path):
+        for root, dirs, files in Scanutils.walk(project_path):
             if 'src/main/java' in root:
                 java_dirs.append(root)
             elif 'src' in root and 'java' in dirs:
@@ -0,0 +1,848 @@
+import os
+import re
+import tomllib
+import xml.etree.ElementTree as ET
+
+# Marcadores ${...} de Maven
+PLACEHOLDER_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Pasadas máximas de sustitución (una propiedad puede referirse a otra)
+MAX_INTERPOLATION_DEPTH = 10
+
+
+def local_name(tag):
+    """Nombre de un elemento sin el espacio de nombres: '{http://maven.apache.org/POM/4.0.0}groupId' -> 'groupId'"""
+    return tag.rsplit('}', 1)[-1]
+
+
+class PomDependency:
+    """Una dependencia declarada en un pom.xml"""
+    __slots__ = ('group_id', 'artifact_id', 'version', 'scope', 'managed')
+
+    def __init__(self, fields, managed=False):
+        self.group_id = fields.get('groupId')
+        self.artifact_id = fields.get('artifactId')
+        self.version = fields.get('version')
+        self.scope = fields.get('scope')
+        self.managed = managed            # Declarada en dependencyManagement
+
+    @property
+    def key(self):
+        return (self.group_id, self.artifact_id)
+
+    @property
+    def coordinates(self):
+        return f"{self.group_id}:{self.artifact_id}:{self.version}"
+
+
+class PomPlugin:
+    """Un plugin de build (plugins o pluginManagement)"""
+    __slots__ = ('group_id', 'artifact_id', 'version')
+
+    def __init__(self, fields):
+        self.group_id = fields.get('groupId')
+        self.artifact_id = fields.get('artifactId')
+        self.version = fields.get('version')
+
+    @property
+    def coordinates(self):
+        return f"{self.group_id}:{self.artifact_id}"
+
+
+class PomModel:
+    """Contenido de un pom.xml leído en una sola pasada con iterparse.
+
+    Los nombres de elemento se comparan sin espacio de nombres, así que da igual que el
+    pom declare xmlns o no. Tras PomIndex.resolve los valores ${...}, el groupId/version
+    y las propiedades heredadas del padre y las versiones gestionadas ya están aplicados.
+    """
+    __slots__ = ('path', 'group_id', 'artifact_id', 'version', 'packaging', 'parent', 'properties',
+                 'dependencies', 'managed_dependencies', 'managed_versions', 'plugins', 'modules', 'error',
+                 'parent_model', 'resolved')
+
+    # Elementos que agrupan campos propios (groupId, artifactId...) dentro de su contenedor
+    RECORDS = {'dependency': 'dependencies', 'plugin': 'plugins', 'parent': 'project'}
+
+    def __init__(self, path):
+        self.path = path
+        self.group_id = None
+        self.artifact_id = None
+        self.version = None
+        self.packaging = None
+        self.parent = None                # Campos de <parent>: groupId, artifactId, version, relativePath
+        self.properties = {}
+        self.dependencies = []
+        self.managed_dependencies = []
+        self.managed_versions = {}        # (groupId, artifactId) -> dependencia gestionada, propia o heredada
+        self.plugins = []
+        self.modules = []
+        self.error = None
+        self.parent_model = None
+        self.resolved = False
+
+    @classmethod
+    def load(cls, path):
+        model = cls(path)
+        try:
+            model._parse()
+        except Exception as e:
+            model.error = str(e)
+        return model
+
+    def _parse(self):
+        stack = []                        # Nombres locales desde <project> hasta el elemento actual
+        records = []                      # (profundidad, tipo, campos) de dependencias/plugins/parent abiertos
+        for event, elem in ET.iterparse(self.path, events=('start', 'end')):
+            name = local_name(elem.tag)
+            if event == 'start':
+                stack.append(name)
+                if len(stack) > 1 and self.RECORDS.get(name) == stack[-2]:
+                    records.append((len(stack), name, {}))
+                continue
+
+            depth = len(stack)
+            text = (elem.text or '').strip()
+            if records and records[-1][0] == depth - 1:
+                records[-1][2][name] = text
+            elif records and records[-1][0] == depth:
+                self._add_record(stack, *records.pop()[1:])
+            elif depth == 2:
+                if name == 'groupId':
+                    self.group_id = text
+                elif name == 'artifactId':
+                    self.artifact_id = text
+                elif name == 'version':
+                    self.version = text
+                elif name == 'packaging':
+                    self.packaging = text
+            elif depth == 3 and stack[1] == 'properties':
+                self.properties[name] = text
+            elif depth == 3 and name == 'module' and stack[1] == 'modules':
+                self.modules.append(text)
+
+            stack.pop()
+            if depth <= 2:
+                # Libera los hijos ya procesados de <project>
+                elem.clear()
+
+    def _add_record(self, stack, kind, fields):
+        if kind == 'parent':
+            self.parent = fields
+        elif kind == 'plugin':
+            self.plugins.append(PomPlugin(fields))
+        elif 'plugin' in stack:
+            # Dependencias propias de un plugin: no forman parte del proyecto
+            return
+        elif 'dependencyManagement' in stack:
+            self.managed_dependencies.append(PomDependency(fields, managed=True))
+        else:
+            self.dependencies.append(PomDependency(fields))
+
+    def iter_dependencies(self, managed=True):
+        """Dependencias declaradas y, con managed=True, también las de dependencyManagement"""
+        yield from self.dependencies
+        if managed:
+            yield from self.managed_dependencies
+
+    @property
+    def coordinates(self):
+        return f"{self.group_id}:{self.artifact_id}:{self.version}"
+
+    def lookup(self, name):
+        """Valor de una propiedad ${name}, o None si no se conoce"""
+        if name in self.properties:
+            return self.properties[name]
+        if name in ('project.version', 'pom.version', 'version'):
+            return self.version
+        if name in ('project.groupId', 'pom.groupId'):
+            return self.group_id
+        if name in ('project.artifactId', 'pom.artifactId'):
+            return self.artifact_id
+        if name in ('project.parent.version', 'parent.version') and self.parent:
+            return self.parent.get('version')
+        if name == 'project.basedir':
+            return os.path.dirname(os.path.abspath(self.path))
+        return None
+
+    def interpolate(self, value):
+        """Sustituye los ${...} conocidos; los desconocidos se dejan tal cual"""
+        if not value or '${' not in value:
+            return value
+
+        def replace(match):
+            resolved = self.lookup(match.group(1))
+            return match.group(0) if resolved is None else resolved
+
+        for _ in range(MAX_INTERPOLATION_DEPTH):
+            substituted = PLACEHOLDER_PATTERN.sub(replace, value)
+            if substituted == value:
+                break
+            value = substituted
+        return value
+
+
+class PomIndex:
+    """Todos los pom.xml de un proyecto, cada uno leído una sola vez y resuelto con su herencia.
+
+    El padre de un módulo se busca primero en relativePath (por defecto ../pom.xml) y, si
+    no coincide, entre los pom del proyecto por groupId:artifactId. Los padres externos
+    (spring-boot-starter-parent, por ejemplo) no se descargan: lo que aportan queda sin resolver.
+    """
+
+    def __init__(self, paths):
+        self.models = {}
+        for path in paths:
+            if path not in self.models:
+                self.models[path] = PomModel.load(path)
+        self.by_key = {}
+        for model in self.models.values():
+            if model.error is None:
+                group_id = model.group_id or (model.parent or {}).get('groupId')
+                self.by_key.setdefault((group_id, model.artifact_id), model)
+        for model in self.models.values():
+            self.resolve(model)
+
+    def __iter__(self):
+        return iter(self.models.values())
+
+    def __len__(self):
+        return len(self.models)
+
+    def get(self, path):
+        model = self.models.get(path)
+        if model is None:
+            model = self.models[path] = PomModel.load(path)
+            self.resolve(model)
+        return model
+
+    def find_parent(self, model):
+        if not model.parent:
+            return None
+        key = (model.parent.get('groupId'), model.parent.get('artifactId'))
+        relative_path = model.parent.get('relativePath')
+        if relative_path is None:
+            relative_path = '../pom.xml'
+        if relative_path:
+            candidate = os.path.normpath(os.path.join(os.path.dirname(model.path), relative_path))
+            if os.path.isdir(candidate):
+                candidate = os.path.join(candidate, 'pom.xml')
+            parent = self.models.get(candidate)
+            if parent is None and os.path.isfile(candidate) and candidate != model.path:
+                parent = self.models[candidate] = PomModel.load(candidate)
+            if parent is not None and parent.error is None and parent.artifact_id == key[1]:
+                return parent
+        return self.by_key.get(key)
+
+    def resolve(self, model, resolving=None):
+        """Aplica la herencia del padre y sustituye los ${...} (una sola vez por modelo)"""
+        if model.resolved or model.error is not None:
+            return model
+        resolving = resolving or set()
+        resolving.add(model.path)
+
+        parent = self.find_parent(model)
+        if parent is not None and parent.path not in resolving:
+            self.resolve(parent, resolving)
+            model.parent_model = parent
+            # Las propiedades del hijo prevalecen sobre las heredadas
+            model.properties = {**parent.properties, **model.properties}
+        if model.parent:
+            model.group_id = model.group_id or model.parent.get('groupId')
+            model.version = model.version or model.parent.get('version')
+
+        for name, value in model.properties.items():
+            model.properties[name] = model.interpolate(value)
+        model.group_id = model.interpolate(model.group_id)
+        model.version = model.interpolate(model.version)
+
+        managed = model.managed_versions
+        if model.parent_model is not None:
+            managed.update(model.parent_model.managed_versions)
+        for dependency in model.managed_dependencies:
+            self._interpolate_dependency(model, dependency)
+            managed[dependency.key] = dependency
+
+        for dependency in model.dependencies:
+            self._interpolate_dependency(model, dependency)
+            if dependency.version is None and dependency.key in managed:
+                dependency.version = managed[dependency.key].version
+            if dependency.scope is None and dependency.key in managed:
+                dependency.scope = managed[dependency.key].scope
+        for plugin in model.plugins:
+            plugin.group_id = model.interpolate(plugin.group_id)
+            plugin.artifact_id = model.interpolate(plugin.artifact_id)
+            plugin.version = model.interpolate(plugin.version)
+
+        model.resolved = True
+        return model
+
+    def _interpolate_dependency(self, model, dependency):
+        dependency.group_id = model.interpolate(dependency.group_id)
+        dependency.artifact_id = model.interpolate(dependency.artifact_id)
+        dependency.version = model.interpolate(dependency.version)
+
+    def module_models(self, model):
+        """Modelos de los módulos que declara un pom (los que existen en disco)"""
+        modules = []
+        for module in model.modules:
+            path = os.path.normpath(os.path.join(os.path.dirname(model.path), module))
+            if os.path.isdir(path):
+                path = os.path.join(path, 'pom.xml')
+            if os.path.isfile(path):
+                modules.append(self.get(path))
+        return modules
+
+
+# --- Gradle (DSL de Groovy y de Kotlin) ---
+
+GRADLE_BUILD_FILES = ('build.gradle', 'build.gradle.kts')
+GRADLE_SETTINGS_FILES = ('settings.gradle', 'settings.gradle.kts')
+VERSION_CATALOG = os.path.join('gradle', 'libs.versions.toml')
+
+GRADLE_TOKEN_PATTERN = re.compile(
+    r'(?P<comment>//[^\n]*|/\*.*?\*/)'
+    r'|(?P<string>"""(?:.|\n)*?"""|\'(?:\\.|[^\'\\\n])*\'|"(?:\\.|[^"\\\n])*")'
+    r'|(?P<name>`[^`\n]+`|[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*)'
+    r'|(?P<newline>[\n;])'
+    r'|(?P<symbol>[^\s\w])'
+    r'|(?P<other>\w+)', re.S)
+
+# Interpolación de Groovy/Kotlin: "$nombre", "${nombre}", "${project.nombre}"
+GRADLE_PLACEHOLDER_PATTERN = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][\w.]*)')
+
+# Funciones de dependencias que no aportan coordenadas (archivos locales, API de Gradle)
+GRADLE_FILE_DEPENDENCIES = frozenset(('files', 'fileTree', 'gradleApi', 'gradleTestKit', 'localGroovy'))
+
+
+def tokenize_gradle(content):
+    """(tipo, valor) de cada token de un script de Gradle, sin comentarios; las cadenas van sin comillas"""
+    tokens = []
+    for match in GRADLE_TOKEN_PATTERN.finditer(content):
+        kind = match.lastgroup
+        if kind == 'comment':
+            continue
+        value = match.group()
+        if kind == 'string':
+            value = value[3:-3] if value.startswith('"""') else value[1:-1]
+        elif kind == 'name' and value.startswith('`'):
+            value = value[1:-1]
+        tokens.append((kind, value))
+    return tokens
+
+
+def iter_gradle_statements(tokens):
+    """(bloques abiertos, tokens) de cada sentencia.
+
+    Una sentencia termina en un salto de línea o ';' fuera de paréntesis (salvo que la
+    línea acabe en ',', ':', '=' o '.'), o en una llave. Cada '{' abre un bloque con el
+    nombre de la primera palabra de la sentencia que lo precede: dependencies, plugins...
+    """
+    blocks = []
+    statement = []
+    depth = 0
+    for kind, value in tokens:
+        if kind == 'symbol' and value in '([':
+            depth += 1
+        elif kind == 'symbol' and value in ')]':
+            depth = max(0, depth - 1)
+        elif kind == 'newline':
+            if depth == 0 and statement and not (statement[-1][0] == 'symbol' and statement[-1][1] in ',:=.'):
+                yield tuple(blocks), statement
+                statement = []
+            continue
+        elif depth == 0 and kind == 'symbol' and value in '{}':
+            if statement:
+                yield tuple(blocks), statement
+            if value == '{':
+                blocks.append(statement[0][1] if statement and statement[0][0] == 'name' else None)
+            elif blocks:
+                blocks.pop()
+            statement = []
+            continue
+        statement.append((kind, value))
+    if statement:
+        yield tuple(blocks), statement
+
+
+def split_arguments(tokens):
+    """Argumentos de una llamada: quita los paréntesis exteriores y separa por comas de primer nivel"""
+    if tokens and tokens[0] == ('symbol', '('):
+        depth = 0
+        for index, token in enumerate(tokens):
+            if token[0] == 'symbol' and token[1] in '([':
+                depth += 1
+            elif token[0] == 'symbol' and token[1] in ')]':
+                depth -= 1
+                if depth == 0:
+                    tokens = tokens[1:index]
+                    break
+    arguments = [[]]
+    depth = 0
+    for token in tokens:
+        if token[0] == 'symbol' and token[1] in '([':
+            depth += 1
+        elif token[0] == 'symbol' and token[1] in ')]':
+            depth -= 1
+        elif depth == 0 and token == ('symbol', ','):
+            arguments.append([])
+            continue
+        arguments[-1].append(token)
+    return [argument for argument in arguments if argument]
+
+
+def catalog_alias(alias):
+    """Forma normalizada de un alias del catálogo: 'spring-boot_web' y libs.spring.boot.web coinciden"""
+    return alias.replace('-', '.').replace('_', '.')
+
+
+class GradleDependency:
+    """Una dependencia de un bloque dependencies"""
+    __slots__ = ('configuration', 'notation', 'group_id', 'artifact_id', 'version', 'project', 'alias')
+
+    def __init__(self, configuration, notation=None, group_id=None, artifact_id=None, version=None,
+                 project=None, alias=None):
+        self.configuration = configuration
+        self.notation = notation          # 'grupo:artefacto:versión' tal como aparece (antes de interpolar)
+        self.group_id = group_id
+        self.artifact_id = artifact_id
+        self.version = version
+        self.project = project            # Ruta del módulo en project(':modulo')
+        self.alias = alias                # Referencia al catálogo: libs.<alias>
+
+    @property
+    def coordinates(self):
+        if self.project is not None:
+            return f"project('{self.project}')"
+        if self.group_id is None and self.artifact_id is None:
+            return f"libs.{self.alias}" if self.alias else str(self.notation)
+        if self.version:
+            return f"{self.group_id}:{self.artifact_id}:{self.version}"
+        return f"{self.group_id}:{self.artifact_id}"
+
+
+class GradlePlugin:
+    """Un plugin aplicado con plugins { id ... }, apply plugin: o alias(libs.plugins...)"""
+    __slots__ = ('plugin_id', 'version', 'alias')
+
+    def __init__(self, plugin_id=None, version=None, alias=None):
+        self.plugin_id = plugin_id
+        self.version = version
+        self.alias = alias
+
+    @property
+    def coordinates(self):
+        return self.plugin_id or f"libs.plugins.{self.alias}"
+
+
+class VersionCatalog:
+    """gradle/libs.versions.toml: versiones, librerías, bundles y plugins por alias normalizado"""
+    __slots__ = ('path', 'versions', 'libraries', 'bundles', 'plugins', 'error')
+
+    def __init__(self, path):
+        self.path = path
+        self.versions = {}
+        self.libraries = {}               # alias -> (grupo, artefacto, versión)
+        self.bundles = {}                 # alias -> [alias de librerías]
+        self.plugins = {}                 # alias -> (id, versión)
+        self.error = None
+
+    @classmethod
+    def load(cls, path):
+        catalog = cls(path)
+        try:
+            with open(path, 'rb') as f:
+                data = tomllib.load(f)
+            catalog._read(data)
+        except Exception as e:
+            catalog.error = str(e)
+        return catalog
+
+    def _version(self, value):
+        if isinstance(value, dict):
+            if 'ref' in value:
+                return self._version(self.versions.get(value['ref']))
+            return value.get('strictly') or value.get('require') or value.get('prefer')
+        return value
+
+    def _read(self, data):
+        self.versions = data.get('versions', {})
+        for alias, library in data.get('libraries', {}).items():
+            if isinstance(library, str):
+                group_id, artifact_id, version = (library.split(':') + [None, None])[:3]
+            else:
+                if 'module' in library:
+                    group_id, artifact_id = (library['module'].split(':') + [None])[:2]
+                else:
+                    group_id, artifact_id = library.get('group'), library.get('name')
+                version = self._version(library.get('version'))
+            self.libraries[catalog_alias(alias)] = (group_id, artifact_id, version)
+        for alias, members in data.get('bundles', {}).items():
+            self.bundles[catalog_alias(alias)] = [catalog_alias(member) for member in members]
+        for alias, plugin in data.get('plugins', {}).items():
+            if isinstance(plugin, str):
+                plugin_id, version = (plugin.split(':') + [None])[:2]
+            else:
+                plugin_id, version = plugin.get('id'), self._version(plugin.get('version'))
+            self.plugins[catalog_alias(alias)] = (plugin_id, version)
+
+
+def read_gradle_properties(path):
+    """Pares clave=valor de un gradle.properties (vacío si no existe)"""
+    properties = {}
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith(('#', '!')):
+                    continue
+                key, separator, value = line.partition('=')
+                if not separator:
+                    key, separator, value = line.partition(':')
+                if separator:
+                    properties[key.strip()] = value.strip()
+    except OSError:
+        pass
+    return properties
+
+
+class GradleModel:
+    """Contenido de un build.gradle(.kts) o settings.gradle(.kts), leído con un tokenizador.
+
+    Del script se extraen las dependencias por configuración, los plugins, las propiedades
+    simples (ext, val, def...) y, en los settings, los módulos de include. Las dependencias
+    se guardan tal como están escritas; GradleIndex.resolve interpola las propiedades y
+    sustituye las referencias al catálogo de versiones.
+    """
+    __slots__ = ('path', 'group_id', 'version', 'name', 'properties', 'dependencies', 'plugins',
+                 'modules', 'error', 'catalog', 'resolved')
+
+    def __init__(self, path):
+        self.path = path
+        self.group_id = None
+        self.version = None
+        self.name = None                  # rootProject.name en los settings; nombre del proyecto en los build
+        self.properties = {}
+        self.dependencies = []
+        self.plugins = []
+        self.modules = []                 # Rutas de include (':app', ':libs:core')
+        self.error = None
+        self.catalog = None
+        self.resolved = False
+
+    @classmethod
+    def load(cls, path):
+        model = cls(path)
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                model._parse(f.read())
+        except Exception as e:
+            model.error = str(e)
+        return model
+
+    @property
+    def is_settings(self):
+        return os.path.basename(self.path) in GRADLE_SETTINGS_FILES
+
+    @property
+    def coordinates(self):
+        if self.is_settings or (self.group_id is None and self.version is None):
+            return None
+        return f"{self.group_id}:{self.name}:{self.version}"
+
+    def _parse(self, content):
+        for blocks, statement in iter_gradle_statements(tokenize_gradle(content)):
+            head_kind, head = statement[0]
+            block = blocks[-1] if blocks else None
+            if block == 'dependencies' and head_kind in ('name', 'string'):
+                self._parse_dependency(head, statement[1:])
+            elif block == 'plugins' and head_kind == 'name':
+                self._parse_plugin(statement)
+            elif head == 'apply':
+                self._parse_apply(statement[1:])
+            elif head == 'include' and self.is_settings:
+                self.modules.extend(value for argument in split_arguments(statement[1:])
+                                    for kind, value in argument if kind == 'string')
+            else:
+                self._parse_assignment(blocks, statement)
+
+    def _parse_assignment(self, blocks, statement):
+        if statement[0][1] in ('def', 'val', 'var') and len(statement) > 1:
+            statement = statement[1:]
+        kinds = [kind for kind, value in statement]
+        if kinds == ['name', 'symbol', 'string'] and statement[1][1] == '=':
+            name, value = statement[0][1], statement[2][1]
+        elif kinds == ['name', 'string'] and statement[0][1] in ('group', 'version'):
+            name, value = statement[0][1], statement[1][1]
+        elif statement[0] == ('name', 'set') and len(statement) == 6 and kinds[2] == kinds[4] == 'string':
+            name, value = statement[2][1], statement[4][1]
+        else:
+            return
+        # group y version solo cuentan en el nivel superior, allprojects o subprojects
+        if name in ('group', 'project.group') and blocks in ((), ('allprojects',), ('subprojects',)):
+            self.group_id = value
+        elif name in ('version', 'project.version') and blocks in ((), ('allprojects',), ('subprojects',)):
+            self.version = value
+        elif name == 'rootProject.name':
+            self.name = value
+        else:
+            self.properties[name.rsplit('.', 1)[-1]] = value
+
+    def _parse_dependency(self, configuration, arguments):
+        if arguments and arguments[0] == ('symbol', '='):
+            return
+        arguments = split_arguments(arguments)
+        # Forma de mapa: group: 'x', name: 'y', version: 'z' (o group = "x" en Kotlin)
+        fields = {}
+        for argument in arguments:
+            if len(argument) == 3 and argument[0][0] == 'name' and argument[1][1] in (':', '='):
+                kind, value = argument[2]
+                if kind == 'string':
+                    fields[argument[0][1]] = value
+                elif kind == 'name':
+                    # Variable sin comillas: se resuelve como "${variable}"
+                    fields[argument[0][1]] = '${' + value + '}'
+        if 'name' in fields:
+            self.dependencies.append(GradleDependency(configuration, group_id=fields.get('group'),
+                                                      artifact_id=fields['name'], version=fields.get('version')))
+            return
+        for argument in arguments:
+            self._parse_notation(configuration, argument)
+
+    def _parse_notation(self, configuration, argument):
+        kind, value = argument[0]
+        if kind == 'string':
+            self.dependencies.append(GradleDependency(configuration, notation=value))
+        elif kind != 'name':
+            return
+        elif value.startswith('libs.bundles.'):
+            self.dependencies.append(GradleDependency(configuration, alias='bundles.' + value[len('libs.bundles.'):]))
+        elif value.startswith('libs.'):
+            self.dependencies.append(GradleDependency(configuration, alias=value[len('libs.'):]))
+        elif value in GRADLE_FILE_DEPENDENCIES or len(argument) < 2:
+            return
+        else:
+            inner = split_arguments(argument[1:])
+            if not inner:
+                return
+            if value == 'project':
+                strings = [token[1] for token in inner[0] if token[0] == 'string']
+                if strings:
+                    self.dependencies.append(GradleDependency(configuration, project=strings[-1]))
+            elif value == 'kotlin' and inner[0][0][0] == 'string':
+                version = inner[1][0][1] if len(inner) > 1 and inner[1][0][0] == 'string' else None
+                self.dependencies.append(GradleDependency(configuration, group_id='org.jetbrains.kotlin',
+                                                          artifact_id='kotlin-' + inner[0][0][1], version=version))
+            else:
+                # platform(...), enforcedPlatform(...), testFixtures(...): la dependencia envuelta
+                self._parse_notation(configuration, inner[0])
+
+    def _parse_plugin(self, statement):
+        head = statement[0][1]
+        if head == 'alias':
+            for kind, value in statement[1:]:
+                if kind == 'name' and value.startswith('libs.plugins.'):
+                    self.plugins.append(GradlePlugin(alias=value[len('libs.plugins.'):]))
+            return
+        strings = [value for kind, value in statement if kind == 'string']
+        names = [value for kind, value in statement if kind == 'name']
+        version = None
+        if 'version' in names:
+            after_version = statement[statement.index(('name', 'version')) + 1:]
+            version = next((value for kind, value in after_version if kind == 'string'), None)
+        if head == 'id' and strings:
+            self.plugins.append(GradlePlugin(strings[0], version))
+        elif head == 'kotlin' and strings:
+            self.plugins.append(GradlePlugin('org.jetbrains.kotlin.' + strings[0], version))
+        elif len(statement) == 1:
+            # Plugins del núcleo: java, application, `java-library`
+            self.plugins.append(GradlePlugin(head))
+
+    def _parse_apply(self, arguments):
+        # apply plugin: 'x' (Groovy) o apply(plugin = "x") (Kotlin)
+        for argument in split_arguments(arguments):
+            if len(argument) == 3 and argument[0] == ('name', 'plugin') and argument[2][0] == 'string':
+                self.plugins.append(GradlePlugin(argument[2][1]))
+
+    def iter_dependencies(self):
+        """Dependencias con coordenadas (las de proyecto y las no resueltas también se incluyen)"""
+        return iter(self.dependencies)
+
+    def lookup(self, name):
+        if name in self.properties:
+            return self.properties[name]
+        if name in ('version', 'project.version'):
+            return self.version
+        if name in ('group', 'project.group'):
+            return self.group_id
+        last = name.rsplit('.', 1)[-1]
+        return self.properties.get(last)
+
+    def interpolate(self, value):
+        if not value or '$' not in value:
+            return value
+
+        def replace(match):
+            resolved = self.lookup(match.group(1) or match.group(2))
+            return match.group(0) if resolved is None else resolved
+
+        for _ in range(MAX_INTERPOLATION_DEPTH):
+            substituted = GRADLE_PLACEHOLDER_PATTERN.sub(replace, value)
+            if substituted == value:
+                break
+            value = substituted
+        return value
+
+
+class GradleIndex:
+    """Scripts de Gradle de un proyecto, cada uno leído una sola vez y resuelto.
+
+    Las propiedades visibles en un script son, de menor a mayor prioridad: las de los
+    gradle.properties de sus directorios ancestros dentro del proyecto, las ext de los
+    build.gradle de esos ancestros y las del propio script. El catálogo de versiones es
+    el gradle/libs.versions.toml más cercano hacia la raíz.
+    """
+
+    def __init__(self, root, paths):
+        self.root = os.path.abspath(root)
+        self.models = {}
+        self.catalogs = {}
+        self.property_files = {}
+        for path in paths:
+            if path not in self.models:
+                self.models[path] = GradleModel.load(path)
+        for model in list(self.models.values()):
+            self.resolve(model)
+
+    @classmethod
+    def from_settings(cls, root):
+        """Índice de un proyecto a partir de su raíz: settings, build raíz y builds de los módulos incluidos"""
+        paths = [os.path.join(root, name) for name in GRADLE_SETTINGS_FILES + GRADLE_BUILD_FILES
+                 if os.path.isfile(os.path.join(root, name))]
+        index = cls(root, paths)
+        for settings in index.settings_models():
+            for module_dir in index.module_directories(settings):
+                for name in GRADLE_BUILD_FILES:
+                    index.get(os.path.join(module_dir, name))
+        return index
+
+    def __iter__(self):
+        return iter(self.models.values())
+
+    def __len__(self):
+        return len(self.models)
+
+    def get(self, path):
+        model = self.models.get(path)
+        if model is None:
+            if not os.path.isfile(path):
+                return None
+            model = self.models[path] = GradleModel.load(path)
+            self.resolve(model)
+        return model
+
+    def build_models(self):
+        return [model for model in self.models.values() if not model.is_settings]
+
+    def settings_models(self):
+        return [model for model in self.models.values() if model.is_settings]
+
+    def module_directories(self, settings):
+        """Directorios de los módulos incluidos en un settings.gradle (':libs:core' -> libs/core)"""
+        base = os.path.dirname(settings.path)
+        return [os.path.join(base, *module.strip(':').split(':')) for module in settings.modules if module.strip(':')]
+
+    def _ancestors(self, path):
+        """Directorios desde la raíz del proyecto hasta el del script (la raíz primero)"""
+        directory = os.path.dirname(os.path.abspath(path))
+        chain = [directory]
+        while directory != self.root and directory.startswith(self.root + os.sep):
+            directory = os.path.dirname(directory)
+            chain.append(directory)
+        return list(reversed(chain))
+
+    def _project_name(self, path):
+        directory = os.path.dirname(os.path.abspath(path))
+        for name in GRADLE_SETTINGS_FILES:
+            settings = self.models.get(os.path.join(directory, name))
+            if settings is not None and settings.name:
+                return settings.name
+        return os.path.basename(directory)
+
+    def _catalog(self, directories):
+        for directory in reversed(directories):
+            path = os.path.join(directory, VERSION_CATALOG)
+            if path not in self.catalogs:
+                self.catalogs[path] = VersionCatalog.load(path) if os.path.isfile(path) else None
+            if self.catalogs[path] is not None:
+                return self.catalogs[path]
+        return None
+
+    def resolve(self, model):
+        if model.resolved or model.error is not None:
+            return model
+        model.resolved = True
+        directories = self._ancestors(model.path)
+        inherited = {}
+        group_id = None
+        version = None
+        for directory in directories:
+            properties_path = os.path.join(directory, 'gradle.properties')
+            if properties_path not in self.property_files:
+                self.property_files[properties_path] = read_gradle_properties(properties_path)
+            inherited.update(self.property_files[properties_path])
+            if directory != directories[-1]:
+                for name in GRADLE_BUILD_FILES:
+                    parent = self.models.get(os.path.join(directory, name))
+                    if parent is not None and parent is not model and parent.error is None:
+                        inherited.update(parent.properties)
+                        # El group y la version de allprojects/subprojects del padre se aplican a los módulos
+                        group_id = parent.group_id or group_id
+                        version = parent.version or version
+        model.properties = {**inherited, **model.properties}
+        if not model.is_settings:
+            model.name = self._project_name(model.path)
+        model.group_id = model.interpolate(model.group_id or group_id or model.properties.get('group'))
+        model.version = model.interpolate(model.version or version or model.properties.get('version'))
+        model.catalog = self._catalog(directories)
+
+        dependencies = []
+        for dependency in model.dependencies:
+            dependencies.extend(self._resolve_dependency(model, dependency))
+        model.dependencies = dependencies
+        for plugin in model.plugins:
+            if plugin.alias is not None and model.catalog is not None:
+                plugin_id, version = model.catalog.plugins.get(catalog_alias(plugin.alias), (None, None))
+                plugin.plugin_id = plugin.plugin_id or plugin_id
+                plugin.version = plugin.version or version
+            plugin.version = model.interpolate(plugin.version)
+        return model
+
+    def _resolve_dependency(self, model, dependency):
+        catalog = model.catalog
+        if dependency.alias is not None:
+            if catalog is None:
+                return [dependency]
+            alias = catalog_alias(dependency.alias)
+            if alias.startswith('bundles.'):
+                members = catalog.bundles.get(alias[len('bundles.'):])
+                if members is None:
+                    return [dependency]
+                return [self._from_catalog(dependency.configuration, member, catalog) for member in members]
+            if alias in catalog.libraries:
+                return [self._from_catalog(dependency.configuration, alias, catalog)]
+            return [dependency]
+        if dependency.notation is not None:
+            parts = model.interpolate(dependency.notation).split('@', 1)[0].split(':')
+            dependency.group_id = parts[0] or None
+            dependency.artifact_id = parts[1] if len(parts) > 1 else None
+            dependency.version = parts[2] if len(parts) > 2 else None
+        else:
+            dependency.group_id = model.interpolate(dependency.group_id)
+            dependency.artifact_id = model.interpolate(dependency.artifact_id)
+            dependency.version = model.interpolate(dependency.version)
+        return [dependency]
+
+    def _from_catalog(self, configuration, alias, catalog):
+        group_id, artifact_id, version = catalog.libraries.get(alias, (None, None, None))
+        return GradleDependency(configuration, group_id=group_id, artifact_id=artifact_id, version=version,
+                                alias=alias)
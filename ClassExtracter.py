@@ -3,6 +3,11 @@ import re
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import shutil
+import queue
+import threading
+import Scanutils
+import Javalexer
+import Writeutils
 
 class JavaClassExporter:
     def __init__(self, root):
@@ -15,6 +20,10 @@ class JavaClassExporter:
         self.java_files = []  # Almacenará tuplas (path, name, type)
         self.all_java_files_cache = {}  # Cache para búsqueda rápida de archivos por nombre
         
+        # Export runs in a background thread that posts events; the window drains them with after()
+        self.events = queue.Queue()
+        self.exporting = False
+        
         # Create UI
         self.create_widgets()
         
@@ -98,13 +107,16 @@ class JavaClassExporter:
         if not project_dir:
             messagebox.showwarning("Warning", "Please select a project directory first.")
             return
+        if self.exporting:
+            messagebox.showwarning("Warning", "Please wait until the export finishes.")
+            return
             
         self.java_files = []
         self.all_java_files_cache = {}
         self.tree.delete(*self.tree.get_children())
         
         try:
-            for root_dir, _, files in os.walk(project_dir):
+            for root_dir, _, files in Scanutils.walk(project_dir):
                 for file in files:
                     if file.endswith('.java'):
                         full_path = os.path.join(root_dir, file)
@@ -113,12 +125,13 @@ class JavaClassExporter:
                         with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
                             content = f.read()
                             
-                        # Check if it's a class or interface
-                        is_interface = 'interface ' in content.split('{')[0]
-                        class_match = re.search(r'(class|interface|enum)\s+(\w+)', content)
-                        if class_match:
-                            name = class_match.group(2)
-                            file_type = "Interface" if is_interface else "Class"
+                        tokens = Javalexer.tokenize(content)
+                        
+                        # Check if it's a class or interface (first top-level type; comments and strings are skipped)
+                        declaration = next((d for d in Javalexer.type_declarations(tokens) if d.parent is None), None)
+                        if declaration:
+                            name = declaration.name
+                            file_type = "Interface" if declaration.kind in ('interface', '@interface') else "Class"
                             
                             # Store file info
                             self.java_files.append((full_path, name, file_type))
@@ -142,6 +155,8 @@ class JavaClassExporter:
             self.tree.set(item, "select", "◻")
             
     def export_selected(self):
+        if self.exporting:
+            return
         selected_items = []
         for item in self.tree.get_children():
             if self.tree.set(item, "select") == "☑":
@@ -156,20 +171,50 @@ class JavaClassExporter:
         if not output_dir:
             return
             
+        # Tree values are read here: the export thread does not touch the UI
+        files_to_export = [self.tree.item(item)['values'][3] for item in selected_items]  # Full path is in column 4
+        
+        self.exporting = True
+        self.status_var.set("Exporting...")
+        thread = threading.Thread(target=self.export_worker, args=(files_to_export, output_dir))
+        thread.daemon = True
+        thread.start()
+        self.root.after(100, self.process_events)
+    
+    def export_worker(self, files_to_export, output_dir):
+        # Producer: reads and queues the files for the writer pool; only posts events
         exported_files = set()
         try:
-            for item in selected_items:
-                values = self.tree.item(item)['values']
-                file_path = values[3]  # Full path is in column 4
-                self.export_java_file(file_path, output_dir, exported_files)
-                
-            messagebox.showinfo("Success", f"Exported {len(exported_files)} files to {output_dir}")
-            self.status_var.set(f"Exported {len(exported_files)} files")
-            
+            with Writeutils.BulkWriter(progress=lambda done, total: self.events.put(("progress", done, total))) as writer:
+                for file_path in files_to_export:
+                    self.export_java_file(file_path, output_dir, exported_files, writer)
+            self.events.put(("done", output_dir, len(exported_files), writer.stats()))
         except Exception as e:
-            messagebox.showerror("Error", f"Error during export: {str(e)}")
+            self.events.put(("error", str(e)))
+    
+    def process_events(self):
+        # Consumer: drains the queue on the Tk thread and reschedules itself while the export runs
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "progress":
+                self.status_var.set(f"Written {event[1]}/{event[2]} files")
+            elif kind == "done":
+                self.exporting = False
+                output_dir, count, stats = event[1:]
+                self.status_var.set(f"Exported {count} files: {Writeutils.describe_stats(stats)}")
+                messagebox.showinfo("Success", f"Exported {count} files to {output_dir}")
+            elif kind == "error":
+                self.exporting = False
+                self.status_var.set("Export failed")
+                messagebox.showerror("Error", f"Error during export: {event[1]}")
+        if self.exporting:
+            self.root.after(100, self.process_events)
         
-    def export_java_file(self, file_path, output_dir, exported_files, depth=0):
+    def export_java_file(self, file_path, output_dir, exported_files, writer, depth=0):
         """Recursively export Java file and its dependencies"""
         if depth > 10:  # Prevent infinite recursion
             return
@@ -188,10 +233,8 @@ class JavaClassExporter:
             # Remove import statements (optional, depending on requirements)
             # new_content = re.sub(r'^import\s+[^;]+;', '', new_content, flags=re.MULTILINE)
             
-            # Write new file
-            output_path = os.path.join(output_dir, filename)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # Queue the new file for the writer pool
+            writer.write(os.path.join(output_dir, filename), new_content)
                 
             exported_files.add(filename)
             
@@ -209,7 +252,7 @@ class JavaClassExporter:
                 # Look for the imported class in our cache
                 if class_name in self.all_java_files_cache:
                     imported_file_path = self.all_java_files_cache[class_name]
-                    self.export_java_file(imported_file_path, output_dir, exported_files, depth + 1)
+                    self.export_java_file(imported_file_path, output_dir, exported_files, writer, depth + 1)
                         
         except Exception as e:
             raise Exception(f"Error processing file {file_path}: {str(e)}")
@@ -1,10 +1,14 @@
 import os
-import shutil
+import threading
 import tkinter as tk
 from tkinter import filedialog, ttk
+import Writeutils
 
 # --- Lógica principal del script ---
 
+# Hilo de la clonación en curso (la copia no se hace en el hilo de la interfaz)
+clone_thread = None
+
 def populate_tree(tree, node, parent=""):
     """
     Función recursiva para llenar el Treeview con la estructura de directorios y archivos.
@@ -54,6 +58,8 @@ def clone_structure():
     """
     Función principal que realiza la clonación de los elementos seleccionados.
     """
+    global clone_thread
+
     # Obtenemos la ruta de destino
     dest_dir = dest_dir_var.get()
     if not dest_dir:
@@ -76,25 +82,40 @@ def clone_structure():
         path = tree.item(item_id, 'values')[0]
         paths_to_copy.add(path)
 
+    if clone_thread is not None and clone_thread.is_alive():
+        print("Advertencia: Ya hay una clonación en curso.")
+        return
+
     print("Iniciando la clonación...")
 
-    for path in sorted(list(paths_to_copy)): # Ordenamos para asegurar que los directorios padres se creen primero
-        # Calculamos la ruta relativa al origen para construir el destino correctamente
-        relative_path = os.path.relpath(path, source_dir)
-        destination_path = os.path.join(dest_dir, relative_path)
-
-        # Si es un directorio, creamos el directorio de destino
-        if os.path.isdir(path):
-            os.makedirs(destination_path, exist_ok=True)
-            print(f"Directorio creado: {destination_path}")
-        # Si es un archivo, lo copiamos
-        elif os.path.isfile(path):
-            # Nos aseguramos de que el directorio del archivo exista en el destino
-            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
-            shutil.copy2(path, destination_path)
-            print(f"Archivo copiado: {destination_path}")
-
-    print("¡Clonación completada con éxito!")
+    # La copia corre en un hilo aparte para no congelar la ventana; el hilo no toca la interfaz
+    clone_thread = threading.Thread(target=copy_paths, args=(sorted(paths_to_copy), source_dir, dest_dir), daemon=True)
+    clone_thread.start()
+
+
+def copy_paths(paths, source_dir, dest_dir):
+    """
+    Crea los directorios y copia los archivos seleccionados en un pool de hilos (Writeutils.BulkWriter).
+    """
+    try:
+        with Writeutils.BulkWriter() as writer:
+            for path in paths: # Ordenadas para asegurar que los directorios padres se creen primero
+                # Calculamos la ruta relativa al origen para construir el destino correctamente
+                relative_path = os.path.relpath(path, source_dir)
+                destination_path = os.path.join(dest_dir, relative_path)
+
+                # Si es un directorio, creamos el directorio de destino
+                if os.path.isdir(path):
+                    writer.make_dirs(destination_path)
+                    print(f"Directorio creado: {destination_path}")
+                # Si es un archivo, lo copiamos (el escritor crea su directorio si hace falta)
+                elif os.path.isfile(path):
+                    writer.copy(path, destination_path)
+    except Exception as e:
+        print(f"Error durante la clonación: {str(e)}")
+        return
+
+    print(f"¡Clonación completada con éxito! {Writeutils.describe_stats(writer.stats())}")
 
 
 def select_source_directory():
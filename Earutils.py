@@ -1,9 +1,9 @@
 import os
 import zipfile
-import re
 import subprocess
 from pathlib import Path
 from typing import List, Dict, Optional
+import Javalexer
 
 class EARAnalyzer:
     def __init__(self, ear_path: str, output_dir: str = "output"):
@@ -100,25 +100,24 @@ class EARAnalyzer:
                 }
 
     def extract_class_name(self, content: str) -> Optional[str]:
-        """Extrae el nombre de la clase del contenido Java"""
-        match = re.search(r'class\s+([^\s{]+)', content)
-        return match.group(1) if match else None
+        """Extrae el nombre de la clase principal del contenido Java"""
+        declaration = Javalexer.primary_type(Javalexer.tokenize(content))
+        return declaration.name if declaration else None
 
     def extract_methods(self, content: str) -> List[Dict]:
-        """Extrae información de métodos de una clase Java"""
+        """Extrae información de los métodos públicos de una clase Java"""
         methods = []
-        # Expresión regular para capturar métodos públicos (simplificado)
-        pattern = re.compile(r'public\s+([^\s(]+)\s+([^\s(]+)\s*\(([^)]*)\)\s*[^{]*\{')
-        
-        for match in pattern.finditer(content):
-            return_type = match.group(1)
-            method_name = match.group(2)
-            params = match.group(3)
-            methods.append({
-                'name': method_name,
-                'return_type': return_type,
-                'parameters': params
-            })
+        tokens = Javalexer.tokenize(content)
+        
+        for declaration in Javalexer.type_declarations(tokens):
+            for method in Javalexer.method_declarations(tokens, declaration):
+                if 'public' not in method.modifiers or method.is_constructor:
+                    continue
+                methods.append({
+                    'name': method.name,
+                    'return_type': method.return_type(tokens),
+                    'parameters': method.params_text(tokens)
+                })
         
         return methods
 
@@ -152,14 +151,17 @@ class EARAnalyzer:
                         self.flows.append(flow)
 
     def get_method_content(self, file_path: str, method_name: str) -> Optional[str]:
-        """Obtiene el contenido de un método específico (implementación simplificada)"""
+        """Obtiene el contenido de un método específico"""
         try:
             with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
-                # Buscar el método por su firma (simplificado)
-                pattern = re.compile(rf'public\s+[^\s]+\s+{method_name}\s*\([^)]*\)\s*{{([^}}]+)}}')
-                match = pattern.search(content)
-                return match.group(1) if match else None
+                # Cuerpo completo (llaves anidadas incluidas) del primer método público con ese nombre
+                tokens = Javalexer.tokenize(content)
+                for declaration in Javalexer.type_declarations(tokens):
+                    for method in Javalexer.method_declarations(tokens, declaration):
+                        if method.name == method_name and 'public' in method.modifiers and method.body_open is not None:
+                            return method.body_text(tokens)
+                return None
         except Exception as e:
             print(f"Error al leer {file_path}: {e}")
             return None
@@ -3,6 +3,8 @@ import re
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import shutil
+import Scanutils
+import Javalexer
 
 class JavaClassExporter:
     def __init__(self, root):
@@ -104,7 +106,7 @@ class JavaClassExporter:
         self.tree.delete(*self.tree.get_children())
         
         try:
-            for root_dir, _, files in os.walk(project_dir):
+            for root_dir, _, files in Scanutils.walk(project_dir):
                 for file in files:
                     if file.endswith('.java'):
                         full_path = os.path.join(root_dir, file)
@@ -113,12 +115,13 @@ class JavaClassExporter:
                         with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
                             content = f.read()
                             
-                        # Check if it's a class or interface
-                        is_interface = 'interface ' in content.split('{')[0]
-                        class_match = re.search(r'(class|interface|enum)\s+(\w+)', content)
-                        if class_match:
-                            name = class_match.group(2)
-                            file_type = "Interface" if is_interface else "Class"
+                        tokens = Javalexer.tokenize(content)
+                        
+                        # Check if it's a class or interface (first top-level type; comments and strings are skipped)
+                        declaration = next((d for d in Javalexer.type_declarations(tokens) if d.parent is None), None)
+                        if declaration:
+                            name = declaration.name
+                            file_type = "Interface" if declaration.kind in ('interface', '@interface') else "Class"
                             
                             # Store file info
                             self.java_files.append((full_path, name, file_type))
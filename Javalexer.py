@@ -0,0 +1,537 @@
+import re
+from array import array
+from bisect import bisect_left
+
+# Tipos de token (un byte por token en JavaTokens.kinds). Cada tipo es también el número del
+# grupo de TOKEN_PATTERN que lo reconoce, así match.lastindex da el tipo sin más trabajo.
+KEYWORD = 2        # Palabra reservada de Java
+IDENT = 3          # Identificador (incluye los contextuales: record, var, sealed, permits...)
+LPAREN = 4
+RPAREN = 5
+LBRACE = 6
+RBRACE = 7
+SEMI = 8
+DOT = 9
+COMMA = 10
+LT = 11
+GT = 12
+LBRACKET = 13
+RBRACKET = 14
+AT = 15
+STRING = 16        # "..." (sin terminar: hasta el fin de línea)
+NUMBER = 17
+CHAR = 18          # 'x'
+TEXT_BLOCK = 19    # """..."""
+OPERATOR = 20      # Resto de operadores: =, ->, ::, ..., +, ?, etc.
+
+KEYWORDS = frozenset((
+    'abstract', 'assert', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'class', 'const', 'continue',
+    'default', 'do', 'double', 'else', 'enum', 'extends', 'final', 'finally', 'float', 'for', 'goto', 'if',
+    'implements', 'import', 'instanceof', 'int', 'interface', 'long', 'native', 'new', 'package', 'private',
+    'protected', 'public', 'return', 'short', 'static', 'strictfp', 'super', 'switch', 'synchronized', 'this',
+    'throw', 'throws', 'transient', 'try', 'void', 'volatile', 'while', 'true', 'false', 'null',
+))
+
+# Palabras reservadas que pueden ser un tipo de retorno
+PRIMITIVE_TYPES = frozenset(('boolean', 'byte', 'char', 'short', 'int', 'long', 'float', 'double', 'void'))
+
+MODIFIERS = frozenset(('public', 'protected', 'private', 'static', 'final', 'abstract', 'native', 'synchronized',
+                       'transient', 'volatile', 'strictfp', 'default', 'sealed'))
+
+# Aperturas y su cierre (el cierre es siempre apertura + 1)
+OPENING = frozenset((LPAREN, LBRACE, LBRACKET))
+
+# El grupo 1 consume espacios y comentarios antes de cada token; el resto reconoce un token.
+# Ninguna alternativa anida cuantificadores ambiguos y los posesivos impiden volver atrás:
+# el recorrido es lineal. La alternativa vacía final (\Z) evita reintentar el espacio final.
+TOKEN_PATTERN = re.compile(
+    r'(\s*+(?:(?://[^\n]*|/\*[\s\S]*?(?:\*/|\Z))\s*+)*+)(?:'
+    r'((?:' + '|'.join(sorted(KEYWORDS, key=len, reverse=True)) + r')(?![\w$]))'
+    r'|([^\W\d][\w$]*|\$[\w$]*)'
+    r'|(\()|(\))|(\{)|(\})|(;)|(\.(?!\.\.))|(,)|(<)|(>)|(\[)|(\])|(@)'
+    r'|("(?!"")(?:[^"\\\n]|\\.)*+"?)'
+    r'|(\.?\d[\w.]*)'
+    r"|('(?:[^'\\\n]|\\.)*+'?)"
+    r'|("""(?:[^"\\]|\\[\s\S]|"(?!""))*+(?:"""|\Z))'
+    r'|(->|::|\.\.\.|[^\s\w])'
+    r'|\Z)'
+)
+
+# Posiciones de aperturas y cierres dentro de JavaTokens.kinds
+BRACKET_KINDS = re.compile(rb'[\x04-\x07\x0d\x0e]')
+
+# Palabras que introducen un tipo; se comprueba después que sean un token (no texto de un comentario)
+TYPE_WORD = re.compile(r'\b(?:class|interface|enum|record)\b')
+
+
+class JavaTokens:
+    """Tokens de un archivo Java en arreglos compactos paralelos.
+
+    kinds[i] es el tipo, source[starts[i]:ends[i]] el texto y pairs[i] el índice del
+    paréntesis, llave o corchete que cierra (o abre) el token i, -1 si no tiene pareja.
+    Los comentarios no se guardan.
+    """
+    __slots__ = ('source', 'kinds', 'starts', 'ends', 'pairs')
+
+    def __init__(self, source, kinds, starts, ends, pairs):
+        self.source = source
+        self.kinds = kinds
+        self.starts = starts
+        self.ends = ends
+        self.pairs = pairs
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def text(self, index):
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def find(self, kind, start, end=None):
+        """Índice del primer token de ese tipo en [start, end), o -1"""
+        return self.kinds.find(kind, start, len(self.kinds) if end is None else end)
+
+    def index_at(self, offset):
+        """Índice del token que empieza exactamente en esa posición del texto, o -1"""
+        index = bisect_left(self.starts, offset)
+        if index < len(self.starts) and self.starts[index] == offset:
+            return index
+        return -1
+
+
+def tokenize(source):
+    """Una sola pasada sobre el texto: tokens y tabla de parejas de llaves/paréntesis/corchetes"""
+    found = [(match.lastindex, match.end(1), match.end()) for match in TOKEN_PATTERN.finditer(source)]
+    while found and found[-1][0] == 1:
+        found.pop()                       # Coincidencia vacía del final (\Z)
+    if not found:
+        return JavaTokens(source, bytearray(), array('i'), array('i'), array('i'))
+    kinds, starts, ends = zip(*found)
+    kinds = bytearray(kinds)
+    pairs = array('i', [-1]) * len(kinds)
+
+    # Solo se recorren las aperturas y cierres; un cierre sin apertura del mismo tipo
+    # (código incompleto) se queda sin pareja
+    stack = []
+    for match in BRACKET_KINDS.finditer(kinds):
+        index = match.start()
+        kind = kinds[index]
+        if kind in OPENING:
+            stack.append(index)
+        elif stack and kinds[stack[-1]] == kind - 1:
+            opening = stack.pop()
+            pairs[opening] = index
+            pairs[index] = opening
+    return JavaTokens(source, kinds, array('i', starts), array('i', ends), pairs)
+
+
+class TypeDeclaration:
+    """class/interface/enum/record/@interface: nombre y llaves de su cuerpo (índices de token)"""
+    __slots__ = ('kind', 'name', 'index', 'body_open', 'body_close', 'parent')
+
+    def __init__(self, kind, name, index, body_open, body_close, parent):
+        self.kind = kind
+        self.name = name
+        self.index = index                # Token del nombre
+        self.body_open = body_open
+        self.body_close = body_close
+        self.parent = parent              # Tipo que lo contiene (None si es de primer nivel)
+
+
+class MethodDeclaration:
+    """Método o constructor declarado directamente en un tipo (índices de token)"""
+    __slots__ = ('name', 'owner', 'start', 'name_index', 'type_start', 'params_open', 'params_close',
+                 'body_open', 'body_close', 'end', 'modifiers', 'is_constructor')
+
+    def __init__(self, name, owner, start, name_index, type_start, params_open, params_close,
+                 body_open, body_close, end, modifiers, is_constructor):
+        self.name = name
+        self.owner = owner                # TypeDeclaration que lo declara
+        self.start = start                # Primer token (anotaciones y modificadores incluidos)
+        self.name_index = name_index
+        self.type_start = type_start      # Primer token del tipo de retorno (== name_index en constructores)
+        self.params_open = params_open
+        self.params_close = params_close
+        self.body_open = body_open        # None si no tiene cuerpo (abstracto, interfaz, nativo)
+        self.body_close = body_close
+        self.end = end                    # Último token: '}' del cuerpo o ';'
+        self.modifiers = modifiers
+        self.is_constructor = is_constructor
+
+    def char_span(self, tokens):
+        """(inicio, fin) en caracteres de la declaración completa, anotaciones incluidas"""
+        return tokens.starts[self.start], tokens.ends[self.end]
+
+    def body_text(self, tokens):
+        """Texto entre las llaves del cuerpo (None si es abstracto)"""
+        if self.body_open is None:
+            return None
+        return tokens.source[tokens.ends[self.body_open]:tokens.starts[self.body_close]]
+
+    def params_text(self, tokens):
+        return tokens.source[tokens.ends[self.params_open]:tokens.starts[self.params_close]]
+
+    def return_type(self, tokens):
+        if self.is_constructor:
+            return None
+        return tokens.source[tokens.starts[self.type_start]:tokens.ends[self.name_index - 1]]
+
+
+def package_name(tokens):
+    """Paquete declarado ('' si no hay declaración package)"""
+    kinds = tokens.kinds
+    for index in range(len(kinds)):
+        if kinds[index] == KEYWORD and tokens.text(index) == 'package':
+            end = tokens.find(SEMI, index)
+            if end == -1:
+                return ''
+            # Los comentarios y saltos de línea entre las partes del nombre no son tokens
+            return ''.join(tokens.text(i) for i in range(index + 1, end) if kinds[i] in (IDENT, DOT))
+        if kinds[index] not in (AT, IDENT, LPAREN, RPAREN, DOT, STRING, COMMA, OPERATOR):
+            # Solo pueden preceder a package las anotaciones del paquete
+            return ''
+    return ''
+
+
+def type_declarations(tokens):
+    """Todos los tipos declarados, anidados incluidos, en orden de aparición"""
+    kinds = tokens.kinds
+    pairs = tokens.pairs
+    declarations = []
+    enclosing = []                        # Tipos abiertos en este punto (para asignar parent)
+    count = len(kinds)
+    for match in TYPE_WORD.finditer(tokens.source):
+        index = tokens.index_at(match.start())
+        if index == -1 or index + 1 >= count or kinds[index + 1] != IDENT:
+            continue                      # Dentro de un comentario o cadena, o sin nombre detrás
+        if index > 0 and kinds[index - 1] == DOT:
+            continue                      # Foo.class
+        word = match.group()
+        body_open = index + 2
+        while body_open < count and kinds[body_open] not in (LBRACE, SEMI):
+            if kinds[body_open] == LPAREN and pairs[body_open] != -1:
+                body_open = pairs[body_open]     # Cabecera de un record
+            body_open += 1
+        if body_open >= count or kinds[body_open] != LBRACE:
+            continue
+        while enclosing and enclosing[-1].body_close < index:
+            enclosing.pop()
+        if index > 0 and kinds[index - 1] == AT:
+            word = '@interface'
+        body_close = pairs[body_open] if pairs[body_open] != -1 else count - 1
+        declaration = TypeDeclaration(word, tokens.text(index + 1), index + 1, body_open, body_close,
+                                      enclosing[-1] if enclosing else None)
+        declarations.append(declaration)
+        enclosing.append(declaration)
+    return declarations
+
+
+def primary_type(tokens, declarations=None):
+    """Tipo principal del archivo: la primera clase de primer nivel, o el primer tipo declarado"""
+    declarations = type_declarations(tokens) if declarations is None else declarations
+    for declaration in declarations:
+        if declaration.parent is None and declaration.kind == 'class':
+            return declaration
+    return declarations[0] if declarations else None
+
+
+def method_declarations(tokens, declaration):
+    """Métodos y constructores declarados directamente en el cuerpo de un tipo"""
+    kinds = tokens.kinds
+    pairs = tokens.pairs
+    methods = []
+    index = declaration.body_open + 1
+    end = declaration.body_close
+    member_start = index
+    in_constants = declaration.kind == 'enum'   # Lista de constantes al principio de un enum
+    while index < end:
+        kind = kinds[index]
+        if kind == LPAREN and pairs[index] != -1:
+            name_index = index - 1
+            if not in_constants and name_index >= member_start and kinds[name_index] == IDENT:
+                type_start, modifiers = _member_prefix(tokens, member_start, name_index)
+            else:
+                type_start = None
+            if type_start is not None and _is_nested_record(tokens, name_index, pairs[index], end):
+                # record P(int a) { ... } / record P(int a) implements X { ... }: tipo anidado, no método
+                body_open = pairs[index] + 1
+                while body_open < end and kinds[body_open] not in (LBRACE, SEMI):
+                    body_open += 1
+                index = (pairs[body_open] if body_open < end and kinds[body_open] == LBRACE and pairs[body_open] != -1
+                         else body_open) + 1
+                member_start = index
+                continue
+            if type_start is not None and _is_declaration(tokens, declaration, type_start, name_index):
+                params_close = pairs[index]
+                after = params_close + 1
+                while after < end and kinds[after] not in (LBRACE, SEMI):
+                    after += 1            # throws ..., default ... en anotaciones
+                body_open = after if after < end and kinds[after] == LBRACE else None
+                body_close = pairs[after] if body_open is not None else None
+                if body_open is not None and body_close == -1:
+                    body_close = end - 1
+                methods.append(MethodDeclaration(
+                    tokens.text(name_index), declaration, member_start, name_index, type_start, index, params_close,
+                    body_open, body_close, body_close if body_open is not None else min(after, end - 1), modifiers,
+                    type_start == name_index))
+                index = (body_close if body_open is not None else after) + 1
+                member_start = index
+                continue
+            index = pairs[index] + 1
+            continue
+        if kind == LBRACE:
+            # Inicializador, cuerpo de un tipo anidado o de una constante de enum
+            index = (pairs[index] if pairs[index] != -1 else end) + 1
+            member_start = index
+            continue
+        if kind == SEMI:
+            in_constants = False
+            member_start = index + 1
+        elif kind == COMMA and in_constants:
+            member_start = index + 1
+        index += 1
+    return methods
+
+
+def _is_nested_record(tokens, name_index, params_close, end):
+    """¿record Nombre(...) seguido de '{' o implements? (record es contextual: llega como IDENT)"""
+    kinds = tokens.kinds
+    previous = name_index - 1
+    if kinds[previous] != IDENT or tokens.text(previous) != 'record':
+        return False
+    after = params_close + 1
+    return after < end and (kinds[after] == LBRACE or tokens.text(after) == 'implements')
+
+
+def _is_declaration(tokens, declaration, type_start, name_index):
+    """¿El identificador seguido de '(' es el nombre de un método o constructor declarado?"""
+    kinds = tokens.kinds
+    if name_index == type_start:
+        return tokens.text(name_index) == declaration.name     # Constructor
+    previous = name_index - 1
+    kind = kinds[previous]
+    if kind == AT or kind == DOT:
+        return False                      # @Anotacion( o llamada calificada
+    if kind == KEYWORD:
+        word = tokens.text(previous)
+        return word in PRIMITIVE_TYPES or word in MODIFIERS
+    if kind == IDENT or kind == GT or kind == RBRACKET:
+        # Entre el tipo y el nombre no puede haber '=' ni 'new' (inicializador de un campo)
+        for index in range(type_start, name_index):
+            if (kinds[index] == OPERATOR or kinds[index] == KEYWORD) and tokens.text(index) in ('=', 'new'):
+                return False
+        return True
+    return False
+
+
+def _member_prefix(tokens, member_start, name_index):
+    """(primer token del tipo de retorno, modificadores) saltando anotaciones y modificadores"""
+    kinds = tokens.kinds
+    modifiers = []
+    index = member_start
+    while index < name_index:
+        kind = kinds[index]
+        if kind == AT and index + 1 < name_index and kinds[index + 1] == IDENT:
+            index += 2
+            while index < name_index and kinds[index] == DOT:
+                index += 2                # @org.example.Anotacion
+            if index < name_index and kinds[index] == LPAREN and tokens.pairs[index] != -1:
+                index = tokens.pairs[index] + 1
+            continue
+        if kind == KEYWORD or kind == IDENT:
+            word = tokens.text(index)
+            if word in MODIFIERS:
+                modifiers.append(word)
+                index += 1
+                continue
+        break
+    return index, tuple(modifiers)
+
+
+def type_name_before(tokens, index):
+    """Nombre simple del tipo que termina justo antes del token index, o None.
+
+    'List' en List<User> users, 'User' en User[] users o User... users, 'Entry' en
+    Map.Entry<K, V> entry, 'int' en int count.
+    """
+    kinds = tokens.kinds
+    position = index - 1
+    while position > 0 and (kinds[position] == RBRACKET and tokens.pairs[position] == position - 1
+                            or kinds[position] == OPERATOR and tokens.text(position) == '...'):
+        position -= 2 if kinds[position] == RBRACKET else 1        # Tipo[] o Tipo...
+    if position >= 0 and kinds[position] == GT:
+        # Argumentos genéricos: hasta el '<' que los abre (sin pareja en la tabla: '<' también es un operador)
+        depth = 0
+        while position >= 0:
+            kind = kinds[position]
+            if kind == GT:
+                depth += 1
+            elif kind == LT:
+                depth -= 1
+                if depth == 0:
+                    break
+            elif not (kind in (IDENT, DOT, COMMA, LBRACKET, RBRACKET, AT)
+                      or (kind == OPERATOR and tokens.text(position) == '?')
+                      or (kind == KEYWORD and tokens.text(position) in ('extends', 'super'))
+                      or (kind == KEYWORD and tokens.text(position) in PRIMITIVE_TYPES)):
+                return None               # Una comparación, no un tipo
+            position -= 1
+        position -= 1
+    if position < 0:
+        return None
+    if kinds[position] == IDENT or (kinds[position] == KEYWORD and tokens.text(position) in PRIMITIVE_TYPES):
+        return tokens.text(position)
+    return None
+
+
+def parameters(tokens, method):
+    """Parámetros de una declaración de método: [(tipo simple, nombre)]"""
+    kinds = tokens.kinds
+    found = []
+    index = method.params_open + 1
+    while index < method.params_close:
+        if kinds[index] == LPAREN and tokens.pairs[index] != -1:
+            index = tokens.pairs[index] + 1           # Argumentos de una anotación
+            continue
+        if kinds[index] == IDENT and (kinds[index + 1] == COMMA or index + 1 == method.params_close):
+            type_name = type_name_before(tokens, index)
+            if type_name:
+                found.append((type_name, tokens.text(index)))
+        index += 1
+    return found
+
+
+# Token que puede seguir al nombre en la declaración de una variable: Tipo x = , Tipo x; ,
+# for (Tipo x : ...), catch (Tipo x), try (Tipo x = ...)
+DECLARATION_FOLLOWERS = frozenset((SEMI, COMMA, RPAREN, OPERATOR))
+
+
+def variable_declarations(tokens, start, end):
+    """Variables declaradas en los tokens [start, end): [(tipo simple, nombre, índice del nombre)]"""
+    kinds = tokens.kinds
+    found = []
+    for index in range(max(start, 1), min(end, len(kinds) - 1)):
+        if kinds[index] != IDENT or kinds[index + 1] not in DECLARATION_FOLLOWERS:
+            continue
+        if kinds[index + 1] == OPERATOR and tokens.text(index + 1) not in ('=', ':'):
+            continue
+        previous = kinds[index - 1]
+        if previous != IDENT and previous != GT and previous != RBRACKET and previous != KEYWORD:
+            continue
+        type_name = type_name_before(tokens, index)
+        if type_name == 'var':
+            type_name = _inferred_type(tokens, index + 1)
+        if type_name:
+            found.append((type_name, tokens.text(index), index))
+    return found
+
+
+def _inferred_type(tokens, index):
+    # var x = new Tipo(...) -> Tipo (cualquier otro inicializador no se infiere)
+    kinds = tokens.kinds
+    if (index + 2 < len(kinds) and tokens.text(index) == '=' and kinds[index + 1] == KEYWORD
+            and tokens.text(index + 1) == 'new' and kinds[index + 2] == IDENT):
+        index += 2
+        while index + 2 < len(kinds) and kinds[index + 1] == DOT and kinds[index + 2] == IDENT:
+            index += 2
+        return tokens.text(index)
+    return None
+
+
+def field_declarations(tokens, declaration):
+    """Campos declarados directamente en un tipo: [(tipo simple, nombre)]"""
+    kinds = tokens.kinds
+    pairs = tokens.pairs
+    found = []
+    index = declaration.body_open + 1
+    end = declaration.body_close
+    while index < end:
+        kind = kinds[index]
+        if (kind == LBRACE or kind == LPAREN) and pairs[index] != -1:
+            index = pairs[index] + 1      # Cuerpos, inicializadores y argumentos
+            continue
+        if kind == IDENT and index + 1 < end:
+            following = kinds[index + 1]
+            if following == SEMI or following == COMMA or (following == OPERATOR and tokens.text(index + 1) == '='):
+                type_name = type_name_before(tokens, index)
+                if type_name == 'var':
+                    type_name = None
+                if type_name:
+                    found.append((type_name, tokens.text(index)))
+        index += 1
+    return found
+
+
+def supertypes(tokens, declaration):
+    """(extends, implements) de un tipo: nombres simples, sin argumentos genéricos"""
+    kinds = tokens.kinds
+    clauses = {'extends': [], 'implements': []}
+    current = None
+    depth = 0
+    index = declaration.index + 1
+    while index < declaration.body_open:
+        kind = kinds[index]
+        if kind == LPAREN and tokens.pairs[index] != -1:
+            index = tokens.pairs[index] + 1       # Cabecera de un record o argumentos de anotación
+            continue
+        if kind == LT:
+            depth += 1
+        elif kind == GT:
+            depth -= 1
+        elif depth == 0 and (kind == KEYWORD or kind == IDENT):
+            word = tokens.text(index)
+            if word in clauses:
+                current = clauses[word]
+            elif word == 'permits':
+                current = None
+            elif (kind == IDENT and current is not None and kinds[index + 1] != DOT
+                  and kinds[index - 1] != AT):
+                current.append(word)
+        index += 1
+    return clauses['extends'], clauses['implements']
+
+
+def calls(tokens, start, end):
+    """Llamadas en los tokens [start, end): (calificador, nombre, índice del nombre).
+
+    Pensado para el cuerpo de un método. El calificador es el identificador antes del '.'
+    ('this', 'super', una variable o una clase), None si la llamada no está calificada y ''
+    si el receptor es una expresión (otra llamada, un índice...). Las instanciaciones
+    'new Tipo(' y las declaraciones ('Tipo nombre(', 'void nombre(') no se incluyen.
+    """
+    kinds = tokens.kinds
+    found = []
+    index = kinds.find(LPAREN, max(start, 1), end)
+    while index != -1:
+        name_index = index - 1
+        index = kinds.find(LPAREN, index + 1, end)
+        if kinds[name_index] != IDENT:
+            continue
+        previous = name_index - 1
+        kind = kinds[previous] if previous >= 0 else SEMI
+        if kind == DOT:
+            receiver = previous - 1
+            if receiver >= 0 and (kinds[receiver] == IDENT or kinds[receiver] == KEYWORD):
+                found.append((tokens.text(receiver), tokens.text(name_index), name_index))
+            else:
+                found.append(('', tokens.text(name_index), name_index))
+        elif kind == KEYWORD:
+            word = tokens.text(previous)
+            if word != 'new' and word not in PRIMITIVE_TYPES and word not in MODIFIERS:
+                found.append((None, tokens.text(name_index), name_index))   # return foo(, else bar(...
+        elif kind != IDENT and kind != RBRACKET and kind != AT:
+            # Tipo nombre( o Tipo[] nombre( solo pueden ser declaraciones; @Anotacion( no es una llamada
+            found.append((None, tokens.text(name_index), name_index))
+    return found
+
+
+def instantiations(tokens, start, end):
+    """Tipos instanciados con 'new' en [start, end), sin paquete: (nombre, índice)"""
+    kinds = tokens.kinds
+    found = []
+    for index in range(start, end - 1):
+        if kinds[index] == KEYWORD and tokens.text(index) == 'new' and kinds[index + 1] == IDENT:
+            last = index + 1
+            while last + 2 < end and kinds[last + 1] == DOT and kinds[last + 2] == IDENT:
+                last += 2
+            found.append((tokens.text(last), last))
+    return found
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
 import os
 import re
+import Scanutils
 
 # --- Validation Logic ---
 
@@ -23,11 +24,9 @@ def check_java_files_for(directory, patterns):
     """Searches all .java files in a directory for the given regex patterns."""
     if not os.path.exists(directory):
         return False
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".java"):
-                if check_file_contains(os.path.join(root, file), patterns):
-                    return True
+    for java_file in Scanutils.iter_files(directory, ".java"):
+        if check_file_contains(java_file, patterns):
+            return True
     return False
 
 def run_okta_validations(project_path):
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import filedialog, scrolledtext
 import os
+import Scanutils
+import Buildmodel
 
 # --- Lógica de Análisis ---
 
@@ -12,29 +14,28 @@ def check_dependencies(project_path):
         "build_file_found": None
     }
     
-    # Buscar pom.xml para Maven
+    # Buscar pom.xml para Maven (incluidos los módulos que declara)
     pom_path = os.path.join(project_path, 'pom.xml')
     if os.path.exists(pom_path):
         results["build_file_found"] = "pom.xml"
-        with open(pom_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if 'spring-boot-starter-oauth2-client' in content:
-                results["client_dependency"] = True
-            if 'spring-boot-starter-oauth2-resource-server' in content:
-                results["resource_server_dependency"] = True
+        poms = Buildmodel.PomIndex([pom_path])
+        models = [poms.get(pom_path)]
+        for model in models:
+            models.extend(module for module in poms.module_models(model) if module not in models)
+        artifacts = {dep.artifact_id for model in models for dep in model.iter_dependencies()}
+        results["client_dependency"] = 'spring-boot-starter-oauth2-client' in artifacts
+        results["resource_server_dependency"] = 'spring-boot-starter-oauth2-resource-server' in artifacts
         return results
 
-    # Buscar build.gradle o build.gradle.kts para Gradle
-    for gradle_file in ['build.gradle', 'build.gradle.kts']:
+    # Buscar build.gradle o build.gradle.kts para Gradle (y los módulos de settings.gradle)
+    for gradle_file in Buildmodel.GRADLE_BUILD_FILES:
         gradle_path = os.path.join(project_path, gradle_file)
         if os.path.exists(gradle_path):
             results["build_file_found"] = gradle_file
-            with open(gradle_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                if 'spring-boot-starter-oauth2-client' in content:
-                    results["client_dependency"] = True
-                if 'spring-boot-starter-oauth2-resource-server' in content:
-                    results["resource_server_dependency"] = True
+            gradle = Buildmodel.GradleIndex.from_settings(project_path)
+            artifacts = {dep.artifact_id for model in gradle.build_models() for dep in model.iter_dependencies()}
+            results["client_dependency"] = 'spring-boot-starter-oauth2-client' in artifacts
+            results["resource_server_dependency"] = 'spring-boot-starter-oauth2-resource-server' in artifacts
             return results
             
     return results
@@ -51,7 +52,7 @@ def check_security_config(project_path):
     if not os.path.exists(src_path):
         return results
 
-    for root, _, files in os.walk(src_path):
+    for root, _, files in Scanutils.walk(src_path):
         for file in files:
             if file.endswith('.java') or file.endswith('.kt'):
                 file_path = os.path.join(root, file)
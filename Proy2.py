@@ -1,8 +1,138 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
+import queue
 import re
+import sys
+import threading
+import time
 from pathlib import Path
+from sys import intern
+import Javalexer
+import Writeutils
+
+# Una sola pasada por el texto: comentarios, text blocks, cadenas y caracteres se consumen enteros
+# para que sus llaves no cuenten; el resto son declaraciones de package, de tipo y llaves
+CLASS_SCAN_PATTERN = re.compile(r'''
+      //[^\n]*+
+    | /\*.*?\*/
+    | """.*?"""
+    | "(?:[^"\\\n]|\\.)*+"
+    | '(?:[^'\\\n]|\\.)*+'
+    | (?<![\w.])package\s++([\w.]+)\s*+;
+    | (?<![\w.$])(class|interface|enum|record)\s++([A-Za-z_$][\w$]*+)
+    | ([{}])
+''', re.DOTALL | re.VERBOSE)
+
+# Referencias para change_package: comentarios, text blocks, cadenas, caracteres e imports/package
+# se copian tal cual; solo se miran los identificadores que no van tras un punto (ya calificados)
+REFERENCE_PATTERN = re.compile(r'''
+      //[^\n]*+
+    | /\*.*?\*/
+    | """.*?"""
+    | "(?:[^"\\\n]|\\.)*+"
+    | '(?:[^'\\\n]|\\.)*+'
+    | (?<![\w.$])(?:import|package)\s[^;]*+;
+    | (?<![\w.$])([A-Za-z_$][\w$]*+)
+''', re.DOTALL | re.VERBOSE)
+
+# Argumento por defecto de cada tipo primitivo para invocar los métodos desde el arnés
+PRIMITIVE_DEFAULTS = {'boolean': 'false', 'char': "'\\0'", 'byte': '(byte) 0', 'short': '(short) 0',
+                      'int': '0', 'long': '0L', 'float': '0f', 'double': '0d'}
+PARAMETER_PATTERN = re.compile(r'^(.*?)\s*\b[A-Za-z_$][\w$]*\s*((?:\[\s*\])*)$', re.DOTALL)
+GENERIC_ARGUMENTS = re.compile(r'<[^<>]*>')
+
+
+def split_parameters(text):
+    """Parámetros de una lista de declaración, separados por las comas fuera de <>"""
+    parameters = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(text):
+        if char == '<':
+            depth += 1
+        elif char == '>':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parameters.append(text[start:index].strip())
+            start = index + 1
+    if text[start:].strip():
+        parameters.append(text[start:].strip())
+    return parameters
+
+
+def parameter_type(parameter):
+    """Tipo de un parámetro sin anotaciones ni argumentos genéricos ('final List<T> x[]' -> 'List[]')"""
+    parameter = re.sub(r'@[\w.]+(?:\([^)]*\))?\s*|\bfinal\s+', '', parameter)
+    match = PARAMETER_PATTERN.match(parameter)
+    type_name = (match.group(1) + match.group(2)) if match else parameter
+    while GENERIC_ARGUMENTS.search(type_name):
+        type_name = GENERIC_ARGUMENTS.sub('', type_name)
+    return re.sub(r'\s+', '', type_name).replace('...', '[]')
+
+
+def default_argument(parameter, cast=False):
+    """Expresión Java con el valor por defecto del tipo de un parámetro ('int x' -> '0').
+    
+    Con cast, null lleva el tipo ('(String) null') para elegir entre sobrecargas de igual aridad.
+    """
+    type_name = parameter_type(parameter)
+    if type_name in PRIMITIVE_DEFAULTS:
+        return PRIMITIVE_DEFAULTS[type_name]
+    return f"({type_name}) null" if cast else "null"
+
+
+def default_arguments(parameters, overloads):
+    # overloads: listas de parámetros de todas las sobrecargas del método o constructor
+    cast = sum(1 for other in overloads if len(other) == len(parameters)) > 1
+    return ", ".join(default_argument(parameter, cast) for parameter in parameters)
+
+
+def iter_class_spans(text):
+    """(package, clase, inicio, fin) de cada tipo de primer nivel del texto, en orden.
+    
+    El inicio es la palabra class/interface/enum/record y el fin, la posición siguiente a su
+    llave de cierre. Los tipos anteriores a la primera declaración de package se ignoran.
+    """
+    package = None
+    depth = 0
+    current = None
+    for match in CLASS_SCAN_PATTERN.finditer(text):
+        brace = match.group(4)
+        if brace == '{':
+            depth += 1
+        elif brace == '}':
+            if depth:
+                depth -= 1
+            if depth == 0 and current is not None:
+                yield package, current[0], current[1], match.end()
+                current = None
+        elif depth == 0:
+            if match.group(1):
+                package = match.group(1)
+            elif match.group(3) and current is None and package is not None:
+                current = (match.group(3), match.start())
+
+class ClassSpan:
+    """Clase del volcado: su package y su posición [start, end) en el texto del proyecto.
+    
+    El texto no se copia; content y full_content se recortan cuando se piden.
+    """
+    __slots__ = ('package', 'source', 'start', 'end')
+    
+    def __init__(self, package, source, start, end):
+        self.package = package
+        self.source = source
+        self.start = start
+        self.end = end
+    
+    @property
+    def content(self):
+        return self.source[self.start:self.end]
+    
+    @property
+    def full_content(self):
+        return f"package {self.package};\n\n{self.content}"
 
 class JavaProjectProcessor:
     def __init__(self):
@@ -10,6 +140,7 @@ class JavaProjectProcessor:
         self.classes = {}
         self.selected_classes = []
         self.common_package = "package"
+        self.write_stats = None
         
     def load_project(self, file_path):
         """Carga el contenido del proyecto desde un archivo"""
@@ -24,34 +155,8 @@ class JavaProjectProcessor:
     def extract_classes(self):
         """Extrae todas las clases del proyecto"""
         self.classes = {}
-        class_pattern = re.compile(r'^\s*package\s+([\w\.]+)\s*;.*?^.*?class\s+(\w+)\s*(?:extends|\{|\w|implements)*\s*\{', 
-                                  re.MULTILINE | re.DOTALL)
-        
-        matches = class_pattern.findall(self.project_content)
-        for package, class_name in matches:
-            # Encontrar el contenido completo de la clase
-            class_start = self.project_content.find(f"class {class_name}")
-            if class_start == -1:
-                continue
-                
-            # Buscar el inicio y fin de la clase
-            brace_count = 0
-            class_end = class_start
-            for i in range(class_start, len(self.project_content)):
-                if self.project_content[i] == '{':
-                    brace_count += 1
-                elif self.project_content[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        class_end = i + 1
-                        break
-            
-            class_content = self.project_content[class_start:class_end]
-            self.classes[class_name] = {
-                'package': package,
-                'content': class_content,
-                'full_content': f"package {package};\n\n{class_content}"
-            }
+        for package, class_name, start, end in iter_class_spans(self.project_content):
+            self.classes[class_name] = ClassSpan(intern(package), self.project_content, start, end)
         
         return list(self.classes.keys())
     
@@ -60,66 +165,175 @@ class JavaProjectProcessor:
         if class_name not in self.classes:
             return None
             
-        class_info = self.classes[class_name]
-        old_package = class_info['package']
-        
-        # Reemplazar el package antiguo por el nuevo
-        new_content = class_info['full_content'].replace(
-            f"package {old_package};", 
-            f"package {new_package};"
-        )
+        # También actualizar las referencias a otras clases del proyecto, en una sola pasada
+        classes = self.classes
+        prefix = f"{self.common_package}."
         
-        # También actualizar las referencias a otras clases del mismo package
-        for other_class in self.classes:
-            if other_class != class_name:
-                pattern = r'\b' + re.escape(other_class) + r'\b'
-                new_content = re.sub(pattern, f"{self.common_package}.{other_class}", new_content)
+        def qualify(match):
+            name = match.group(1)
+            if name is not None and name != class_name and name in classes:
+                return prefix + name
+            return match.group(0)
         
-        return new_content
+        new_content = REFERENCE_PATTERN.sub(qualify, classes[class_name].content)
+        return f"package {new_package};\n\n{new_content}"
     
-    def generate_modified_classes(self, output_dir):
-        """Genera las clases modificadas en el directorio de salida"""
+    def generate_modified_classes(self, output_dir, progress=None):
+        """Genera las clases modificadas en el directorio de salida.
+        
+        Las escrituras van a un pool de hilos (Writeutils.BulkWriter) mientras se reescriben las
+        siguientes clases; progress(escritos, encolados) se llama desde esos hilos.
+        """
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
-        generated_files = []
-        for class_name in self.selected_classes:
-            modified_content = self.change_package(class_name, self.common_package)
-            if modified_content:
-                file_path = os.path.join(output_dir, f"{class_name}.java")
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(modified_content)
-                generated_files.append(file_path)
+        with Writeutils.BulkWriter(progress=progress) as writer:
+            for class_name in self.selected_classes:
+                modified_content = self.change_package(class_name, self.common_package)
+                if modified_content:
+                    writer.write(os.path.join(output_dir, f"{class_name}.java"), modified_content)
+        self.write_stats = writer.stats()
+        
+        return list(writer.paths)
+    
+    def harness_entries(self, main_class, main_method):
+        """Llamadas del arnés: [(etiqueta, expresión Java, devuelve valor)].
+        
+        main_class y main_method admiten listas separadas por comas y '*' (todas las clases
+        seleccionadas, todos sus métodos no privados con cuerpo). Los argumentos son los valores
+        por defecto de cada tipo; los métodos de instancia se llaman sobre una instancia nueva.
+        Los métodos que una clase analizada no declara se omiten; solo las clases que no están en
+        el proyecto reciben la llamada sin argumentos del arnés de un solo método.
+        """
+        if main_class.strip() == '*':
+            class_names = list(self.selected_classes or self.classes)
+        else:
+            class_names = [name.strip() for name in main_class.split(',') if name.strip()]
+        method_names = [name.strip() for name in main_method.split(',') if name.strip()]
         
-        return generated_files
+        entries = []
+        for class_name in class_names:
+            declaration = None
+            if class_name in self.classes:
+                tokens = Javalexer.tokenize(self.classes[class_name].content)
+                declaration = next((d for d in Javalexer.type_declarations(tokens) if d.parent is None), None)
+            if declaration is None:
+                # Clase desconocida: llamada sin argumentos, como en el arnés de un solo método
+                entries.extend((f"{class_name}.{name}()", f"new {class_name}().{name}()", None)
+                               for name in method_names if name != '*')
+                continue
+            
+            methods = [m for m in Javalexer.method_declarations(tokens, declaration) if m.owner is declaration]
+            signatures = {}
+            for method in methods:
+                signatures.setdefault(method.name, []).append(split_parameters(method.params_text(tokens)))
+            constructors = [m for m in methods if m.is_constructor and 'private' not in m.modifiers]
+            if declaration.kind == 'record' and not any(not split_parameters(c.params_text(tokens)) for c in constructors):
+                # Un record siempre tiene el constructor canónico: los componentes de su cabecera
+                header = tokens.find(Javalexer.LPAREN, declaration.index, declaration.body_open)
+                components = []
+                if header != -1 and tokens.pairs[header] != -1:
+                    components = split_parameters(tokens.source[tokens.ends[header]:tokens.starts[tokens.pairs[header]]])
+                constructor_arguments = default_arguments(components, signatures.get(declaration.name, []) + [components])
+            elif constructors and not any(not split_parameters(c.params_text(tokens)) for c in constructors):
+                constructor_arguments = default_arguments(split_parameters(constructors[0].params_text(tokens)),
+                                                          signatures[constructors[0].name])
+            else:
+                constructor_arguments = ""
+            # El contenido empieza en la palabra class: la clase generada no conserva modificadores como abstract
+            instantiable = declaration.kind in ('class', 'record')
+            
+            for name in method_names:
+                candidates = [m for m in methods if not m.is_constructor and m.body_open is not None
+                              and 'private' not in m.modifiers and (name == '*' or m.name == name)]
+                for method in candidates:
+                    static = 'static' in method.modifiers
+                    if not static and not instantiable:
+                        continue
+                    parameters = split_parameters(method.params_text(tokens))
+                    target = class_name if static else f"new {class_name}({constructor_arguments})"
+                    label = f"{class_name}.{method.name}({', '.join(map(parameter_type, parameters))})"
+                    call = f"{target}.{method.name}({default_arguments(parameters, signatures[method.name])})"
+                    entries.append((label, call, method.return_type(tokens) != 'void'))
+        return entries
     
-    def create_test_harness(self, output_dir, main_class, main_method):
-        """Crea una clase de prueba para ejecutar el método principal"""
+    def create_test_harness(self, output_dir, main_class, main_method, warmup=5, iterations=20):
+        """Crea una clase de prueba que ejecuta y mide cada método de entrada.
+        
+        Un solo TestHarness con una tabla de flujos: cada uno se ejecuta warmup veces sin medir
+        y luego iterations veces midiendo cada llamada con System.nanoTime(). Los valores por
+        defecto se pueden cambiar al ejecutarlo: java TestHarness [warmup] [iteraciones] [filtro]
+        """
+        entries = self.harness_entries(main_class, main_method)
+        
+        names = "".join(f'        "{label}",\n' for label, _, _ in entries)
+        flows = "".join(f"        () -> {call},\n" if returns else f"        () -> {{ {call}; return null; }},\n"
+                        for _, call, returns in entries)
+        
         test_class_content = f"""package {self.common_package};
 
+import java.util.Arrays;
+
 public class TestHarness {{
+    interface Flow {{
+        Object run() throws Exception;
+    }}
+
+    private static final String[] NAMES = {{
+{names}    }};
+
+    private static final Flow[] FLOWS = {{
+{flows}    }};
+
+    // Conserva el resultado de cada llamada para que el JIT no la elimine
+    static volatile Object sink;
+
     public static void main(String[] args) {{
-        try {{
-            System.out.println("Iniciando prueba del flujo de negocio...");
-            
-            // Crear instancia de la clase principal
-            {main_class} instance = new {main_class}();
-            
-            // Ejecutar el método principal
-            System.out.println("Resultado: " + instance.{main_method}());
-            
+        int warmup = args.length > 0 ? Integer.parseInt(args[0]) : {warmup};
+        int iterations = Math.max(1, args.length > 1 ? Integer.parseInt(args[1]) : {iterations});
+        String filter = args.length > 2 ? args[2] : "";
+        int failures = 0;
+
+        System.out.println("Iniciando prueba de " + FLOWS.length + " flujos de negocio (calentamiento: "
+                + warmup + ", iteraciones: " + iterations + ")...");
+        System.out.printf("%-60s %12s %12s %12s %12s%n", "Flujo", "min (us)", "media (us)", "p50 (us)", "max (us)");
+        for (int i = 0; i < FLOWS.length; i++) {{
+            if (!NAMES[i].contains(filter)) {{
+                continue;
+            }}
+            try {{
+                for (int n = 0; n < warmup; n++) {{
+                    sink = FLOWS[i].run();
+                }}
+                long[] times = new long[iterations];
+                long total = 0;
+                for (int n = 0; n < iterations; n++) {{
+                    long start = System.nanoTime();
+                    sink = FLOWS[i].run();
+                    times[n] = System.nanoTime() - start;
+                    total += times[n];
+                }}
+                Arrays.sort(times);
+                System.out.printf("%-60s %12.1f %12.1f %12.1f %12.1f%n", NAMES[i], times[0] / 1e3,
+                        total / 1e3 / iterations, times[iterations / 2] / 1e3, times[iterations - 1] / 1e3);
+            }} catch (Throwable e) {{
+                failures++;
+                System.err.println("Error durante la prueba de " + NAMES[i] + ": " + e);
+                e.printStackTrace();
+            }}
+        }}
+
+        if (failures == 0) {{
             System.out.println("Prueba completada exitosamente!");
-        }} catch (Exception e) {{
-            System.err.println("Error durante la prueba: " + e.getMessage());
-            e.printStackTrace();
+        }} else {{
+            System.out.println("Prueba completada con " + failures + " flujos con error");
         }}
     }}
 }}
 """
         
         file_path = os.path.join(output_dir, "TestHarness.java")
-        with open(file_path, 'w', encoding='utf-8') as file:
-            file.write(test_class_content)
+        Writeutils.write_atomic(file_path, test_class_content)
         
         return file_path
 
@@ -132,6 +346,11 @@ class JavaProcessorApp:
         
         self.processor = JavaProjectProcessor()
         
+        # La generación corre en un hilo aparte y publica eventos; la ventana los consume con after()
+        self.events = queue.Queue()
+        self.processing = False
+        self.status = tk.StringVar(value="Listo")
+        
         self.create_widgets()
         
     def create_widgets(self):
@@ -181,12 +400,12 @@ class JavaProcessorApp:
         ttk.Button(button_frame, text=">>", command=self.add_all_classes).pack(pady=5)
         ttk.Button(button_frame, text="<<", command=self.remove_all_classes).pack(pady=5)
         
-        # Clase y método principal para prueba
-        ttk.Label(main_frame, text="Clase principal para prueba:").grid(row=5, column=0, sticky=tk.W, pady=5)
+        # Clases y métodos de entrada para el arnés de prueba
+        ttk.Label(main_frame, text="Clases para prueba (comas, * = todas):").grid(row=5, column=0, sticky=tk.W, pady=5)
         self.main_class = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.main_class, width=30).grid(row=5, column=1, sticky=tk.W, padx=(5, 0))
         
-        ttk.Label(main_frame, text="Método principal para prueba:").grid(row=6, column=0, sticky=tk.W, pady=5)
+        ttk.Label(main_frame, text="Métodos para prueba (comas, * = todos):").grid(row=6, column=0, sticky=tk.W, pady=5)
         self.main_method = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.main_method, width=30).grid(row=6, column=1, sticky=tk.W, padx=(5, 0))
         
@@ -197,6 +416,7 @@ class JavaProcessorApp:
         ttk.Label(main_frame, text="Resultados y detalles:").grid(row=8, column=0, sticky=tk.W, pady=(10, 5))
         self.result_text = scrolledtext.ScrolledText(main_frame, width=80, height=15)
         self.result_text.grid(row=9, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S))
+        ttk.Label(main_frame, textvariable=self.status).grid(row=10, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
         
         # Configurar expansión
         main_frame.columnconfigure(0, weight=1)
@@ -248,6 +468,8 @@ class JavaProcessorApp:
     
     def process_classes(self):
         """Procesa las clases seleccionadas y genera las versiones modificadas"""
+        if self.processing:
+            return
         if not self.file_path.get():
             messagebox.showerror("Error", "Por favor, seleccione un archivo de proyecto primero")
             return
@@ -266,35 +488,177 @@ class JavaProcessorApp:
         if not output_dir:
             return
             
-        # Generar clases modificadas
+        self.processing = True
+        self.status.set("Generando clases...")
+        
+        # Las variables de Tk se leen aquí: el hilo de generación no toca la interfaz
+        thread = threading.Thread(target=self.process_worker,
+                                  args=(output_dir, self.main_class.get(), self.main_method.get()))
+        thread.daemon = True
+        thread.start()
+        self.root.after(100, self.process_events)
+    
+    def process_worker(self, output_dir, main_class, main_method):
+        # Productor: genera y escribe las clases en segundo plano y solo escribe en la cola
         try:
-            generated_files = self.processor.generate_modified_classes(output_dir)
+            generated_files = self.processor.generate_modified_classes(
+                output_dir, progress=lambda done, total: self.events.put(("progreso", done, total)))
+            stats = self.processor.write_stats
             
             # Crear clase de prueba si se especificó clase y método principal
-            main_class = self.main_class.get()
-            main_method = self.main_method.get()
             if main_class and main_method:
                 test_file = self.processor.create_test_harness(output_dir, main_class, main_method)
                 generated_files.append(test_file)
             
-            # Mostrar resultados
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, f"Procesamiento completado!\n\n")
-            self.result_text.insert(tk.END, f"Package común: {self.processor.common_package}\n")
-            self.result_text.insert(tk.END, f"Clases procesadas: {len(generated_files)}\n\n")
-            self.result_text.insert(tk.END, "Archivos generados:\n")
-            for file_path in generated_files:
-                self.result_text.insert(tk.END, f"- {os.path.basename(file_path)}\n")
-            
-            self.result_text.insert(tk.END, f"\nDirectorio de salida: {output_dir}\n")
-            
-            messagebox.showinfo("Éxito", f"Se generaron {len(generated_files)} archivos en el directorio de salida")
-            
+            self.events.put(("fin", output_dir, generated_files, stats))
         except Exception as e:
-            messagebox.showerror("Error", f"Error al procesar las clases: {str(e)}")
+            self.events.put(("error", str(e)))
+    
+    def process_events(self):
+        # Consumidor: vacía la cola en el hilo de Tk y vuelve a programarse mientras dure la generación
+        while True:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            kind = event[0]
+            if kind == "progreso":
+                self.status.set(f"Archivos escritos: {event[1]}/{event[2]}")
+            elif kind == "fin":
+                self.processing = False
+                self.show_results(*event[1:])
+            elif kind == "error":
+                self.processing = False
+                self.status.set("Error al procesar las clases")
+                messagebox.showerror("Error", f"Error al procesar las clases: {event[1]}")
+        if self.processing:
+            self.root.after(100, self.process_events)
+    
+    def show_results(self, output_dir, generated_files, stats):
+        self.status.set(Writeutils.describe_stats(stats))
+        
+        # Mostrar resultados
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, f"Procesamiento completado!\n\n")
+        self.result_text.insert(tk.END, f"Package común: {self.processor.common_package}\n")
+        self.result_text.insert(tk.END, f"Clases procesadas: {len(generated_files)}\n\n")
+        self.result_text.insert(tk.END, "Archivos generados:\n")
+        for file_path in generated_files:
+            self.result_text.insert(tk.END, f"- {os.path.basename(file_path)}\n")
+        
+        self.result_text.insert(tk.END, f"\nDirectorio de salida: {output_dir}\n")
+        self.result_text.insert(tk.END, f"Escritura: {Writeutils.describe_stats(stats)}\n")
+        
+        messagebox.showinfo("Éxito", f"Se generaron {len(generated_files)} archivos en el directorio de salida")
+
+def _legacy_change_package(processor, class_name, new_package):
+    # Reescritura anterior (un re.sub por cada otra clase del proyecto), solo para el benchmark
+    class_info = processor.classes[class_name]
+    new_content = class_info.full_content.replace(f"package {class_info.package};", f"package {new_package};")
+    for other_class in processor.classes:
+        if other_class != class_name:
+            pattern = r'\b' + re.escape(other_class) + r'\b'
+            new_content = re.sub(pattern, f"{processor.common_package}.{other_class}", new_content)
+    return new_content
+
+
+def _legacy_extract_classes(project_content):
+    # Extracción anterior (regex DOTALL, find() y recorrido carácter a carácter), solo para el benchmark
+    classes = {}
+    class_pattern = re.compile(r'^\s*package\s+([\w\.]+)\s*;.*?^.*?class\s+(\w+)\s*(?:extends|\{|\w|implements)*\s*\{',
+                               re.MULTILINE | re.DOTALL)
+    for package, class_name in class_pattern.findall(project_content):
+        class_start = project_content.find(f"class {class_name}")
+        if class_start == -1:
+            continue
+        brace_count = 0
+        class_end = class_start
+        for i in range(class_start, len(project_content)):
+            if project_content[i] == '{':
+                brace_count += 1
+            elif project_content[i] == '}':
+                brace_count -= 1
+                if brace_count == 0:
+                    class_end = i + 1
+                    break
+        classes[class_name] = (package, class_start, class_end)
+    return classes
+
+
+def benchmark_extract_classes(size_mb=50, legacy_mb=(0.01, 0.02, 0.04)):
+    """Extracción de clases de volcados sintéticos (archivos .java concatenados) de tamaño creciente.
+    
+    El recorrido anterior es cuadrático; se mide solo con los tamaños de legacy_mb.
+    """
+    def dump(size):
+        parts = []
+        total = 0
+        i = 0
+        while total < size:
+            body = "".join(f"    /** Devuelve {{valor}} */\n    public String method{j}(String value) {{\n"
+                           f"        if (value.isEmpty()) {{ return \"}}\"; }}\n        return value + '{{';\n    }}\n\n"
+                           for j in range(10))
+            part = (f"package com.example.p{i % 50};\n\nimport java.util.List;\n\n"
+                    f"public class Service{i} extends Base {{\n{body}}}\n\n")
+            parts.append(part)
+            total += len(part)
+            i += 1
+        return "".join(parts), i
+    
+    processor = JavaProjectProcessor()
+    print(f"{'MB':>6} {'clases':>8} {'actual (s)':>11} {'anterior (s)':>13}")
+    for size in sorted(set(legacy_mb) | {size_mb}):
+        processor.project_content, count = dump(int(size * 2 ** 20))
+        start = time.perf_counter()
+        processor.extract_classes()
+        elapsed = time.perf_counter() - start
+        
+        legacy = "-"
+        if size in legacy_mb:
+            start = time.perf_counter()
+            _legacy_extract_classes(processor.project_content)
+            legacy = f"{time.perf_counter() - start:.2f}"
+        
+        print(f"{size:>6g} {count:>8} {elapsed:>11.2f} {legacy:>13}")
+
+
+def benchmark_change_package(sizes=(100, 200, 400, 800), legacy_limit=400):
+    """Reescritura de package de todas las clases de proyectos sintéticos de tamaño creciente.
+    
+    Compara con la reescritura anterior, un re.sub por cada otra clase; se mide solo hasta
+    legacy_limit clases.
+    """
+    processor = JavaProjectProcessor()
+    print(f"{'clases':>8} {'actual (s)':>11} {'anterior (s)':>13}")
+    for size in sizes:
+        processor.project_content = "".join(
+            f"package com.example.p{i % 20};\n\npublic class Service{i} {{\n"
+            f"    // Usa Service{(i + 1) % size}\n"
+            f"    private Service{(i + 1) % size} next = new Service{(i + 1) % size}();\n"
+            f"    public String name() {{ return \"Service{i}\" + next.toString(); }}\n}}\n\n"
+            for i in range(size))
+        processor.extract_classes()
+        
+        start = time.perf_counter()
+        for class_name in processor.classes:
+            processor.change_package(class_name, processor.common_package)
+        elapsed = time.perf_counter() - start
+        
+        legacy = "-"
+        if size <= legacy_limit:
+            start = time.perf_counter()
+            for class_name in processor.classes:
+                _legacy_change_package(processor, class_name, processor.common_package)
+            legacy = f"{time.perf_counter() - start:.2f}"
+        
+        print(f"{size:>8} {elapsed:>11.3f} {legacy:>13}")
 
 
 if __name__ == "__main__":
+    if '--benchmark' in sys.argv:
+        benchmark_extract_classes()
+        benchmark_change_package()
+        sys.exit(0)
     root = tk.Tk()
     app = JavaProcessorApp(root)
     root.mainloop()
@@ -2,6 +2,10 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 import os
 import re
+import sys
+import time
+import Scanutils
+import Javalexer
 
 class JavaPrintlnAdder:
     def __init__(self, root):
@@ -70,7 +74,7 @@ class JavaPrintlnAdder:
     
     def find_java_files(self, folder):
         java_files = []
-        for root, dirs, files in os.walk(folder):
+        for root, dirs, files in Scanutils.walk(folder):
             # Skip hidden directories (like .git)
             dirs[:] = [d for d in dirs if not d.startswith('.')]
             
@@ -110,62 +114,165 @@ class JavaPrintlnAdder:
             return False
     
     def extract_class_name(self, content):
-        # Look for class declaration (skip inner classes and interfaces)
-        class_pattern = r'^[^{}]*?\b(class|interface|enum|record)\s+(\w+)'
-        matches = re.finditer(class_pattern, content, re.MULTILINE)
-        
-        for match in matches:
-            # Skip interfaces, enums and records if we want only classes
-            if match.group(1) == 'class':
-                return match.group(2)
-        
-        # If no class found, return the first match regardless of type
-        first_match = re.search(r'^(?:public|private|protected|abstract|final|static)?\s*(?:class|interface|enum|record)\s+(\w+)', content, re.MULTILINE)
-        return first_match.group(1) if first_match else None
+        # Main class of the file (skip inner classes; comments and strings are ignored by the lexer)
+        declaration = Javalexer.primary_type(Javalexer.tokenize(content))
+        return declaration.name if declaration else None
     
     def add_println_to_methods(self, content, class_name):
-        # Pattern to match method declarations (excluding constructors)
-        method_pattern = r'(\n\s*(?:public|protected|private|static|final|synchronized|abstract|native|\s)+[\w\<\>\[\]]+\s+(\w+)\s*\([^\)]*\)\s*(?:throws\s+[\w\s,]+)?\s*\{)'
+        # Every insertion is collected as (offset, text) and applied in a single join at the end
+        tokens = Javalexer.tokenize(content)
+        declarations = Javalexer.type_declarations(tokens)
+        nested = self.nested_bodies(tokens)
         
-        methods = list(re.finditer(method_pattern, content))
-        methods.reverse()  # Process from end to beginning to avoid offset issues
+        # A body that belongs to a type (nested record, local class) or to a lambda or anonymous
+        # class is never a method scope, even if the lexer reports a declaration in front of it
+        type_bodies = {declaration.body_open for declaration in declarations}
+        type_bodies.update(nested)
+        methods = []
+        for declaration in declarations:
+            for method in Javalexer.method_declarations(tokens, declaration):
+                if method.body_open is not None and method.body_open not in type_bodies:
+                    methods.append(method)
         
-        for match in methods:
-            method_name = match.group(2)
-            
-            # Skip constructors (methods with same name as class)
-            if method_name == class_name:
+        # Method, lambda and anonymous class bodies in source order: a return belongs to the innermost one
+        scopes = [(method.body_open, method.body_close, method) for method in methods]
+        for index in nested:
+            scopes.append((index, tokens.pairs[index], None))
+        scopes.sort(key=lambda scope: scope[0])
+        
+        edits = []
+        instrumented = set()
+        for method in methods:
+            # Skip constructors and the main method
+            if method.is_constructor:
                 continue
-            
-            # Skip main method
-            if method_name == 'main' and 'static' in match.group(1) and 'void' in match.group(1):
+            if method.name == 'main' and 'static' in method.modifiers and method.return_type(tokens) == 'void':
                 continue
+            instrumented.add(method)
             
-            # Find the opening brace of the method (it's in our match)
-            method_start = match.end()
-            
-            # Add entry log at the beginning of the method
-            entry_log = f'\n        System.out.println("ENTRADA: {class_name}.{method_name}");\n'
-            content = content[:method_start] + entry_log + content[method_start:]
-            
-            # Add exit logs before return statements
-            content = self.add_exit_println(content, class_name, method_name)
+            # Add entry log right after the opening brace of the method
+            entry_log = f'\n        System.out.println("ENTRADA: {method.owner.name}.{method.name}");\n'
+            edits.append((tokens.ends[method.body_open], entry_log))
         
-        return content
+        # Add exit logs around the return statements of each instrumented method only
+        stack = []
+        next_scope = 0
+        for index in self.return_statements(tokens):
+            while next_scope < len(scopes) and scopes[next_scope][0] < index:
+                stack.append(scopes[next_scope])
+                next_scope += 1
+            while stack and stack[-1][1] < index:
+                stack.pop()
+            method = stack[-1][2] if stack else None
+            if method in instrumented:
+                self.add_exit_println(tokens, method, index, edits)
+        
+        return self.apply_edits(content, edits)
+    
+    @staticmethod
+    def return_statements(tokens):
+        kinds = tokens.kinds
+        return [index for index in range(len(kinds)) if kinds[index] == Javalexer.KEYWORD and tokens.text(index) == 'return']
+    
+    @staticmethod
+    def nested_bodies(tokens):
+        # Opening brace of every block lambda, (x) -> { ... }, and anonymous class, new Type(...) { ... }
+        kinds = tokens.kinds
+        pairs = tokens.pairs
+        type_kinds = (Javalexer.IDENT, Javalexer.DOT, Javalexer.LT, Javalexer.GT, Javalexer.COMMA,
+                      Javalexer.OPERATOR, Javalexer.AT)
+        bodies = []
+        for index in range(len(kinds) - 1):
+            kind = kinds[index]
+            if kind == Javalexer.OPERATOR and kinds[index + 1] == Javalexer.LBRACE and tokens.text(index) == '->':
+                bodies.append(index + 1)
+            elif kind == Javalexer.KEYWORD and tokens.text(index) == 'new':
+                end = index + 1
+                while end < len(kinds) and kinds[end] in type_kinds:
+                    end += 1
+                if end < len(kinds) and kinds[end] == Javalexer.LPAREN and pairs[end] != -1:
+                    end = pairs[end] + 1
+                    if end < len(kinds) and kinds[end] == Javalexer.LBRACE:
+                        bodies.append(end)
+        return bodies
+    
+    def add_exit_println(self, tokens, method, return_index, edits):
+        # Wrap the return statement in a block with the exit log, so it stays a single statement
+        # (also valid as the body of an if/else/loop without braces)
+        kinds = tokens.kinds
+        pairs = tokens.pairs
+        index = return_index + 1
+        while index < len(kinds) and kinds[index] != Javalexer.SEMI:
+            if pairs[index] > index:
+                index = pairs[index]             # Lambdas, anonymous classes and calls inside the expression
+            index += 1
+        if index == len(kinds):
+            return                               # Unterminated statement: leave it untouched
+        exit_log = f'{{ System.out.println("SALIDA: {method.owner.name}.{method.name}"); '
+        edits.append((tokens.starts[return_index], exit_log))
+        edits.append((tokens.ends[index], ' }'))
     
-    def add_exit_println(self, content, class_name, method_name):
-        # Find all return statements in the method
-        return_pattern = r'return[^;]*;'
-        returns = list(re.finditer(return_pattern, content))
-        returns.reverse()  # Process from end to beginning
-        
-        for return_match in returns:
-            exit_log = f'        System.out.println("SALIDA: {class_name}.{method_name}");\n'
+    @staticmethod
+    def apply_edits(content, edits):
+        # Insert every (offset, text) into content; edits at the same offset keep their list order
+        pieces = []
+        last = 0
+        for offset, text in sorted(edits, key=lambda edit: edit[0]):
+            pieces.append(content[last:offset])
+            pieces.append(text)
+            last = offset
+        pieces.append(content[last:])
+        return ''.join(pieces)
+
+
+def _legacy_add_println(content, class_name):
+    # Previous instrumentation (rebuilds the file per method and rescans every return), only for the benchmark
+    tokens = Javalexer.tokenize(content)
+    methods = [method for declaration in Javalexer.type_declarations(tokens)
+               for method in Javalexer.method_declarations(tokens, declaration)
+               if method.body_open is not None and not method.is_constructor]
+    methods.sort(key=lambda method: method.body_open, reverse=True)
+    for method in methods:
+        method_start = tokens.ends[method.body_open]
+        entry_log = f'\n        System.out.println("ENTRADA: {method.owner.name}.{method.name}");\n'
+        content = content[:method_start] + entry_log + content[method_start:]
+        for return_match in reversed(list(re.finditer(r'return[^;]*;', content))):
+            exit_log = f'        System.out.println("SALIDA: {class_name}.{method.name}");\n'
             content = content[:return_match.start()] + exit_log + content[return_match.start():]
+    return content
+
+
+def benchmark_add_println(sizes=(50, 100, 200, 400, 1600, 6400), returns_per_method=3, legacy_limit=100):
+    """Tiempo de instrumentación de clases generadas con un número creciente de métodos.
+    
+    Compara con la versión anterior solo hasta legacy_limit métodos: cada método añadía un
+    println antes de cada return del archivo, así que su salida y su coste se disparan.
+    """
+    app = JavaPrintlnAdder.__new__(JavaPrintlnAdder)
+    print(f"{'métodos':>8} {'KB':>8} {'actual (s)':>12} {'anterior (s)':>13}")
+    for size in sizes:
+        body = "".join(f"    public int method{i}(int value) {{\n"
+                       + "".join(f"        if (value == {j}) return value + {j};\n" for j in range(returns_per_method - 1))
+                       + "        return value;\n    }\n\n" for i in range(size))
+        content = f"package com.example.generated;\n\npublic class Generated {{\n{body}}}\n"
+        
+        start = time.perf_counter()
+        app.add_println_to_methods(content, "Generated")
+        elapsed = time.perf_counter() - start
         
-        return content
+        legacy = "-"
+        if size <= legacy_limit:
+            start = time.perf_counter()
+            _legacy_add_println(content, "Generated")
+            legacy = f"{time.perf_counter() - start:.3f}"
+        
+        print(f"{size:>8} {len(content) // 1024:>8} {elapsed:>12.3f} {legacy:>13}")
+
 
 if __name__ == "__main__":
+    if '--benchmark' in sys.argv:
+        benchmark_add_println()
+        sys.exit(0)
     root = tk.Tk()
     app = JavaPrintlnAdder(root)
     root.mainloop()
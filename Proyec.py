@@ -1,127 +1,622 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import argparse
+import json
+import os
+import queue
 import re
+import sys
+import tarfile
+import threading
+import zipfile
+from array import array
+from bisect import bisect_right
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from sys import intern
+from xml.sax.saxutils import escape
+import Javalexer
+import Scanutils
+
+# Archivos comprimidos que se leen sin extraerlos a disco
+ZIP_EXTENSIONS = ('.zip', '.jar', '.war', '.ear')
+TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+NEWLINE = re.compile('\n')
+
+
+def decode_source(data):
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode('latin-1')
+
+
+def iter_sources(path):
+    """(nombre, texto) de cada archivo .java de un directorio o archivo comprimido, de uno en uno.
+    
+    Un archivo de texto que no es un comprimido se devuelve entero (un volcado del proyecto).
+    """
+    if os.path.isdir(path):
+        for file_path in Scanutils.iter_files(path, '.java'):
+            try:
+                with open(file_path, 'rb') as f:
+                    yield file_path, decode_source(f.read())
+            except OSError:
+                continue
+    elif path.lower().endswith(ZIP_EXTENSIONS) and zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path, 'r') as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and info.filename.endswith('.java'):
+                    yield f"{path}!/{info.filename}", decode_source(archive.read(info))
+    elif path.lower().endswith(TAR_EXTENSIONS) and tarfile.is_tarfile(path):
+        # Iterar el tar miembro a miembro evita cargar el índice completo (también con gzip)
+        with tarfile.open(path, 'r:*') as archive:
+            for member in archive:
+                if member.isfile() and member.name.endswith('.java'):
+                    with archive.extractfile(member) as f:
+                        yield f"{path}!/{member.name}", decode_source(f.read())
+    else:
+        with open(path, 'rb') as f:
+            yield path, decode_source(f.read())
+
+
+class SourceFile:
+    """Texto de un archivo analizado: se guarda una sola vez y lo comparten todas sus clases"""
+    __slots__ = ('name', 'text')
+    
+    def __init__(self, name, text):
+        self.name = name
+        self.text = text
+
+
+class MethodInfo:
+    """Método con cuerpo: [start, end) en el texto de su archivo (desde la línea de la declaración
+    hasta la de la llave de cierre), llamadas de su cuerpo y tipos de sus parámetros y variables"""
+    __slots__ = ('name', 'start', 'end', 'calls', 'variables')
+    
+    def __init__(self, name, start, end, calls, variables):
+        self.name = name
+        self.start = start
+        self.end = end
+        self.calls = calls              # ((objeto, 'self' o 'super', método), ...) en el orden del código
+        self.variables = variables      # {variable -> tipo}
+
+
+class ClassInfo:
+    """Tipo analizado: posición en el texto de su archivo, métodos, campos y supertipos.
+    
+    Los nombres (clases, métodos, tipos, variables) se internan: los que se repiten en miles
+    de clases comparten un único objeto str.
+    """
+    __slots__ = ('name', 'kind', 'source', 'start', 'end', 'methods', 'fields', 'extends', 'implements')
+    
+    def __init__(self, name, kind, source, start, end, methods, fields, extends, implements):
+        self.name = name
+        self.kind = kind                # class, interface, enum, record o @interface
+        self.source = source            # SourceFile
+        self.start = start
+        self.end = end
+        self.methods = methods          # {nombre -> MethodInfo}
+        self.fields = fields            # {campo -> tipo}
+        self.extends = extends
+        self.implements = implements
+    
+    @property
+    def file(self):
+        return self.source.name
+    
+    @property
+    def content(self):
+        return self.source.text[self.start:self.end]
+    
+    def method_text(self, method_name):
+        method = self.methods[method_name]
+        return self.source.text[method.start:method.end]
+
+
+def parse_source(file_content, file_name=None):
+    """Clases de un texto fuente: nombre -> ClassInfo"""
+    classes = {}
+    tokens = Javalexer.tokenize(file_content)
+    source = SourceFile(file_name, file_content)
+    # Posición de inicio de cada línea para pasar de un token a su línea con bisect
+    line_starts = [0]
+    line_starts.extend(match.end() for match in NEWLINE.finditer(file_content))
+    
+    for declaration in Javalexer.type_declarations(tokens):
+        start, end = _line_span(file_content, line_starts, tokens.starts[declaration.index], tokens.starts[declaration.body_close])
+        extends, implements = Javalexer.supertypes(tokens, declaration)
+        name = intern(declaration.name)
+        classes[name] = ClassInfo(
+            name, intern(declaration.kind), source, start, end,
+            _extract_methods(tokens, declaration, file_content, line_starts),
+            {intern(field): intern(type_name) for type_name, field in Javalexer.field_declarations(tokens, declaration)},
+            tuple(map(intern, extends)), tuple(map(intern, implements)))
+    return classes
+
+
+def _line_span(text, line_starts, first, last):
+    # [inicio de la línea de first, fin de la línea de last) sin el salto de línea final
+    start = line_starts[bisect_right(line_starts, first) - 1]
+    end = text.find('\n', last)
+    return start, len(text) if end == -1 else end
+
+
+def _extract_methods(tokens, declaration, text, line_starts):
+    """Métodos con cuerpo de una clase: nombre -> MethodInfo"""
+    methods = {}
+    for method in Javalexer.method_declarations(tokens, declaration):
+        if method.body_open is None or method.name in methods:
+            continue
+        start, end = _line_span(text, line_starts, tokens.starts[method.name_index], tokens.starts[method.body_close])
+        # Sin ámbitos de bloque: la primera declaración de cada nombre gana
+        variables = {}
+        for type_name, name in Javalexer.parameters(tokens, method):
+            variables.setdefault(intern(name), intern(type_name))
+        for type_name, name, _ in Javalexer.variable_declarations(tokens, method.body_open, method.body_close):
+            variables.setdefault(intern(name), intern(type_name))
+        name = intern(method.name)
+        methods[name] = MethodInfo(name, start, end, tuple(body_calls(tokens, method.body_open, method.body_close)), variables)
+    return methods
+
+
+def body_calls(tokens, body_open, body_close):
+    """Llamadas entre dos llaves: [(objeto, 'self' o 'super', método)] en el orden del código"""
+    calls = []
+    for qualifier, name, _ in Javalexer.calls(tokens, body_open + 1, body_close):
+        if qualifier is None or qualifier == 'this':  # patron metodo() o this.metodo()
+            calls.append(('self', intern(name)))
+        elif qualifier:  # patron objeto.metodo()
+            calls.append((intern(qualifier), intern(name)))
+    return calls
+
+
+def _parse_chunk(chunk):
+    # Tarea del pool: un bloque de archivos para repartir el coste de comunicación entre procesos
+    return [parse_source(text, name) for name, text in chunk]
+
+
+def parse_sources(sources, workers=None, chunk_size=32):
+    """Tablas de clases de cada archivo, en orden, analizadas en un pool de procesos.
+    
+    Solo se leen workers * 2 bloques por delante de los resultados consumidos: la memoria
+    no depende del tamaño del proyecto sino del tamaño de los bloques.
+    """
+    workers = workers or os.cpu_count() or 1
+    sources = iter(sources)
+    chunks = iter(lambda: list(islice(sources, chunk_size)), [])
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _parse_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_parse_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
 
 class CodeAnalyzer:
     def __init__(self):
         self.classes = {}
-        self.current_file = ""
+        self.graph = None       # CallGraph de self.classes, se construye al primer rastreo
         
     def parse_project(self, file_content):
         """Analiza el contenido del proyecto y extrae todas las clases con sus métodos"""
-        self.classes = {}
-        lines = file_content.split('\n')
-        current_class = None
-        current_method = None
-        class_content = []
-        
-        for line in lines:
-            # Buscar declaración de clase
-            class_match = re.match(r'^\s*class\s+(\w+)\s*[:{]\s*$', line)
-            if class_match:
-                if current_class:
-                    self.classes[current_class] = {
-                        'methods': self._extract_methods(class_content),
-                        'content': class_content
-                    }
-                current_class = class_match.group(1)
-                class_content = [line]
-                continue
-                
-            if current_class:
-                class_content.append(line)
-                
-        # Añadir la última clase
-        if current_class:
-            self.classes[current_class] = {
-                'methods': self._extract_methods(class_content),
-                'content': class_content
-            }
-            
+        self.classes = parse_source(file_content)
+        self.graph = None
         return self.classes
         
-    def _extract_methods(self, class_content):
-        """Extrae los métodos de una clase"""
-        methods = {}
-        method_name = None
-        method_content = []
-        in_method = False
-        brace_count = 0
-        
-        for line in class_content:
-            # Buscar declaración de método
-            method_match = re.match(r'^\s*(?:\w+\s+)*(\w+)\s*\([^)]*\)\s*(?::[^{]*)?\s*{', line)
-            if method_match and not in_method:
-                method_name = method_match.group(1)
-                in_method = True
-                brace_count = 1
-                method_content = [line]
-                continue
-                
-            if in_method:
-                method_content.append(line)
-                # Contar llaves para determinar el final del método
-                brace_count += line.count('{')
-                brace_count -= line.count('}')
-                
-                if brace_count <= 0:
-                    methods[method_name] = method_content
-                    in_method = False
-                    method_name = None
-                    
-        return methods
-        
-    def find_method_calls(self, method_content):
-        """Encuentra todas las llamadas a métodos en el contenido de un método"""
-        calls = []
-        for line in method_content:
-            # Buscar patrones de llamadas a métodos
-            matches = re.findall(r'(\w+)\.(\w+)\s*\(|(\w+)\s*\(', line)
-            for match in matches:
-                if match[0] and match[1]:  # patron objeto.metodo()
-                    calls.append((match[0], match[1]))
-                elif match[2]:  # patron metodo()
-                    calls.append(('self', match[2]))
-        return calls
+    def load_project(self, path, workers=None, progress=None):
+        """Analiza un directorio, un archivo comprimido (.zip, .jar, .tar.gz...) o un volcado de texto.
+        
+        Los archivos se leen a medida que el pool los pide y las tablas de cada uno se fusionan
+        en self.classes; progress(archivos, clases) se llama tras cada archivo analizado.
+        """
+        classes = {}
+        for count, file_classes in enumerate(parse_sources(iter_sources(path), workers), 1):
+            classes.update(file_classes)
+            if progress is not None:
+                progress(count, len(classes))
+        self.classes = classes
+        self.graph = None
+        return self.classes
+        
+    def call_graph(self):
+        """Grafo de llamadas del proyecto cargado; se construye en la primera consulta"""
+        if self.graph is None:
+            self.graph = CallGraph(self.classes)
+        return self.graph
         
     def trace_dependencies(self, start_class, start_method):
         """Rastrea todas las dependencias a partir de una clase y método inicial"""
         if start_class not in self.classes:
             return None
             
-        if start_method not in self.classes[start_class]['methods']:
+        if start_method not in self.classes[start_class].methods:
             return None
             
-        # Usamos BFS para rastrear las dependencias
-        visited = set()
-        queue = deque([(start_class, start_method)])
-        dependencies = []
-        
-        while queue:
-            current_class, current_method = queue.popleft()
-            if (current_class, current_method) in visited:
+        return self.call_graph().trace(start_class, start_method)
+        
+    def entry_points(self, entries):
+        """Identificadores de "Clase.metodo" o "Clase" (todos sus métodos); los desconocidos se ignoran"""
+        graph = self.call_graph()
+        starts = []
+        for entry in entries:
+            class_name, _, method_name = entry.strip().partition('.')
+            if method_name:
+                node = graph.ids.get((class_name, method_name))
+                if node is not None:
+                    starts.append(node)
+            elif class_name in self.classes:
+                starts.extend(graph.ids[(class_name, name)] for name in self.classes[class_name].methods)
+        return starts
+        
+    def export_graph(self, path, entries=None, fmt=None):
+        """Exporta el grafo de llamadas completo, o el cierre desde las entradas dadas, a GraphML, DOT o JSON.
+        
+        El formato sale de la extensión de path si no se indica. Devuelve (nodos, aristas).
+        """
+        fmt = fmt or export_format(path)
+        if fmt not in GRAPH_WRITERS:
+            raise ValueError(f"Formato de exportación desconocido: {path}")
+        graph = self.call_graph()
+        mask = graph.closure(self.entry_points(entries)) if entries else None
+        with open(path, 'w', encoding='utf-8', newline='\n', buffering=1 << 20) as out:
+            return write_graph(graph, out, fmt, mask)
+
+
+class CallGraph:
+    """Grafo de llamadas entre métodos con identificadores enteros.
+    
+    nodes[i] es (clase, método) y sus llamadas resueltas son targets[offsets[i]:offsets[i + 1]],
+    en el orden del código y con repeticiones. Cada recorrido se memoriza por nodo inicial: el
+    grafo es inmutable y se descarta entero al recargar el proyecto.
+    
+    objeto.metodo() se resuelve con el tipo declarado del objeto (variable local, parámetro o
+    campo, heredados incluidos); una llamada sobre una interfaz o un método abstracto lleva a
+    todas las implementaciones del proyecto.
+    """
+    __slots__ = ('nodes', 'ids', 'offsets', 'targets', 'traces', 'classes', 'subtypes',
+                 'field_tables', 'inherited_targets', 'dispatch_targets')
+    
+    def __init__(self, classes):
+        self.classes = classes
+        self.nodes = []
+        self.ids = {}
+        for class_name, data in classes.items():
+            for method_name in data.methods:
+                self.ids[(class_name, method_name)] = len(self.nodes)
+                self.nodes.append((class_name, method_name))
+        
+        # Subtipos directos (extends e implements) para pasar de una interfaz a sus implementaciones
+        self.subtypes = {}
+        for class_name, data in classes.items():
+            for parent in data.extends + data.implements:
+                self.subtypes.setdefault(parent, []).append(class_name)
+        
+        # Tablas de resolución memorizadas por clase y por (tipo, método)
+        self.field_tables = {}
+        self.inherited_targets = {}
+        self.dispatch_targets = {}
+        
+        # Adyacencia compacta (CSR): un solo arreglo de destinos y el desplazamiento de cada nodo
+        self.offsets = array('i', [0])
+        self.targets = array('i')
+        for class_name, method_name in self.nodes:
+            method_info = classes[class_name].methods[method_name]
+            for obj, method in method_info.calls:
+                self.targets.extend(self.resolve_call(class_name, method_info.variables, obj, method))
+            self.offsets.append(len(self.targets))
+        self.traces = {}
+    
+    def __len__(self):
+        return len(self.nodes)
+    
+    def resolve_call(self, class_name, variables, obj, method):
+        """Identificadores de los métodos que puede ejecutar obj.method() dentro de class_name"""
+        if obj == 'self':  # Llamada a método de la misma clase (o heredado)
+            return self.inherited(class_name, method)
+        if obj == 'super':
+            data = self.classes[class_name]
+            return self.inherited(data.extends[0], method) if data.extends and data.kind != 'interface' else ()
+        # Llamada a método de otra clase: tipo declarado del objeto, o el propio nombre si es una clase (llamada estática)
+        type_name = variables.get(obj) or self.fields(class_name).get(obj)
+        if type_name is None and obj in self.classes:
+            type_name = obj
+        if type_name is None:
+            return ()
+        return self.dispatch(type_name, method)
+    
+    def fields(self, class_name):
+        """{campo -> tipo} de una clase con los heredados de sus superclases"""
+        table = self.field_tables.get(class_name)
+        if table is None:
+            self.field_tables[class_name] = table = {}     # Corta ciclos de herencia mal formados
+            data = self.classes.get(class_name)
+            if data is not None:
+                if data.extends and data.kind != 'interface':
+                    table.update(self.fields(data.extends[0]))
+                table.update(data.fields)
+        return table
+    
+    def inherited(self, type_name, method):
+        """(id,) de la implementación visible de method en type_name: la propia o la del ancestro más
+        cercano, primero la cadena de superclases y luego los métodos default de las interfaces"""
+        key = (type_name, method)
+        found = self.inherited_targets.get(key)
+        if found is not None:
+            return found
+        classes = self.classes
+        chain = []
+        name = type_name
+        while name in classes and name not in chain:
+            if (name, method) in self.ids:
+                found = (self.ids[(name, method)],)
+                break
+            chain.append(name)
+            data = classes[name]
+            name = data.extends[0] if data.extends and data.kind != 'interface' else None
+        else:
+            found = ()
+            pending = deque()
+            for name in chain:
+                data = classes[name]
+                pending.extend(data.extends if data.kind == 'interface' else data.implements)
+            seen = set(chain)
+            while pending:
+                name = pending.popleft()
+                if name in seen or name not in classes:
+                    continue
+                seen.add(name)
+                if (name, method) in self.ids:
+                    found = (self.ids[(name, method)],)
+                    break
+                pending.extend(classes[name].extends + classes[name].implements)
+        self.inherited_targets[key] = found
+        return found
+    
+    def dispatch(self, type_name, method):
+        """Implementaciones que puede ejecutar una llamada sobre un objeto de tipo type_name"""
+        key = (type_name, method)
+        found = self.dispatch_targets.get(key)
+        if found is not None:
+            return found
+        data = self.classes.get(type_name)
+        found = self.inherited(type_name, method)
+        if data is not None and (data.kind == 'interface' or not found):
+            # Interfaz o método abstracto: las implementaciones de todos los subtipos del proyecto
+            targets = dict.fromkeys(found)
+            pending = deque(self.subtypes.get(type_name, ()))
+            seen = {type_name}
+            while pending:
+                name = pending.popleft()
+                if name in seen:
+                    continue
+                seen.add(name)
+                target = self.ids.get((name, method))
+                if target is not None:
+                    targets[target] = None
+                pending.extend(self.subtypes.get(name, ()))
+            found = tuple(targets)
+        self.dispatch_targets[key] = found
+        return found
+    
+    def reachable(self, start):
+        """Identificadores alcanzables desde start en orden BFS (start incluido)"""
+        offsets = self.offsets
+        targets = self.targets
+        visited = bytearray(len(self.nodes))
+        visited[start] = 1
+        order = [start]
+        for node in order:
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if not visited[target]:
+                    visited[target] = 1
+                    order.append(target)
+        return order
+    
+    def trace(self, class_name, method_name):
+        """Dependencias (clase origen, método origen, clase destino, método destino) en orden BFS"""
+        start = self.ids.get((class_name, method_name))
+        if start is None:
+            return None
+        dependencies = self.traces.get(start)
+        if dependencies is None:
+            nodes = self.nodes
+            offsets = self.offsets
+            targets = self.targets
+            dependencies = tuple((*nodes[node], *nodes[target])
+                                 for node in self.reachable(start)
+                                 for target in targets[offsets[node]:offsets[node + 1]])
+            self.traces[start] = dependencies
+        return list(dependencies)
+    
+    def closure(self, starts):
+        """bytearray con 1 en cada nodo alcanzable desde alguno de los identificadores de starts"""
+        offsets = self.offsets
+        targets = self.targets
+        visited = bytearray(len(self.nodes))
+        pending = []
+        for start in starts:
+            if not visited[start]:
+                visited[start] = 1
+                pending.append(start)
+        while pending:
+            node = pending.pop()
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if not visited[target]:
+                    visited[target] = 1
+                    pending.append(target)
+        return visited
+    
+    def adjacency(self, node):
+        """{destino -> número de llamadas} de un nodo, en el orden de la primera llamada"""
+        counts = {}
+        for target in self.targets[self.offsets[node]:self.offsets[node + 1]]:
+            counts[target] = counts.get(target, 0) + 1
+        return counts
+
+
+# Formatos de exportación del grafo por extensión del archivo de salida
+EXPORT_FORMATS = {'.graphml': 'graphml', '.dot': 'dot', '.gv': 'dot', '.json': 'json'}
+
+
+def export_format(path):
+    return EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+def write_graph(graph, out, fmt, mask=None):
+    """Escribe el grafo (o los nodos marcados en mask) en out nodo a nodo, sin construir el resultado en memoria.
+    
+    Las llamadas repetidas entre dos métodos se escriben como una arista con su número de
+    llamadas. Devuelve (nodos, aristas) escritos.
+    """
+    # Identificadores densos 0..k-1 de los nodos exportados
+    selected = range(len(graph.nodes)) if mask is None else [node for node in range(len(graph.nodes)) if mask[node]]
+    dense = array('i', [-1]) * len(graph.nodes)
+    for position, node in enumerate(selected):
+        dense[node] = position
+    return GRAPH_WRITERS[fmt](graph, out, selected, dense)
+
+
+def _write_graphml(graph, out, selected, dense):
+    out.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+              '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+              '  <key id="clase" for="node" attr.name="clase" attr.type="string"/>\n'
+              '  <key id="metodo" for="node" attr.name="metodo" attr.type="string"/>\n'
+              '  <key id="llamadas" for="edge" attr.name="llamadas" attr.type="int"/>\n'
+              '  <graph id="llamadas" edgedefault="directed">\n')
+    for node in selected:
+        class_name, method_name = graph.nodes[node]
+        out.write(f'    <node id="n{dense[node]}"><data key="clase">{escape(class_name)}</data>'
+                  f'<data key="metodo">{escape(method_name)}</data></node>\n')
+    edges = 0
+    for node in selected:
+        for target, count in graph.adjacency(node).items():
+            out.write(f'    <edge source="n{dense[node]}" target="n{dense[target]}"><data key="llamadas">{count}</data></edge>\n')
+            edges += 1
+    out.write('  </graph>\n</graphml>\n')
+    return len(selected), edges
+
+
+def _write_dot(graph, out, selected, dense):
+    out.write('digraph llamadas {\n')
+    for node in selected:
+        label = '.'.join(graph.nodes[node]).replace('\\', '\\\\').replace('"', '\\"')
+        out.write(f'  n{dense[node]} [label="{label}"];\n')
+    edges = 0
+    for node in selected:
+        for target, count in graph.adjacency(node).items():
+            out.write(f'  n{dense[node]} -> n{dense[target]} [weight={count}];\n')
+            edges += 1
+    out.write('}\n')
+    return len(selected), edges
+
+
+def _write_json(graph, out, selected, dense):
+    # {"nodes": [[clase, método], ...], "adjacency": [[[destino, llamadas], ...], ...]}: la lista de
+    # adyacencia i corresponde al nodo i
+    out.write('{"nodes":[')
+    for position, node in enumerate(selected):
+        out.write((',' if position else '') + json.dumps(graph.nodes[node], ensure_ascii=False, separators=(',', ':')))
+    out.write('],\n"adjacency":[\n')
+    edges = 0
+    for position, node in enumerate(selected):
+        adjacency = [[dense[target], count] for target, count in graph.adjacency(node).items()]
+        edges += len(adjacency)
+        out.write((',\n' if position else '') + json.dumps(adjacency, separators=(',', ':')))
+    out.write('\n]}\n')
+    return len(selected), edges
+
+
+GRAPH_WRITERS = {'graphml': _write_graphml, 'dot': _write_dot, 'json': _write_json}
+
+
+def _legacy_parse_source(file_content, file_name=None):
+    # Representación anterior (diccionarios y listas de líneas), solo para benchmark_memory
+    classes = {}
+    tokens = Javalexer.tokenize(file_content)
+    lines = file_content.split('\n')
+    line_starts = [0]
+    for line in lines[:-1]:
+        line_starts.append(line_starts[-1] + len(line) + 1)
+    
+    def line_range(first, last):
+        return lines[bisect_right(line_starts, first) - 1:bisect_right(line_starts, last)]
+    
+    for declaration in Javalexer.type_declarations(tokens):
+        methods, calls, variables = {}, {}, {}
+        for method in Javalexer.method_declarations(tokens, declaration):
+            if method.body_open is None or method.name in methods:
                 continue
-                
-            visited.add((current_class, current_method))
-            
-            # Obtener el contenido del método actual
-            method_content = self.classes[current_class]['methods'][current_method]
-            calls = self.find_method_calls(method_content)
-            
-            for obj, method in calls:
-                if obj == 'self':  # Llamada a método de la misma clase
-                    if method in self.classes[current_class]['methods']:
-                        dependencies.append((current_class, current_method, current_class, method))
-                        if (current_class, method) not in visited:
-                            queue.append((current_class, method))
-                else:  # Llamada a método de otra clase
-                    if obj in self.classes and method in self.classes[obj]['methods']:
-                        dependencies.append((current_class, current_method, obj, method))
-                        if (obj, method) not in visited:
-                            queue.append((obj, method))
-            
-        return dependencies
+            methods[method.name] = line_range(tokens.starts[method.name_index], tokens.starts[method.body_close])
+            calls[method.name] = [(obj, name) for obj, name in body_calls(tokens, method.body_open, method.body_close)]
+            method_variables = {}
+            for type_name, name in Javalexer.parameters(tokens, method):
+                method_variables.setdefault(name, type_name)
+            for type_name, name, _ in Javalexer.variable_declarations(tokens, method.body_open, method.body_close):
+                method_variables.setdefault(name, type_name)
+            variables[method.name] = method_variables
+        extends, implements = Javalexer.supertypes(tokens, declaration)
+        classes[declaration.name] = {
+            'methods': methods,
+            'calls': calls,
+            'variables': variables,
+            'fields': {name: type_name for type_name, name in Javalexer.field_declarations(tokens, declaration)},
+            'kind': declaration.kind,
+            'extends': extends,
+            'implements': implements,
+            'content': line_range(tokens.starts[declaration.index], tokens.starts[declaration.body_close]),
+            'file': file_name
+        }
+    return classes
+
+
+def benchmark_memory(sizes=(500, 1000, 2000), methods_per_class=15):
+    """Memoria retenida por las tablas de clases de proyectos sintéticos de tamaño creciente.
+    
+    Compara ClassInfo/MethodInfo (texto único, posiciones y nombres internados) con los
+    diccionarios anteriores, que guardaban cada línea en 'content' y otra vez en 'methods'.
+    Los textos se generan dentro de la medición: solo cuenta lo que cada tabla retiene.
+    """
+    import gc
+    import time
+    import tracemalloc
+    
+    def sources(size):
+        for i in range(size):
+            body = "".join(f"    public Result{j} handle{j}(Request{j} request) {{\n"
+                           f"        Result{j} result = repository.find{j}(request);\n"
+                           f"        log.debug(\"handle{j}\");\n"
+                           f"        return validator.check(result);\n    }}\n\n" for j in range(methods_per_class))
+            yield (f"src/com/example/p{i % 50}/Service{i}.java",
+                   f"package com.example.p{i % 50};\n\npublic class Service{i} extends BaseService implements Handler {{\n"
+                   f"    private Repository repository;\n    private Validator validator;\n\n{body}}}\n")
+    
+    print(f"{'clases':>8} {'actual (MB)':>12} {'anterior (MB)':>14} {'ahorro':>8} {'actual (s)':>11} {'anterior (s)':>13}")
+    for size in sizes:
+        results = []
+        for parse in (parse_source, _legacy_parse_source):
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            classes = {}
+            for name, text in sources(size):
+                classes.update(parse(text, name))
+            elapsed = time.perf_counter() - start
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            results.append((current / 2 ** 20, elapsed))
+            del classes
+        (new_mb, new_s), (old_mb, old_s) = results
+        print(f"{size:>8} {new_mb:>12.1f} {old_mb:>14.1f} {1 - new_mb / old_mb:>8.0%} {new_s:>11.2f} {old_s:>13.2f}")
 
 
 class CodeAnalyzerApp:
@@ -132,6 +627,11 @@ class CodeAnalyzerApp:
         
         self.analyzer = CodeAnalyzer()
         
+        # Carga en segundo plano: el hilo productor deja eventos y Tk los consume con after()
+        self.events = queue.Queue()
+        self.loading = False
+        self.exporting = False
+        
         self.create_widgets()
         
     def create_widgets(self):
@@ -155,6 +655,7 @@ class CodeAnalyzerApp:
         self.file_path = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.file_path, width=50).grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(5, 0))
         ttk.Button(main_frame, text="Examinar", command=self.browse_file).grid(row=1, column=2, padx=(5, 0))
+        ttk.Button(main_frame, text="Carpeta", command=self.browse_directory).grid(row=1, column=3, padx=(5, 0))
         
         # Entrada para clase inicial
         ttk.Label(main_frame, text="Clase inicial:").grid(row=2, column=0, sticky=tk.W, pady=5)
@@ -166,8 +667,11 @@ class CodeAnalyzerApp:
         self.start_method = tk.StringVar()
         ttk.Entry(main_frame, textvariable=self.start_method, width=30).grid(row=3, column=1, sticky=tk.W, padx=(5, 0))
         
-        # Botón para analizar
-        ttk.Button(main_frame, text="Analizar Dependencias", command=self.analyze_dependencies).grid(row=4, column=0, columnspan=3, pady=10)
+        # Botones para analizar y exportar
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.grid(row=4, column=0, columnspan=3, pady=10)
+        ttk.Button(buttons_frame, text="Analizar Dependencias", command=self.analyze_dependencies).pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Exportar Grafo", command=self.export_graph).pack(side=tk.LEFT, padx=5)
         
         # Treeview para mostrar resultados
         ttk.Label(main_frame, text="Dependencias encontradas:").grid(row=5, column=0, sticky=tk.W, pady=(10, 5))
@@ -197,6 +701,10 @@ class CodeAnalyzerApp:
         self.details_text = scrolledtext.ScrolledText(main_frame, width=80, height=10)
         self.details_text.grid(row=8, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S))
         
+        # Estado de la carga
+        self.status = tk.StringVar(value="Seleccione un archivo, un comprimido o una carpeta de código")
+        ttk.Label(main_frame, textvariable=self.status).grid(row=9, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+        
         # Configurar expansión
         main_frame.rowconfigure(6, weight=1)
         main_frame.rowconfigure(8, weight=1)
@@ -207,22 +715,72 @@ class CodeAnalyzerApp:
     def browse_file(self):
         filename = filedialog.askopenfilename(
             title="Seleccionar archivo de proyecto",
-            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+            filetypes=[("Text files", "*.txt"), ("Archivos comprimidos", "*.zip *.jar *.war *.ear *.tar *.tar.gz *.tgz *.tar.bz2 *.tar.xz"),
+                       ("Java files", "*.java"), ("All files", "*.*")]
         )
         if filename:
-            self.file_path.set(filename)
+            self.load_project(filename)
+    
+    def browse_directory(self):
+        directory = filedialog.askdirectory(title="Seleccionar carpeta del proyecto")
+        if directory:
+            self.load_project(directory)
+    
+    def load_project(self, path):
+        if self.loading:
+            return
+        self.file_path.set(path)
+        self.loading = True
+        self.status.set("Cargando proyecto...")
+        threading.Thread(target=self.load_worker, args=(path,), daemon=True).start()
+        self.root.after(100, self.process_events)
+    
+    def load_worker(self, path):
+        # Productor: no toca widgets, solo deja eventos en la cola
+        try:
+            classes = self.analyzer.load_project(path, progress=lambda files, classes: self.events.put(("progreso", files, classes)))
+            self.events.put(("fin", len(classes)))
+        except Exception as e:
+            self.events.put(("error", str(e)))
+    
+    def process_events(self):
+        # Consumidor: vacía la cola en el hilo de Tk y vuelve a programarse mientras dure la carga
+        while True:
             try:
-                with open(filename, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                    self.analyzer.parse_project(content)
-                    messagebox.showinfo("Éxito", "Proyecto cargado correctamente")
-            except Exception as e:
-                messagebox.showerror("Error", f"No se pudo cargar el archivo: {str(e)}")
+                kind, *payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progreso":
+                files, classes = payload
+                self.status.set(f"Archivos analizados: {files} - clases: {classes}")
+            elif kind == "fin":
+                self.loading = False
+                self.status.set(f"Proyecto cargado: {payload[0]} clases")
+                messagebox.showinfo("Éxito", "Proyecto cargado correctamente")
+            elif kind == "error":
+                self.loading = False
+                self.status.set("Error al cargar el proyecto")
+                messagebox.showerror("Error", f"No se pudo cargar el archivo: {payload[0]}")
+            elif kind == "exportado":
+                self.exporting = False
+                path, nodes, edges = payload
+                self.status.set(f"Grafo exportado: {nodes} métodos, {edges} aristas")
+                messagebox.showinfo("Éxito", f"Grafo exportado a {path}")
+            elif kind == "error_exportacion":
+                self.exporting = False
+                self.status.set("Error al exportar el grafo")
+                messagebox.showerror("Error", f"No se pudo exportar el grafo: {payload[0]}")
+        if self.loading or self.exporting:
+            self.root.after(100, self.process_events)
     
     def analyze_dependencies(self):
         if not self.file_path.get():
             messagebox.showerror("Error", "Por favor, seleccione un archivo de proyecto primero")
             return
+        
+        if self.loading:
+            messagebox.showinfo("Información", "El proyecto todavía se está cargando")
+            return
             
         if not self.start_class.get() or not self.start_method.get():
             messagebox.showerror("Error", "Por favor, especifique la clase y método inicial")
@@ -252,6 +810,39 @@ class CodeAnalyzerApp:
         except Exception as e:
             messagebox.showerror("Error", f"Error al analizar dependencias: {str(e)}")
     
+    def export_graph(self):
+        if not self.analyzer.classes or self.loading:
+            messagebox.showerror("Error", "Por favor, cargue un proyecto primero")
+            return
+        if self.exporting:
+            return
+        
+        path = filedialog.asksaveasfilename(
+            title="Exportar grafo de llamadas",
+            defaultextension=".graphml",
+            filetypes=[("GraphML", "*.graphml"), ("Graphviz DOT", "*.dot"), ("JSON", "*.json")]
+        )
+        if not path:
+            return
+        
+        # Sin clase inicial se exporta el grafo completo; con clases separadas por comas, el cierre
+        # desde sus métodos (o solo desde el método inicial si se indica)
+        classes = [name.strip() for name in self.start_class.get().split(',') if name.strip()]
+        method = self.start_method.get().strip()
+        entries = [f"{name}.{method}" if method else name for name in classes]
+        
+        self.exporting = True
+        self.status.set("Exportando grafo...")
+        threading.Thread(target=self.export_worker, args=(path, entries), daemon=True).start()
+        self.root.after(100, self.process_events)
+    
+    def export_worker(self, path, entries):
+        try:
+            nodes, edges = self.analyzer.export_graph(path, entries or None)
+            self.events.put(("exportado", path, nodes, edges))
+        except Exception as e:
+            self.events.put(("error_exportacion", str(e)))
+    
     def on_tree_select(self, event):
         selected_item = self.tree.selection()
         if not selected_item:
@@ -262,10 +853,10 @@ class CodeAnalyzerApp:
         
         # Mostrar detalles del método seleccionado
         try:
-            if clase_destino in self.analyzer.classes and metodo_destino in self.analyzer.classes[clase_destino]['methods']:
-                method_content = self.analyzer.classes[clase_destino]['methods'][metodo_destino]
+            if clase_destino in self.analyzer.classes and metodo_destino in self.analyzer.classes[clase_destino].methods:
+                method_content = self.analyzer.classes[clase_destino].method_text(metodo_destino)
                 details = f"Método: {clase_destino}.{metodo_destino}()\n\n"
-                details += "Contenido:\n" + "\n".join(method_content)
+                details += "Contenido:\n" + method_content
                 self.details_text.delete(1.0, tk.END)
                 self.details_text.insert(tk.END, details)
             else:
@@ -276,7 +867,42 @@ class CodeAnalyzerApp:
             self.details_text.insert(tk.END, f"Error al cargar detalles: {str(e)}")
 
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Grafo de llamadas entre métodos de un proyecto Java.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    export_parser = subparsers.add_parser('export', help='Exporta el grafo de llamadas a GraphML, DOT o JSON')
+    export_parser.add_argument('path', metavar='PATH', help='Directorio, archivo comprimido o volcado de texto del proyecto')
+    export_parser.add_argument('output', metavar='OUTPUT', help='Archivo de salida (.graphml, .dot, .gv o .json)')
+    export_parser.add_argument('--format', choices=sorted(GRAPH_WRITERS), help='Formato de salida (por defecto, según la extensión)')
+    export_parser.add_argument('--entry', action='append', default=[], metavar='CLASE[.METODO]',
+                               help='Exporta solo lo alcanzable desde esta entrada (repetible)')
+    export_parser.add_argument('--workers', type=int, default=None, help='Procesos para analizar los archivos')
+    
+    subparsers.add_parser('benchmark', help='Compara la memoria de las tablas de clases con la representación anterior')
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == 'benchmark':
+        benchmark_memory()
+        return 0
+    
+    if not (args.format or export_format(args.output)):
+        parser.error(f"No se reconoce el formato de {args.output}; use --format")
+    
+    try:
+        analyzer = CodeAnalyzer()
+        analyzer.load_project(args.path, workers=args.workers)
+        nodes, edges = analyzer.export_graph(args.output, args.entry or None, args.format)
+    except Exception as e:
+        print(f"Error al exportar el grafo: {e}", file=sys.stderr)
+        return 1
+    print(f"{args.output}: {nodes} métodos, {edges} aristas", file=sys.stderr)
+    return 0
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
     root = tk.Tk()
     app = CodeAnalyzerApp(root)
     root.mainloop()
@@ -0,0 +1,148 @@
+import os
+import re
+
+# Directorios que nunca contienen código del proyecto (control de versiones, herramientas, dependencias)
+DEFAULT_IGNORED_DIRS = frozenset(('.git', '.svn', '.hg', '.gradle', '.idea', 'node_modules', '__pycache__'))
+
+# Salidas de compilación: solo se ignoran fuera de un árbol src/ (un paquete Java puede llamarse "build")
+BUILD_OUTPUT_DIRS = frozenset(('target', 'build'))
+
+
+def glob_to_regex(pattern):
+    """Convierte un patrón estilo .gitignore (sin '/' inicial ni final) en una expresión regular"""
+    parts = []
+    i = 0
+    length = len(pattern)
+    while i < length:
+        char = pattern[i]
+        if char == '*':
+            if pattern.startswith('**/', i):
+                parts.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern.startswith('**', i):
+                parts.append('.*')
+                i += 2
+                continue
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                content = pattern[i + 1:end]
+                if content.startswith('!'):
+                    content = '^' + content[1:]
+                parts.append(f"[{content}]")
+                i = end
+        elif char == '\\' and i + 1 < length:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return re.compile(''.join(parts) + r'\Z')
+
+
+class IgnoreRule:
+    """Una línea de .gitignore (o un glob del usuario) relativa al directorio que la define"""
+    __slots__ = ('base', 'regex', 'negate', 'dir_only', 'anchored')
+
+    def __init__(self, base, pattern):
+        self.base = base                      # Directorio relativo a la raíz del recorrido ('' = raíz)
+        self.negate = pattern.startswith('!')
+        if self.negate:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+        # Con '/' al inicio o en medio el patrón se evalúa contra la ruta completa desde base
+        self.anchored = '/' in pattern
+        self.regex = glob_to_regex(pattern.lstrip('/'))
+
+    def matches(self, rel_path, name, is_dir):
+        if self.dir_only and not is_dir:
+            return False
+        if self.base:
+            if not rel_path.startswith(self.base + '/'):
+                return False
+            rel_path = rel_path[len(self.base) + 1:]
+        if self.anchored:
+            return self.regex.match(rel_path) is not None
+        return self.regex.match(name) is not None
+
+
+def parse_ignore_lines(lines, base=''):
+    rules = []
+    for line in lines:
+        line = line.rstrip('\n').rstrip('\r')
+        if not line.strip() or line.startswith('#'):
+            continue
+        if not line.endswith('\\ '):
+            line = line.rstrip()
+        rules.append(IgnoreRule(base, line))
+    return rules
+
+
+def read_gitignore(directory, base=''):
+    try:
+        with open(os.path.join(directory, '.gitignore'), 'r', encoding='utf-8', errors='ignore') as f:
+            return parse_ignore_lines(f, base)
+    except OSError:
+        return []
+
+
+def is_ignored(rules, rel_path, name, is_dir):
+    # Como en git, la última regla que coincide decide (las negadas vuelven a incluir)
+    ignored = False
+    for rule in rules:
+        if rule.negate == ignored and rule.matches(rel_path, name, is_dir):
+            ignored = not rule.negate
+    return ignored
+
+
+def walk(top, ignore_globs=(), use_gitignore=True, ignored_dirs=DEFAULT_IGNORED_DIRS):
+    """os.walk(top) que poda los directorios ignorados antes de descender en ellos.
+
+    Se ignoran los directorios de ignored_dirs, las salidas de compilación fuera de src/,
+    las reglas de los .gitignore encontrados durante el recorrido y los globs de
+    ignore_globs (misma sintaxis que .gitignore, relativos a top). Los archivos ignorados
+    tampoco se devuelven. El llamador puede seguir podando dirs[:] como con os.walk.
+    """
+    base_rules = parse_ignore_lines(ignore_globs)
+    rules_by_dir = {top: base_rules}
+    for root, dirs, files in os.walk(top):
+        rules = rules_by_dir.pop(root, base_rules)
+        rel_root = os.path.relpath(root, top).replace(os.sep, '/')
+        if rel_root == '.':
+            rel_root = ''
+        if use_gitignore and '.gitignore' in files:
+            rules = rules + read_gitignore(root, rel_root)
+
+        in_sources = 'src' in rel_root.split('/')
+        prefix = rel_root + '/' if rel_root else ''
+        kept = []
+        for name in dirs:
+            if name in ignored_dirs or (name in BUILD_OUTPUT_DIRS and not in_sources):
+                continue
+            if rules and is_ignored(rules, prefix + name, name, True):
+                continue
+            kept.append(name)
+            rules_by_dir[os.path.join(root, name)] = rules
+        dirs[:] = kept
+        if rules:
+            files[:] = [name for name in files if not is_ignored(rules, prefix + name, name, False)]
+        yield root, dirs, files
+        if len(dirs) != len(kept):
+            # El llamador podó más directorios: no se visitarán
+            for name in set(kept).difference(dirs):
+                rules_by_dir.pop(os.path.join(root, name), None)
+
+
+def iter_files(top, extension=None, **options):
+    """Rutas completas de los archivos no ignorados bajo top, opcionalmente filtradas por extensión"""
+    for root, dirs, files in walk(top, **options):
+        for name in files:
+            if extension is None or name.endswith(extension):
+                yield os.path.join(root, name)
@@ -0,0 +1,1681 @@
+import os
+import sys
+import json
+import argparse
+import yaml
+import re
+import hashlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+import Scanutils
+import Buildmodel
+
+class ProjectInventory:
+    """Inventario de archivos del proyecto construido con un único recorrido del disco"""
+
+    def __init__(self, root, ignore_globs=()):
+        self.root = root
+        self.ignore_globs = tuple(ignore_globs)
+        self.files = []            # Rutas completas en orden de recorrido (igual que os.walk)
+        self.by_name = {}          # nombre de archivo -> [índices en self.files]
+        self.by_lower_name = {}    # nombre en minúsculas -> [índices]
+        self.by_extension = {}     # extensión en minúsculas ('.java', '.xml', ...) -> [índices]
+        self.by_directory = {}     # directorio -> [índices]
+        self.dirs = {}             # directorio -> (subdirectorios, archivos)
+        self._pattern_cache = {}
+        self._scan()
+
+    def _scan(self):
+        # Recorrido top-down que no desciende en .git, node_modules, target, etc. ni en lo ignorado
+        for current, subdirs, files in Scanutils.walk(self.root, self.ignore_globs):
+            self.dirs[current] = (subdirs, files)
+            for name in files:
+                index = len(self.files)
+                self.files.append(os.path.join(current, name))
+                self.by_name.setdefault(name, []).append(index)
+                self.by_lower_name.setdefault(name.lower(), []).append(index)
+                self.by_extension.setdefault(os.path.splitext(name)[1].lower(), []).append(index)
+                self.by_directory.setdefault(current, []).append(index)
+
+    def find(self, filename_pattern):
+        """Archivos cuyo nombre contiene el patrón (sin distinguir mayúsculas)"""
+        pattern = filename_pattern.lower()
+        if pattern not in self._pattern_cache:
+            indices = []
+            for lower_name, name_indices in self.by_lower_name.items():
+                if pattern in lower_name:
+                    indices.extend(name_indices)
+            indices.sort()
+            self._pattern_cache[pattern] = [self.files[i] for i in indices]
+        return list(self._pattern_cache[pattern])
+
+    def named(self, filename):
+        """Archivos con exactamente ese nombre, en orden de recorrido"""
+        return [self.files[i] for i in self.by_name.get(filename, [])]
+
+    def with_extension(self, extension):
+        return [self.files[i] for i in self.by_extension.get(extension.lower(), [])]
+
+    def walk(self, top):
+        """Equivalente en memoria de os.walk(top) sobre el inventario"""
+        if top not in self.dirs:
+            return
+        stack = [top]
+        while stack:
+            current = stack.pop()
+            subdirs, files = self.dirs[current]
+            yield current, list(subdirs), list(files)
+            for name in reversed(subdirs):
+                child = os.path.join(current, name)
+                if child in self.dirs:
+                    stack.append(child)
+
+class JavaSourceFile:
+    """Datos extraídos de un archivo .java al cargarlo; el contenido no se conserva"""
+    __slots__ = ('path', 'package', 'type_name', 'annotations', 'imports',
+                 'controller', 'security_config', 'entity', 'repository')
+
+    def __init__(self, path, package, type_name, annotations, imports,
+                 controller=None, security_config=None, entity=None, repository=None):
+        self.path = path
+        self.package = package
+        self.type_name = type_name
+        self.annotations = annotations
+        self.imports = imports
+        self.controller = controller              # ControllerInfo si es un controlador
+        self.security_config = security_config    # SecurityConfigInfo si es una configuración de seguridad
+        self.entity = entity                      # EntityInfo si es una entidad JPA
+        self.repository = repository              # RepositoryInfo si es un repositorio
+
+    def has_annotation(self, name):
+        return name in self.annotations
+
+    def to_facts(self):
+        """Datos del archivo serializables a JSON (se guardan en la caché de análisis)"""
+        return {
+            "package": self.package,
+            "type_name": self.type_name,
+            "annotations": sorted(self.annotations),
+            "imports": list(self.imports),
+            "controller": asdict(self.controller) if self.controller else None,
+            "security_config": asdict(self.security_config) if self.security_config else None,
+            "entity": asdict(self.entity) if self.entity else None,
+            "repository": asdict(self.repository) if self.repository else None,
+        }
+
+    @classmethod
+    def from_facts(cls, path, facts):
+        controller = facts["controller"]
+        security_config = facts["security_config"]
+        entity = facts["entity"]
+        repository = facts["repository"]
+        return cls(
+            path,
+            facts["package"],
+            facts["type_name"],
+            frozenset(facts["annotations"]),
+            tuple(facts["imports"]),
+            ControllerInfo(**controller) if controller else None,
+            SecurityConfigInfo(**security_config) if security_config else None,
+            EntityInfo(**entity) if entity else None,
+            RepositoryInfo(**repository) if repository else None
+        )
+
+class SourceScan:
+    """Resultado de escanear un archivo: tokens encontrados con su posición y conteo"""
+    __slots__ = ('events', 'counts')
+
+    def __init__(self, events):
+        self.events = events       # [(posición, token)] en orden de aparición
+        self.counts = {}
+        for position, token in events:
+            self.counts[token] = self.counts.get(token, 0) + 1
+
+    def has(self, token):
+        return token in self.counts
+
+    def count(self, *tokens):
+        return sum(self.counts.get(token, 0) for token in tokens)
+
+    def positions(self, token):
+        return [position for position, found in self.events if found == token]
+
+class SourceScanner:
+    """Escáner compilado de anotaciones y palabras clave: una sola pasada por archivo.
+
+    Todas las alternativas van en una única expresión regular. Tokens producidos:
+      '@Nombre'    cada anotación (último segmento si está calificada)
+      '@Nombre()'  la anotación seguida de argumentos entre paréntesis
+      palabra      cada palabra clave de keywords (sensible a mayúsculas)
+      palabra      cada palabra clave de ci_keywords, en minúsculas y sin distinguir mayúsculas
+    Una palabra clave consume su texto: las que contienen a otras o comparten posición de
+    inicio declaran en implies los tokens adicionales que representan.
+    """
+
+    def __init__(self, keywords, ci_keywords=(), implies=None):
+        self.keywords = frozenset(keywords)
+        self.implies = implies or {}
+        # Ninguna alternativa empieza con un grupo o una clase de caracteres: así re salta
+        # directamente a los posibles caracteres iniciales en lugar de probar cada posición
+        alternatives = [re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)]
+        for keyword in ci_keywords:
+            for first in sorted({keyword[0].lower(), keyword[0].upper()}):
+                alternatives.append(re.escape(first) + '(?i:' + re.escape(keyword[1:]) + ')')
+        # El nombre y los argumentos se leen por adelantado para seguir buscando palabras clave dentro
+        alternatives.append(r'@(?<![\w.]@)(?=(?!interface\b)((?:\w+\.)*\w+)(\([^)]*\))?)')
+        self.pattern = re.compile('|'.join(alternatives))
+
+    def scan(self, content):
+        events = []
+        append = events.append
+        keywords = self.keywords
+        implies = self.implies
+        for match in self.pattern.finditer(content):
+            position = match.start()
+            text = match.group()
+            if text == '@':
+                name = '@' + match.group(1).rsplit('.', 1)[-1]
+                append((position, name))
+                if match.group(2) is not None:
+                    append((position, name + '()'))
+            elif text in keywords:
+                append((position, text))
+                for token in implies.get(text, ()):
+                    append((position, token))
+            else:
+                append((position, text.lower()))
+        return SourceScan(events)
+
+class JavaSourceCorpus:
+    """Fuentes Java del proyecto leídas una sola vez; las secciones de análisis lo consultan"""
+
+    PACKAGE_PATTERN = re.compile(r'^\s*package\s+([\w.]+)\s*;', re.MULTILINE)
+    TYPE_PATTERN = re.compile(r'\b(?:class|interface|enum|record)\s+(\w+)')
+    IMPORT_PATTERN = re.compile(r'^\s*import\s+(?:static\s+)?([\w.]+(?:\.\*)?)\s*;', re.MULTILINE)
+
+    CONTROLLER_ANNOTATIONS = frozenset(('RestController', 'Controller', 'ControllerAdvice', 'RestControllerAdvice'))
+    SECURITY_KEYWORDS = ('SpringSecurity', 'WebSecurityConfigurerAdapter', '@EnableWebSecurity', 'SecurityConfig',
+                         'JWT', 'OAuth2', 'Authentication', 'Authorization')
+    REPOSITORY_TYPES = ('JpaRepository', 'CrudRepository', 'PagingAndSortingRepository')
+    MAPPING_CALLS = frozenset(f"@{name}()" for name in ('RequestMapping', 'GetMapping', 'PostMapping',
+                                                        'PutMapping', 'DeleteMapping', 'PatchMapping'))
+    SWAGGER_CALLS = tuple(f"@{name}()" for name in ('Api', 'Operation', 'Tag', 'ApiResponse', 'ApiParam'))
+    VALIDATION_CALLS = tuple(f"@{name}()" for name in ('Valid', 'NotNull', 'NotBlank', 'NotEmpty', 'Size',
+                                                       'Min', 'Max', 'Email', 'Pattern'))
+    EXCEPTION_CALLS = tuple(f"@{name}()" for name in ('ExceptionHandler', 'ControllerAdvice', 'RestControllerAdvice'))
+    JPA_CALLS = tuple(f"@{name}()" for name in ('Entity', 'Table', 'Id', 'GeneratedValue', 'Column',
+                                                'OneToMany', 'ManyToOne', 'ManyToMany', 'OneToOne'))
+    RELATIONSHIPS = ("OneToMany", "ManyToOne", "ManyToMany", "OneToOne")
+
+    # Un único escáner para todos los detectores; añadir uno nuevo no añade pasadas por archivo
+    SCANNER = SourceScanner(
+        keywords=('SpringSecurity', 'SpringSecurityConfig', 'WebSecurityConfigurerAdapter',
+                  'extends WebSecurityConfigurerAdapter', 'SecurityConfig', 'JWT', 'OAuth2',
+                  'BasicAuthentication', 'Authentication', 'Authorization',
+                  'JpaRepository', 'CrudRepository', 'PagingAndSortingRepository',
+                  'csrf().disable()', 'csrf().enable()', 'csrf()'),
+        ci_keywords=('jwt', 'oauth', 'ldap', 'basic'),
+        implies={
+            'SpringSecurityConfig': ('SpringSecurity', 'SecurityConfig'),
+            'WebSecurityConfigurerAdapter': ('SecurityConfig',),
+            'extends WebSecurityConfigurerAdapter': ('WebSecurityConfigurerAdapter', 'SecurityConfig'),
+            'JWT': ('jwt',),
+            'OAuth2': ('oauth',),
+            'BasicAuthentication': ('basic', 'Authentication'),
+            'csrf().disable()': ('csrf()',),
+            'csrf().enable()': ('csrf()',),
+        }
+    )
+
+    def __init__(self, root, paths, cache=None):
+        self.root = root
+        self.files = []
+        self.by_path = {}
+        self.by_annotation = {}
+        for path in paths:
+            self.add(path, cache)
+
+    def add(self, path, cache=None):
+        loaded = load_java_source(path, cache.get(path) if cache is not None else None)
+        return self.add_loaded(path, loaded, cache)
+
+    def add_loaded(self, path, loaded, cache=None):
+        """Incorpora el resultado de load_java_source y lo registra en la caché"""
+        if loaded is None:
+            return None
+        source, entry, reused = loaded
+        if cache is not None:
+            cache.record(path, entry, reused)
+        return self.add_source(source)
+
+    def add_source(self, source):
+        self.files.append(source)
+        self.by_path[source.path] = source
+        for annotation in source.annotations:
+            self.by_annotation.setdefault(annotation, []).append(source)
+        return source
+
+    @classmethod
+    def parse(cls, path, content):
+        package_match = cls.PACKAGE_PATTERN.search(content)
+        type_match = cls.TYPE_PATTERN.search(content)
+        scan = cls.SCANNER.scan(content)
+        annotations = frozenset(token[1:] for token in scan.counts if token[0] == '@' and not token.endswith('()'))
+        imports = tuple(cls.IMPORT_PATTERN.findall(content))
+        source = JavaSourceFile(
+            path,
+            package_match.group(1) if package_match else "",
+            type_match.group(1) if type_match else os.path.splitext(os.path.basename(path))[0],
+            annotations,
+            imports
+        )
+        
+        if not annotations.isdisjoint(cls.CONTROLLER_ANNOTATIONS):
+            source.controller = cls.parse_controller(path, scan)
+        if (any(scan.has(keyword) for keyword in cls.SECURITY_KEYWORDS) and
+                ('Configuration' in annotations or 'EnableWebSecurity' in annotations or
+                 scan.has('WebSecurityConfigurerAdapter') or scan.has('SecurityConfig'))):
+            source.security_config = cls.parse_security_config(path, scan)
+        if 'Entity' in annotations or 'Table' in annotations:
+            source.entity = cls.parse_entity(path, scan)
+        elif 'Repository' in annotations or any(scan.has(base) for base in cls.REPOSITORY_TYPES):
+            source.repository = cls.parse_repository(path, scan)
+        return source
+
+    @classmethod
+    def parse_controller(cls, path, scan):
+        controller = ControllerInfo(path=path)
+
+        # Anotaciones de mapeo en orden de aparición
+        controller.endpoints = [token[1:-2] for position, token in scan.events if token in cls.MAPPING_CALLS]
+
+        # Swagger/OpenAPI, validaciones y manejo de excepciones
+        controller.swagger_annotations = scan.count(*cls.SWAGGER_CALLS)
+        controller.validation_annotations = scan.count(*cls.VALIDATION_CALLS)
+        controller.exception_handlers = scan.count(*cls.EXCEPTION_CALLS)
+        return controller
+
+    @staticmethod
+    def parse_security_config(path, scan):
+        config = SecurityConfigInfo(path=path)
+
+        # Detectar tipo de seguridad
+        if scan.has('extends WebSecurityConfigurerAdapter'):
+            config.security_style = "WebSecurityConfigurerAdapter"
+        elif scan.has('@EnableWebSecurity'):
+            config.security_style = "EnableWebSecurity"
+
+        # Detectar mecanismos de autenticación (palabras clave sin distinguir mayúsculas)
+        for keyword, mechanism in (('jwt', "JWT"), ('oauth', "OAuth2"), ('ldap', "LDAP"), ('basic', "HTTP Basic")):
+            if scan.has(keyword):
+                config.auth_mechanisms.append(mechanism)
+
+        # Detectar autorización
+        config.method_security = scan.has('@EnableGlobalMethodSecurity')
+
+        # Detectar CSRF
+        if scan.has('csrf().disable()'):
+            config.csrf = "disabled"
+        elif scan.has('csrf()'):
+            config.csrf = "enabled"
+        return config
+
+    @classmethod
+    def parse_entity(cls, path, scan):
+        entity = EntityInfo(path=path)
+        entity.jpa_annotations = scan.count(*cls.JPA_CALLS)
+        entity.relationships = [relationship for relationship in cls.RELATIONSHIPS if scan.has('@' + relationship)]
+        return entity
+
+    @classmethod
+    def parse_repository(cls, path, scan):
+        repo = RepositoryInfo(path=path)
+
+        # Detectar tipo de repositorio
+        for repository_type in cls.REPOSITORY_TYPES:
+            if scan.has(repository_type):
+                repo.repository_type = repository_type
+                break
+
+        # Detectar consultas personalizadas
+        repo.custom_queries = scan.count('@Query()')
+        return repo
+
+    def with_annotations(self, *names):
+        """Archivos que declaran alguna de las anotaciones, en orden de carga"""
+        wanted = set(names)
+        return [source for source in self.files if not source.annotations.isdisjoint(wanted)]
+
+def load_java_source(path, cached=None):
+    """Carga un .java reutilizando la entrada de caché si el archivo no cambió.
+
+    Devuelve (JavaSourceFile, entrada de caché actualizada, reutilizado) o None si no se
+    puede leer. Con mtime y tamaño iguales no se abre el archivo; si difieren pero el hash
+    del contenido coincide se reutilizan los datos sin volver a analizarlo.
+    """
+    try:
+        stat = os.stat(path)
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            return JavaSourceFile.from_facts(path, cached["facts"]), cached, True
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    
+    digest = hashlib.sha1(data).hexdigest()
+    if cached and cached["sha1"] == digest:
+        facts = cached["facts"]
+        source = JavaSourceFile.from_facts(path, facts)
+        reused = True
+    else:
+        source = JavaSourceCorpus.parse(path, data.decode('utf-8', errors='ignore'))
+        facts = source.to_facts()
+        reused = False
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha1": digest, "facts": facts}
+    return source, entry, reused
+
+def default_cache_dir():
+    return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                        'springanalyzer')
+
+class AnalysisCache:
+    """Caché persistente (un archivo JSON por proyecto) con los datos extraídos de cada fuente Java"""
+
+    VERSION = 2
+
+    def __init__(self, project_path, cache_dir=None):
+        self.project = os.path.abspath(project_path)
+        key = hashlib.sha1(self.project.encode('utf-8')).hexdigest()
+        self.path = os.path.join(cache_dir or default_cache_dir(), f"{key}.json")
+        self.entries = {}
+        self.seen = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == self.VERSION and data.get("project") == self.project:
+            self.entries = data.get("files", {})
+
+    def get(self, path):
+        return self.entries.get(path)
+
+    def record(self, path, entry, reused):
+        self.seen[path] = entry
+        if reused:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def save(self):
+        """Guarda solo las entradas de los archivos vistos en este análisis (los borrados se descartan)"""
+        if not self.seen:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"version": self.VERSION, "project": self.project, "files": self.seen}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # La caché es opcional: si no se puede escribir el análisis sigue siendo válido
+            pass
+        self.entries = self.seen
+
+# --- Modelo de resultados ---
+# Cada sección devuelve un dataclass serializable a JSON; el texto del reporte se genera
+# al final con render(), sin volver a analizar cadenas.
+
+class SectionResult:
+    """Base de los resultados de sección"""
+    __slots__ = ()
+
+    def to_dict(self):
+        return asdict(self)
+
+    def render(self):
+        return "".join(self.render_parts())
+
+    def render_parts(self):
+        return []
+
+def _no_java_dirs(title):
+    return [f"=== {title} ===\n\n", "No se encontraron directorios Java en el proyecto.\n"]
+
+@dataclass(slots=True)
+class GeneralContextResult(SectionResult):
+    is_microservices: bool = False
+    deployment_methods: list = field(default_factory=list)
+    domains: list = field(default_factory=list)
+
+    def render_parts(self):
+        parts = ["=== CONTEXTO GENERAL DEL PROYECTO ===\n\n"]
+        parts.append("Tipo de arquitectura: Microservicios\n" if self.is_microservices else "Tipo de arquitectura: Monolito\n")
+        if self.deployment_methods:
+            parts.append(f"Métodos de despliegue detectados: {', '.join(self.deployment_methods)}\n")
+        else:
+            parts.append("No se detectaron métodos de despliegue específicos (Docker/Kubernetes)\n")
+        if self.domains:
+            parts.append(f"Dominios detectados: {', '.join(self.domains)}\n")
+        parts.append("\n")
+        return parts
+
+@dataclass(slots=True)
+class ConfigFileInfo:
+    path: str
+    active_profiles: Optional[str] = None
+    server_port: Optional[str] = None
+    datasource_url: Optional[str] = None
+    error: Optional[str] = None
+
+@dataclass(slots=True)
+class ConfigurationResult(SectionResult):
+    files: list = field(default_factory=list)
+
+    def render_parts(self):
+        parts = ["=== CONFIGURACIÓN BASE ===\n\n"]
+        if not self.files:
+            parts.append("No se encontraron archivos de configuración principales.\n")
+            return parts
+        for config in self.files:
+            parts.append(f"Archivo de configuración: {config.path}\n")
+            if config.active_profiles is not None:
+                parts.append(f"Perfiles activos: {config.active_profiles}\n")
+            if config.server_port is not None:
+                parts.append(f"Puerto del servidor: {config.server_port}\n")
+            if config.datasource_url is not None:
+                parts.append(f"URL de base de datos: {config.datasource_url}\n")
+            if config.error is not None:
+                parts.append(f"Error al leer el archivo de configuración: {config.error}\n")
+            parts.append("\n")
+        return parts
+
+@dataclass(slots=True)
+class BuildFileInfo:
+    path: str
+    build_tool: str
+    coordinates: Optional[str] = None
+    dependencies: list = field(default_factory=list)
+    plugins: list = field(default_factory=list)
+    error: Optional[str] = None
+
+@dataclass(slots=True)
+class DependenciesResult(SectionResult):
+    build_files: list = field(default_factory=list)
+
+    def render_parts(self):
+        parts = ["=== GESTIÓN DE DEPENDENCIAS ===\n\n"]
+        if not self.build_files:
+            parts.append("No se encontraron archivos de gestión de dependencias.\n")
+            return parts
+        for build_file in self.build_files:
+            parts.append(f"Archivo de dependencias: {build_file.path}\n")
+            if build_file.coordinates is not None:
+                parts.append(f"Proyecto: {build_file.coordinates}\n\n")
+            if build_file.dependencies:
+                parts.append("Dependencias principales:\n")
+                for dep in build_file.dependencies[:10]:  # Mostrar solo las primeras 10
+                    parts.append(f"  - {dep}\n")
+            if build_file.plugins:
+                parts.append("\nPlugins detectados:\n")
+                for plugin in build_file.plugins[:5]:  # Mostrar solo los primeros 5
+                    parts.append(f"  - {plugin}\n")
+            if build_file.error is not None:
+                parts.append(f"Error al analizar el archivo de dependencias: {build_file.error}\n")
+            parts.append("\n")
+        return parts
+
+@dataclass(slots=True)
+class ArchitectureResult(SectionResult):
+    has_java_dirs: bool = False
+    package_tree: list = field(default_factory=list)      # [nivel, nombre del directorio]
+    layers: dict = field(default_factory=dict)
+    package_counts: dict = field(default_factory=dict)
+
+    def render_parts(self):
+        if not self.has_java_dirs:
+            return _no_java_dirs("ARQUITECTURA DEL CÓDIGO")
+        parts = ["=== ARQUITECTURA DEL CÓDIGO ===\n\n", "Estructura de paquetes detectada:\n"]
+        for level, name in self.package_tree:
+            parts.append(f"{'  ' * level}{name}/\n")
+        parts.append("\nPatrones detectados:\n")
+        for layer, count in self.layers.items():
+            if count > 0:
+                parts.append(f"  - {layer.capitalize()}: {count} archivos\n")
+        if self.package_counts:
+            parts.append("\nBounded contexts/dominios detectados:\n")
+            for package, count in sorted(self.package_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+                parts.append(f"  - {package}: {count} clases\n")
+        parts.append("\n")
+        return parts
+
+@dataclass(slots=True)
+class ControllerInfo:
+    path: str
+    endpoints: list = field(default_factory=list)
+    swagger_annotations: int = 0
+    validation_annotations: int = 0
+    exception_handlers: int = 0
+
+@dataclass(slots=True)
+class ControllersResult(SectionResult):
+    has_java_dirs: bool = False
+    controller_count: int = 0
+    controllers: list = field(default_factory=list)       # Detalle de los primeros 5
+
+    def render_parts(self):
+        if not self.has_java_dirs:
+            return _no_java_dirs("CONTROLADORES REST")
+        parts = ["=== CONTROLADORES REST ===\n\n"]
+        if not self.controller_count:
+            parts.append("No se encontraron controladores REST.\n")
+            return parts
+        parts.append(f"Se encontraron {self.controller_count} controladores:\n\n")
+        for controller in self.controllers:
+            parts.append(f"Controlador: {os.path.basename(controller.path)}\n")
+            if controller.endpoints:
+                parts.append("  Endpoints detectados:\n")
+                for mapping in controller.endpoints[:10]:  # Mostrar solo los primeros 10 endpoints
+                    parts.append(f"    - {mapping}\n")
+            if controller.swagger_annotations:
+                parts.append(f"  Documentación: Swagger/OpenAPI detectado ({controller.swagger_annotations} anotaciones)\n")
+            if controller.validation_annotations:
+                parts.append(f"  Validaciones: {controller.validation_annotations} anotaciones de validación detectadas\n")
+            if controller.exception_handlers:
+                parts.append(f"  Manejo de excepciones: {controller.exception_handlers} manejadores detectados\n")
+            parts.append("\n")
+        return parts
+
+@dataclass(slots=True)
+class SecurityConfigInfo:
+    path: str
+    security_style: Optional[str] = None      # "WebSecurityConfigurerAdapter" o "EnableWebSecurity"
+    auth_mechanisms: list = field(default_factory=list)
+    method_security: bool = False
+    csrf: Optional[str] = None                # "disabled" o "enabled"
+
+@dataclass(slots=True)
+class SecurityResult(SectionResult):
+    has_java_dirs: bool = False
+    build_errors: list = field(default_factory=list)
+    dependencies: list = field(default_factory=list)
+    config_count: int = 0
+    configs: list = field(default_factory=list)           # Detalle de las primeras 3
+    property_errors: list = field(default_factory=list)
+    properties: list = field(default_factory=list)
+
+    @property
+    def csrf_disabled(self):
+        return any(config.csrf == "disabled" for config in self.configs)
+
+    @property
+    def uses_spring_security(self):
+        if any(config.security_style or config.auth_mechanisms for config in self.configs):
+            return True
+        return any("JWT" in line or "OAuth2" in line for line in self.dependencies + self.properties)
+
+    def render_parts(self):
+        if not self.has_java_dirs:
+            return _no_java_dirs("SEGURIDAD Y AUTENTICACIÓN")
+        parts = ["=== SEGURIDAD Y AUTENTICACIÓN ===\n\n"]
+        for error in self.build_errors:
+            parts.append(f"Error al analizar dependencias de seguridad: {error}\n")
+        if self.dependencies:
+            parts.append("Dependencias de seguridad detectadas:\n")
+            for dep in self.dependencies:
+                parts.append(f"  - {dep}\n")
+            parts.append("\n")
+        if self.config_count:
+            parts.append(f"Se encontraron {self.config_count} configuraciones de seguridad:\n")
+            for config in self.configs:
+                parts.append(f"  - {os.path.basename(config.path)}\n")
+                if config.security_style == "WebSecurityConfigurerAdapter":
+                    parts.append("    Tipo: Spring Security tradicional (WebSecurityConfigurerAdapter)\n")
+                elif config.security_style == "EnableWebSecurity":
+                    parts.append("    Tipo: Spring Security (nueva configuración DSL)\n")
+                if config.auth_mechanisms:
+                    parts.append(f"    Mecanismos de autenticación: {', '.join(config.auth_mechanisms)}\n")
+                if config.method_security:
+                    parts.append("    Seguridad a nivel de método: Habilitada\n")
+                if config.csrf == "disabled":
+                    parts.append("    ⚠️  CSRF: Deshabilitado (posible vulnerabilidad)\n")
+                elif config.csrf == "enabled":
+                    parts.append("    CSRF: Habilitado\n")
+            parts.append("\n")
+        for error in self.property_errors:
+            parts.append(f"Error al analizar configuraciones de seguridad: {error}\n")
+        if self.properties:
+            parts.append("Configuraciones de seguridad en archivos de propiedades:\n")
+            for prop in self.properties[:10]:  # Mostrar solo las primeras 10
+                parts.append(f"  - {prop}\n")
+        if not self.config_count and not self.dependencies and not self.properties:
+            parts.append("No se detectaron configuraciones de seguridad específicas.\n")
+        parts.append("\n")
+        return parts
+
+@dataclass(slots=True)
+class EntityInfo:
+    path: str
+    jpa_annotations: int = 0
+    relationships: list = field(default_factory=list)
+
+@dataclass(slots=True)
+class RepositoryInfo:
+    path: str
+    repository_type: Optional[str] = None
+    custom_queries: int = 0
+
+@dataclass(slots=True)
+class PersistenceResult(SectionResult):
+    has_java_dirs: bool = False
+    entity_count: int = 0
+    repository_count: int = 0
+    entities: list = field(default_factory=list)          # Detalle de las primeras 3
+    repositories: list = field(default_factory=list)      # Detalle de los primeros 3
+    migration_tools: list = field(default_factory=list)
+    config_errors: list = field(default_factory=list)
+    db_configs: list = field(default_factory=list)
+
+    def render_parts(self):
+        if not self.has_java_dirs:
+            return _no_java_dirs("PERSISTENCIA Y BASE DE DATOS")
+        parts = ["=== PERSISTENCIA Y BASE DE DATOS ===\n\n"]
+        parts.append(f"Se encontraron {self.entity_count} entidades y {self.repository_count} repositorios.\n\n")
+        if self.entities:
+            parts.append("Ejemplo de entidades detectadas:\n")
+            for entity in self.entities:
+                parts.append(f"  - {os.path.basename(entity.path)}\n")
+                if entity.jpa_annotations:
+                    parts.append(f"    Anotaciones JPA: {entity.jpa_annotations} detectadas\n")
+                if entity.relationships:
+                    parts.append(f"    Relaciones: {', '.join(entity.relationships)} detectadas\n")
+            parts.append("\n")
+        if self.repositories:
+            parts.append("Ejemplo de repositorios detectados:\n")
+            for repo in self.repositories:
+                parts.append(f"  - {os.path.basename(repo.path)}\n")
+                if repo.repository_type:
+                    parts.append(f"    Tipo: {repo.repository_type}\n")
+                if repo.custom_queries:
+                    parts.append(f"    Consultas personalizadas: {repo.custom_queries} detectadas\n")
+            parts.append("\n")
+        if self.migration_tools:
+            parts.append(f"Herramientas de migración detectadas: {', '.join(self.migration_tools)}\n")
+        for error in self.config_errors:
+            parts.append(f"Error al analizar configuraciones de base de datos: {error}\n")
+        if self.db_configs:
+            parts.append("Configuraciones de base de datos:\n")
+            for config in self.db_configs[:10]:  # Mostrar solo las primeras 10
+                parts.append(f"  - {config}\n")
+        parts.append("\n")
+        return parts
+
+@dataclass(slots=True)
+class TestsResult(SectionResult):
+    has_test_dirs: bool = False
+    test_file_count: int = 0
+    distribution: dict = field(default_factory=dict)
+    build_errors: list = field(default_factory=list)
+    testing_tools: list = field(default_factory=list)
+    quality_tools: list = field(default_factory=list)
+    coverage_ratio: Optional[float] = None
+
+    @property
+    def low_coverage(self):
+        return self.coverage_ratio is not None and self.coverage_ratio < 0.5
+
+    def render_parts(self):
+        parts = ["=== PRUEBAS Y CALIDAD ===\n\n"]
+        if not self.has_test_dirs:
+            parts.append("No se encontraron directorios de pruebas.\n")
+            return parts
+        parts.append(f"Se encontraron {self.test_file_count} archivos de prueba.\n\n")
+        parts.append("Distribución de pruebas:\n")
+        for test_type, count in self.distribution.items():
+            if count > 0:
+                percentage = (count / self.test_file_count) * 100
+                parts.append(f"  - {test_type}: {count} archivos ({percentage:.1f}%)\n")
+        for error in self.build_errors:
+            parts.append(f"Error al analizar herramientas de testing: {error}\n")
+        if self.testing_tools:
+            parts.append(f"\nHerramientas de testing detectadas: {', '.join(self.testing_tools)}\n")
+        if self.quality_tools:
+            parts.append(f"Herramientas de calidad de código detectadas: {', '.join(self.quality_tools)}\n")
+        if self.coverage_ratio is not None:
+            parts.append(f"\nRatio pruebas/clases: {self.coverage_ratio:.2f} ")
+            if self.coverage_ratio >= 1.0:
+                parts.append("(Excelente cobertura)\n")
+            elif self.coverage_ratio >= 0.5:
+                parts.append("(Buena cobertura)\n")
+            else:
+                parts.append("(Cobertura baja)\n")
+        parts.append("\n")
+        return parts
+
+@dataclass(slots=True)
+class DevopsResult(SectionResult):
+    logging_configs: list = field(default_factory=list)
+    monitoring_tools: list = field(default_factory=list)
+    ci_cd_files: list = field(default_factory=list)
+    config_errors: list = field(default_factory=list)
+    properties: list = field(default_factory=list)
+
+    def render_parts(self):
+        parts = ["=== OBSERVABILIDAD Y DEVOPS ===\n\n"]
+        if self.logging_configs:
+            parts.append("Configuraciones de logging detectadas:\n")
+            for config in self.logging_configs:
+                parts.append(f"  - {os.path.basename(config)}\n")
+            parts.append("\n")
+        if self.monitoring_tools:
+            parts.append(f"Herramientas de monitoreo detectadas: {', '.join(self.monitoring_tools)}\n")
+        if self.ci_cd_files:
+            parts.append("\nConfiguraciones CI/CD detectadas:\n")
+            for file in self.ci_cd_files[:10]:  # Mostrar solo las primeras 10
+                parts.append(f"  - {os.path.basename(file)}\n")
+        for error in self.config_errors:
+            parts.append(f"Error al analizar configuraciones DevOps: {error}\n")
+        if self.properties:
+            parts.append("\nConfiguraciones DevOps en propiedades:\n")
+            for prop in self.properties[:10]:  # Mostrar solo las primeras 10
+                parts.append(f"  - {prop}\n")
+        parts.append("\n")
+        return parts
+
+MICROSERVICES_COMPARISON = """El proyecto sigue una arquitectura de microservicios.
+
+✅ Ventajas respecto a un monolito:
+  - Mejor escalabilidad horizontal por servicio
+  - Mayor independencia en el desarrollo y despliegue
+  - Tecnologías específicas por dominio
+  - Mayor tolerancia a fallos
+  - Equipos más autónomos y especializados
+
+⚠️ Desafíos:
+  - Mayor complejidad en la operación
+  - Necesidad de orquestación (Kubernetes, Docker Compose)
+  - Comunicación entre servicios más compleja
+  - Mayor overhead en transacciones distribuidas
+  - Mayor consumo de recursos
+  - Dificultad para debugging distribuido
+
+🔧 Recomendaciones para microservicios:
+  - Implementar API Gateway para un punto único de entrada
+  - Usar service discovery (Eureka, Consul)
+  - Implementar circuit breakers (Resilience4j, Hystrix)
+  - Centralizar la configuración (Spring Cloud Config)
+  - Implementar trazabilidad distribuida (Zipkin, Sleuth)
+"""
+
+MONOLITH_COMPARISON = """El proyecto sigue una arquitectura monolítica.
+
+✅ Ventajas respecto a microservicios:
+  - Menor complejidad operativa
+  - Desarrollo y testing más sencillos
+  - Transacciones ACID más fáciles de implementar
+  - Menor overhead de comunicación
+  - Debugging más simple
+  - Menor consumo de recursos
+
+⚠️ Desafíos:
+  - Escalabilidad limitada
+  - Acoplamiento más fuerte entre componentes
+  - Dificultad para adoptar tecnologías heterogéneas
+  - Despliegues más riesgosos
+  - Equipos menos autónomos
+
+🔧 Recomendaciones para monolitos:
+  - Modularizar el código siguiendo DDD y bounded contexts
+  - Implementar módulos bien definidos con interfaces claras
+  - Usar arquitectura hexagonal para desacoplar la lógica de negocio
+  - Considerar la migración gradual a microservicios si es necesario
+  - Implementar pruebas automatizadas robustas
+"""
+
+@dataclass(slots=True)
+class ComparisonResult(SectionResult):
+    is_microservices: bool = False
+
+    def render_parts(self):
+        return ["=== COMPARACIÓN CON ARQUITECTURA MONOLÍTICA ===\n\n",
+                MICROSERVICES_COMPARISON if self.is_microservices else MONOLITH_COMPARISON,
+                "\n"]
+
+# Secciones del análisis en orden de presentación: (clave del resultado, método del analizador)
+SECTIONS = [
+    ("configuracion", "analyze_configuration"),
+    ("dependencias", "analyze_dependencies"),
+    ("arquitectura", "analyze_architecture"),
+    ("controladores", "analyze_controllers"),
+    ("seguridad", "analyze_security"),
+    ("persistencia", "analyze_persistence"),
+    ("pruebas", "analyze_tests"),
+    ("devops", "analyze_devops"),
+]
+
+# Secciones que consultan el contenido de las fuentes Java
+CORPUS_SECTIONS = {"controladores", "seguridad", "persistencia"}
+
+# Estado de cada proceso del pool: el analizador con el inventario y el corpus ya cargados
+_worker_analyzer = None
+
+def _init_section_worker(analyzer):
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _run_section(method_name, project_path):
+    return getattr(_worker_analyzer, method_name)(project_path)
+
+class AnalysisCancelled(Exception):
+    """El análisis se detuvo porque se activó el evento de cancelación"""
+
+def _load_java_sources(items):
+    """Carga un bloque de (ruta, entrada de caché) de archivos .java dentro de un proceso del pool"""
+    return [(path, load_java_source(path, cached)) for path, cached in items]
+
+class SpringBootAnalyzer:
+    """Motor de análisis: ejecuta las secciones sobre un proyecto sin depender de la interfaz"""
+
+    def __init__(self, use_cache=True, cache_dir=None, ignore_globs=()):
+        self.inventory = None
+        self.corpus = None
+        self.poms = None
+        self.gradle = None
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.cache = None
+        self.ignore_globs = tuple(ignore_globs)   # Globs estilo .gitignore que no se recorren
+        self.progress = None
+        self.cancel_event = None
+    
+    def __getstate__(self):
+        # La caché en disco, el aviso de progreso y la cancelación solo existen en el proceso principal
+        state = self.__dict__.copy()
+        state['cache'] = None
+        state['progress'] = None
+        state['cancel_event'] = None
+        return state
+    
+    def run(self, project_path, sections=None, workers=None, progress=None, cancel_event=None):
+        """Ejecuta las secciones indicadas (todas por defecto) y devuelve analysis_results.
+
+        Con workers > 1 las secciones y la carga de fuentes Java se reparten en un
+        pool de procesos; el resultado es el mismo diccionario que en modo secuencial.
+        Las fuentes Java sin cambios desde el análisis anterior se toman de la caché en
+        disco; self.cache.hits y self.cache.misses indican cuántas se reutilizaron.
+
+        progress(evento, *datos) se invoca desde el hilo que ejecuta el análisis:
+          ("plan", total de archivos Java, claves de las secciones en orden)
+          ("archivos", archivos Java procesados, total)
+          ("seccion", clave, resultado)   en el orden de presentación
+        Si cancel_event (threading.Event) se activa, se lanza AnalysisCancelled y la
+        caché en disco no se modifica.
+        """
+        selected = [(key, method) for key, method in SECTIONS if sections is None or key in sections]
+        self.progress = progress
+        self.cancel_event = cancel_event
+        
+        try:
+            # Inventario de archivos construido una sola vez para todas las secciones
+            self.inventory = ProjectInventory(project_path, self.ignore_globs)
+            self.corpus = None
+            self.poms = None
+            self.gradle = None
+            self.cache = AnalysisCache(project_path, self.cache_dir) if self.use_cache else None
+            
+            if progress is not None:
+                java_total = 0
+                if any(key in CORPUS_SECTIONS for key, method in selected):
+                    java_total = len(self.find_java_sources(project_path))
+                keys = ["contexto_general"] + [key for key, method in selected] + ["comparacion"]
+                progress("plan", java_total, keys)
+            
+            analysis_results = {}
+            
+            # 1. Contexto General del Proyecto
+            self._add_section(analysis_results, "contexto_general", self.analyze_general_context(project_path))
+            
+            # 2-9. Secciones seleccionadas
+            if workers and workers > 1:
+                self._run_parallel(project_path, selected, workers, analysis_results)
+            else:
+                for key, method in selected:
+                    self.check_cancelled()
+                    self._add_section(analysis_results, key, getattr(self, method)(project_path))
+            
+            # 10. Comparación con Arquitectura Monolítica
+            self._add_section(analysis_results, "comparacion", self.compare_with_monolith(analysis_results))
+            
+            if self.cache is not None:
+                self.cache.save()
+            return analysis_results
+        finally:
+            self.progress = None
+            self.cancel_event = None
+    
+    def _add_section(self, analysis_results, key, result):
+        analysis_results[key] = result
+        self.notify("seccion", key, result)
+    
+    def notify(self, event, *payload):
+        if self.progress is not None:
+            self.progress(event, *payload)
+    
+    def check_cancelled(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise AnalysisCancelled("Análisis cancelado")
+    
+    def _run_parallel(self, project_path, selected, workers, analysis_results):
+        if any(key in CORPUS_SECTIONS for key, method in selected):
+            # Lectura y extracción de datos de los .java repartida por bloques
+            cache = self.cache
+            items = [(path, cache.get(path) if cache is not None else None)
+                     for path in self.find_java_sources(project_path)]
+            chunk_size = max(1, len(items) // (workers * 4))
+            chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+            corpus = JavaSourceCorpus(project_path, [])
+            done = 0
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for loaded_chunk in pool.map(_load_java_sources, chunks):
+                    self._cancel_pool(pool)
+                    for path, loaded in loaded_chunk:
+                        corpus.add_loaded(path, loaded, cache)
+                    done += len(loaded_chunk)
+                    self.notify("archivos", done, len(items))
+            self.corpus = corpus
+        
+        # Cada proceso recibe el analizador con el inventario y el corpus ya cargados
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_section_worker,
+                                 initargs=(self,)) as pool:
+            futures = [(key, pool.submit(_run_section, method, project_path)) for key, method in selected]
+            for key, future in futures:
+                self._cancel_pool(pool)
+                self._add_section(analysis_results, key, future.result())
+    
+    def _cancel_pool(self, pool):
+        # Descarta las tareas pendientes del pool antes de propagar la cancelación
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.check_cancelled()
+    
+    def analyze_general_context(self, project_path):
+        result = GeneralContextResult(is_microservices=self.is_microservices(project_path))
+
+        # Detectar archivos de despliegue
+        if self.find_files(project_path, "Dockerfile"):
+            result.deployment_methods.append("Docker")
+        if self.find_files(project_path, "docker-compose.yml") or self.find_files(project_path, "docker-compose.yaml"):
+            result.deployment_methods.append("Docker Compose")
+        if self.find_files(project_path, "kubernetes.yml") or self.find_files(project_path, "kubernetes.yaml") or self.find_files(project_path, "deployment.yml"):
+            result.deployment_methods.append("Kubernetes")
+
+        # Detectar dominio funcional (basado en nombres de paquetes)
+        result.domains = [os.path.basename(dir) for dir in self.find_java_directories(project_path)]
+        return result
+
+    def analyze_configuration(self, project_path):
+        result = ConfigurationResult()
+
+        # Buscar archivos de configuración
+        config_files = []
+        config_files.extend(self.find_files(project_path, "application.properties"))
+        config_files.extend(self.find_files(project_path, "application.yml"))
+        config_files.extend(self.find_files(project_path, "application.yaml"))
+
+        for config_file in config_files:
+            config = ConfigFileInfo(path=config_file)
+            result.files.append(config)
+
+            try:
+                if config_file.endswith('.properties'):
+                    with open(config_file, 'r') as f:
+                        content = f.read()
+                        # Detectar perfiles activos
+                        active_profiles = re.findall(r'spring\.profiles\.active=(.+)', content)
+                        if active_profiles:
+                            config.active_profiles = active_profiles[0]
+
+                        # Detectar puerto
+                        server_port = re.findall(r'server\.port=(\d+)', content)
+                        if server_port:
+                            config.server_port = server_port[0]
+
+                        # Detectar base de datos
+                        db_url = re.findall(r'spring\.datasource\.url=(.+)', content)
+                        if db_url:
+                            config.datasource_url = db_url[0]
+
+                elif config_file.endswith('.yml') or config_file.endswith('.yaml'):
+                    with open(config_file, 'r') as f:
+                        config_data = yaml.safe_load(f)
+                        if config_data:
+                            # Detectar perfiles activos
+                            if 'spring' in config_data and 'profiles' in config_data['spring'] and 'active' in config_data['spring']['profiles']:
+                                config.active_profiles = str(config_data['spring']['profiles']['active'])
+
+                            # Detectar puerto
+                            if 'server' in config_data and 'port' in config_data['server']:
+                                config.server_port = str(config_data['server']['port'])
+
+                            # Detectar base de datos
+                            if 'spring' in config_data and 'datasource' in config_data['spring'] and 'url' in config_data['spring']['datasource']:
+                                config.datasource_url = str(config_data['spring']['datasource']['url'])
+
+            except Exception as e:
+                config.error = str(e)
+
+        return result
+
+    def analyze_dependencies(self, project_path):
+        result = DependenciesResult()
+
+        # Buscar archivos de dependencias
+        build_files = self.find_build_files(project_path)
+
+        for build_file in build_files:
+            info = BuildFileInfo(path=build_file, build_tool="maven" if build_file.endswith('pom.xml') else "gradle")
+            result.build_files.append(info)
+
+            try:
+                if build_file.endswith('pom.xml'):
+                    pom = self.get_poms(project_path).get(build_file)
+                    if pom.error is not None:
+                        info.error = pom.error
+                        continue
+
+                    # Coordenadas, dependencias (incluidas las gestionadas) y plugins ya resueltos
+                    info.coordinates = pom.coordinates
+                    info.dependencies = [dep.coordinates for dep in pom.iter_dependencies()]
+                    info.plugins = [plugin.coordinates for plugin in pom.plugins]
+
+                else:
+                    gradle = self.get_gradle(project_path).get(build_file)
+                    if gradle.error is not None:
+                        info.error = gradle.error
+                        continue
+
+                    # Dependencias de todas las configuraciones, con el catálogo de versiones aplicado
+                    info.coordinates = gradle.coordinates
+                    info.dependencies = [dep.coordinates for dep in gradle.iter_dependencies()]
+                    info.plugins = [plugin.coordinates for plugin in gradle.plugins]
+
+            except Exception as e:
+                info.error = str(e)
+
+        return result
+
+    def analyze_architecture(self, project_path):
+        result = ArchitectureResult()
+
+        java_dirs = self.find_java_directories(project_path)
+        if not java_dirs:
+            return result
+        result.has_java_dirs = True
+
+        # Analizar estructura de paquetes
+        for java_dir in java_dirs:
+            for root, dirs, files in self.walk(java_dir):
+                # Calcular nivel de anidamiento
+                level = root.replace(java_dir, '').count(os.sep)
+                result.package_tree.append([level, os.path.basename(root)])
+
+        # Detectar capas comunes
+        layers = {"controller": 0, "service": 0, "repository": 0, "model": 0, "entity": 0, "dto": 0, "config": 0}
+
+        for java_dir in java_dirs:
+            for root, dirs, files in self.walk(java_dir):
+                for file in files:
+                    if file.endswith('.java'):
+                        file_path = os.path.join(root, file)
+                        for layer in layers:
+                            if layer in file_path.lower():
+                                layers[layer] += 1
+        result.layers = layers
+
+        # Detectar bounded contexts
+        for java_dir in java_dirs:
+            for root, dirs, files in self.walk(java_dir):
+                if files and any(f.endswith('.java') for f in files):
+                    package_name = root.replace(java_dir, '').replace(os.sep, '.')
+                    if package_name.startswith('.'):
+                        package_name = package_name[1:]
+                    if package_name:
+                        result.package_counts[package_name] = len([f for f in files if f.endswith('.java')])
+
+        return result
+
+    def analyze_controllers(self, project_path):
+        result = ControllersResult()
+
+        java_dirs = self.find_java_directories(project_path)
+        if not java_dirs:
+            return result
+        result.has_java_dirs = True
+
+        # Buscar controladores (los datos de cada uno se extraen al cargar el corpus)
+        controllers = [source.controller for source in self.get_corpus(project_path).files if source.controller]
+        result.controller_count = len(controllers)
+        result.controllers = controllers[:5]  # Analizar solo los primeros 5 controladores
+        return result
+
+    def analyze_security(self, project_path):
+        result = SecurityResult()
+
+        java_dirs = self.find_java_directories(project_path)
+        if not java_dirs:
+            return result
+        result.has_java_dirs = True
+
+        # Buscar configuraciones de seguridad
+        security_configs = [source.security_config for source in self.get_corpus(project_path).files
+                            if source.security_config]
+
+        # Buscar dependencias de seguridad en archivos de build
+        build_files = self.find_build_files(project_path)
+
+        security_dependencies = set()
+        for build_file in build_files:
+            try:
+                if build_file.endswith('pom.xml'):
+                    pom = self.get_poms(project_path).get(build_file)
+                    if pom.error is not None:
+                        result.build_errors.append(pom.error)
+                        continue
+
+                    # Buscar dependencias de seguridad
+                    for dep in pom.iter_dependencies():
+                        if dep.artifact_id and any(keyword in dep.artifact_id.lower() for keyword in ['security', 'jwt', 'oauth', 'auth', 'keycloak']):
+                            security_dependencies.add(f"{dep.group_id}:{dep.artifact_id}")
+
+                else:
+                    gradle = self.get_gradle(project_path).get(build_file)
+                    if gradle.error is not None:
+                        result.build_errors.append(gradle.error)
+                        continue
+
+                    # Buscar dependencias de seguridad
+                    for dep in gradle.iter_dependencies():
+                        if dep.artifact_id and any(keyword in dep.artifact_id.lower() for keyword in ['security', 'jwt', 'oauth', 'auth', 'keycloak']):
+                            security_dependencies.add(f"{dep.group_id}:{dep.artifact_id}")
+
+            except Exception as e:
+                result.build_errors.append(str(e))
+
+        result.dependencies = sorted(security_dependencies)
+
+        result.config_count = len(security_configs)
+        result.configs = security_configs[:3]  # Analizar solo las primeras 3 configuraciones
+
+        # Analizar archivos de propiedades para configuraciones de seguridad
+        config_files = []
+        config_files.extend(self.find_files(project_path, "application.properties"))
+        config_files.extend(self.find_files(project_path, "application.yml"))
+        config_files.extend(self.find_files(project_path, "application.yaml"))
+
+        for config_file in config_files:
+            try:
+                if config_file.endswith('.properties') or config_file.endswith('.yml') or config_file.endswith('.yaml'):
+                    with open(config_file, 'r', encoding='utf-8', errors='ignore') as f:
+                        content = f.read()
+                        result.properties.extend(line for line in content.split('\n') if any(keyword in line for keyword in
+                                 ['security', 'auth', 'jwt', 'oauth', 'token', 'keycloak']))
+
+            except Exception as e:
+                result.property_errors.append(str(e))
+
+        return result
+
+    def analyze_persistence(self, project_path):
+        result = PersistenceResult()
+
+        java_dirs = self.find_java_directories(project_path)
+        if not java_dirs:
+            return result
+        result.has_java_dirs = True
+
+        # Buscar entidades y repositorios
+        corpus = self.get_corpus(project_path)
+        entities = [source.entity for source in corpus.files if source.entity]
+        repositories = [source.repository for source in corpus.files if source.repository]
+
+        result.entity_count = len(entities)
+        result.repository_count = len(repositories)
+        result.entities = entities[:3]  # Mostrar solo las primeras 3 entidades
+        result.repositories = repositories[:3]  # Mostrar solo los primeros 3 repositorios
+
+        # Buscar herramientas de migración
+        if self.find_files(project_path, "flyway"):
+            result.migration_tools.append("Flyway")
+        if self.find_files(project_path, "liquibase"):
+            result.migration_tools.append("Liquibase")
+
+        # Buscar configuraciones de base de datos
+        config_files = []
+        config_files.extend(self.find_files(project_path, "application.properties"))
+        config_files.extend(self.find_files(project_path, "application.yml"))
+        config_files.extend(self.find_files(project_path, "application.yaml"))
+
+        for config_file in config_files:
+            try:
+                if config_file.endswith('.properties') or config_file.endswith('.yml') or config_file.endswith('.yaml'):
+                    with open(config_file, 'r', encoding='utf-8', errors='ignore') as f:
+                        content = f.read()
+                        result.db_configs.extend(line for line in content.split('\n') if any(keyword in line for keyword in
+                                 ['datasource', 'jpa', 'hibernate', 'database', 'jdbc']))
+
+            except Exception as e:
+                result.config_errors.append(str(e))
+
+        return result
+
+    def analyze_tests(self, project_path):
+        result = TestsResult()
+
+        # Buscar directorios de pruebas
+        test_dirs = []
+        for root, dirs, files in self.get_inventory(project_path).walk(project_path):
+            if ('test' in root.lower() and 'java' in root.lower()) or ('src/test' in root):
+                test_dirs.append(root)
+
+        if not test_dirs:
+            return result
+        result.has_test_dirs = True
+
+        # Contar archivos de prueba
+        test_files = []
+        for test_dir in test_dirs:
+            for root, dirs, files in self.walk(test_dir):
+                for file in files:
+                    if file.endswith('.java'):
+                        test_files.append(os.path.join(root, file))
+
+        result.test_file_count = len(test_files)
+
+        # Analizar tipos de pruebas
+        test_types = {"Unit": 0, "Integration": 0, "Other": 0}
+        for test_file in test_files:
+            filename = os.path.basename(test_file)
+            if 'Test.java' in filename and 'IT' not in filename and 'Integration' not in filename:
+                test_types["Unit"] += 1
+            elif 'IT.java' in filename or 'IntegrationTest.java' in filename:
+                test_types["Integration"] += 1
+            else:
+                test_types["Other"] += 1
+        result.distribution = test_types
+
+        # Buscar herramientas de testing
+        build_files = self.find_build_files(project_path)
+
+        testing_tools = set()
+        for build_file in build_files:
+            try:
+                if build_file.endswith('pom.xml'):
+                    pom = self.get_poms(project_path).get(build_file)
+                    if pom.error is not None:
+                        result.build_errors.append(pom.error)
+                        continue
+
+                    # Buscar dependencias de testing
+                    for dep in pom.iter_dependencies():
+                        if dep.artifact_id and any(keyword in dep.artifact_id.lower() for keyword in ['junit', 'mockito', 'testcontainers', 'assertj', 'hamcrest']):
+                            testing_tools.add(dep.artifact_id)
+
+                else:
+                    gradle = self.get_gradle(project_path).get(build_file)
+                    if gradle.error is not None:
+                        result.build_errors.append(gradle.error)
+                        continue
+
+                    # Buscar dependencias de testing
+                    for dep in gradle.iter_dependencies():
+                        if dep.artifact_id and any(keyword in dep.artifact_id.lower() for keyword in ['junit', 'mockito', 'testcontainers', 'assertj', 'hamcrest']):
+                            testing_tools.add(dep.artifact_id)
+
+            except Exception as e:
+                result.build_errors.append(str(e))
+
+        result.testing_tools = sorted(testing_tools)
+
+        # Buscar configuraciones de calidad de código
+        for pattern, tool in (("sonar", "SonarQube"), ("checkstyle", "Checkstyle"), ("pmd", "PMD"),
+                              ("spotbugs", "SpotBugs"), ("jacoco", "JaCoCo")):
+            if self.find_files(project_path, pattern):
+                result.quality_tools.append(tool)
+
+        # Evaluar cobertura de pruebas (heurística simple)
+        if test_files:
+            # Buscar clases principales
+            main_java_files = self.find_java_sources(project_path)
+            if main_java_files:
+                result.coverage_ratio = len(test_files) / len(main_java_files)
+
+        return result
+
+    def analyze_devops(self, project_path):
+        result = DevopsResult()
+
+        # Buscar configuraciones de logging
+        for pattern in ("logback.xml", "logback-spring.xml", "log4j", "logging"):
+            result.logging_configs.extend(self.find_files(project_path, pattern))
+
+        # Buscar configuraciones de métricas y trazabilidad
+        for pattern, tool in (("prometheus", "Prometheus"), ("grafana", "Grafana"), ("elk", "ELK"),
+                              ("zipkin", "Zipkin"), ("sleuth", "Sleuth"), ("actuator", "Spring Boot Actuator")):
+            if self.find_files(project_path, pattern):
+                result.monitoring_tools.append(tool)
+
+        # Buscar configuraciones CI/CD
+        for pattern in ("jenkins", "github", "gitlab", "azure-pipelines", ".github", ".gitlab", ".jenkins",
+                        "Jenkinsfile", "docker-compose", "Dockerfile", "kubernetes", "k8s"):
+            result.ci_cd_files.extend(self.find_files(project_path, pattern))
+
+        # Buscar configuraciones de despliegue en propiedades
+        config_files = []
+        config_files.extend(self.find_files(project_path, "application.properties"))
+        config_files.extend(self.find_files(project_path, "application.yml"))
+        config_files.extend(self.find_files(project_path, "application.yaml"))
+
+        for config_file in config_files:
+            try:
+                if config_file.endswith('.properties') or config_file.endswith('.yml') or config_file.endswith('.yaml'):
+                    with open(config_file, 'r', encoding='utf-8', errors='ignore') as f:
+                        content = f.read()
+                        result.properties.extend(line for line in content.split('\n') if any(keyword in line for keyword in
+                                 ['cloud', 'kubernetes', 'k8s', 'docker', 'actuator', 'management', 'metrics']))
+
+            except Exception as e:
+                result.config_errors.append(str(e))
+
+        return result
+
+    def compare_with_monolith(self, analysis_results):
+        context = analysis_results.get("contexto_general")
+        return ComparisonResult(is_microservices=bool(context and context.is_microservices))
+
+    def generate_recommendations(self, analysis_results):
+        recommendations = []
+        context = analysis_results.get("contexto_general")
+        is_microservices = bool(context and context.is_microservices)
+
+        # Recomendaciones basadas en la arquitectura
+        if is_microservices:
+            recommendations.append("Considerar implementar un API Gateway para unificar el acceso a los microservicios.")
+            recommendations.append("Evaluar el uso de service discovery (Eureka, Consul) para la localización de servicios.")
+            recommendations.append("Implementar circuit breakers (Resilience4j) para mejorar la tolerancia a fallos.")
+        else:
+            recommendations.append("Considerar modularizar la aplicación siguiendo principios de Domain-Driven Design.")
+            recommendations.append("Evaluar la separación en módulos independientes para facilitar una futura migración a microservicios.")
+
+        # Recomendaciones de seguridad
+        security = analysis_results.get("seguridad")
+        if security and security.csrf_disabled:
+            recommendations.append("Revisar la configuración de CSRF. No deshabilitar sin una justificación de seguridad adecuada.")
+        if not (security and security.uses_spring_security):
+            recommendations.append("Considerar implementar Spring Security para proteger los endpoints de la aplicación.")
+
+        # Recomendaciones de pruebas
+        tests = analysis_results.get("pruebas")
+        if tests and tests.low_coverage:
+            recommendations.append("Aumentar la cobertura de pruebas, especialmente para la lógica de negocio crítica.")
+        uses_testcontainers = bool(tests) and any('testcontainers' in tool.lower() for tool in tests.testing_tools)
+        if not uses_testcontainers and is_microservices:
+            recommendations.append("Considerar usar Testcontainers para pruebas de integración con bases de datos reales.")
+
+        # Recomendaciones de DevOps
+        devops = analysis_results.get("devops")
+        monitoring_tools = devops.monitoring_tools if devops else []
+        if "Spring Boot Actuator" not in monitoring_tools:
+            recommendations.append("Implementar Spring Boot Actuator para monitorización y gestión de la aplicación.")
+        if "Prometheus" not in monitoring_tools and "Grafana" not in monitoring_tools:
+            recommendations.append("Considerar implementar métricas con Prometheus y dashboards con Grafana.")
+
+        # Recomendaciones de persistencia
+        persistence = analysis_results.get("persistencia")
+        if not (persistence and persistence.migration_tools):
+            recommendations.append("Considerar usar Flyway o Liquibase para gestionar migraciones de base de datos.")
+
+        return recommendations
+
+    def cache_stats(self):
+        """Aciertos y fallos de la caché en el último análisis (None si no se usó)"""
+        if self.cache is None or not (self.cache.hits or self.cache.misses):
+            return None
+        return {"hits": self.cache.hits, "misses": self.cache.misses}
+    
+    # Métodos utilitarios
+    def get_inventory(self, project_path):
+        # Un único recorrido del disco por análisis; todas las secciones consultan este índice
+        if self.inventory is None or self.inventory.root != project_path:
+            self.inventory = ProjectInventory(project_path, self.ignore_globs)
+            self.corpus = None
+            self.poms = None
+            self.gradle = None
+        return self.inventory
+    
+    def walk(self, directory):
+        if self.inventory is None:
+            return Scanutils.walk(directory, self.ignore_globs)
+        return self.inventory.walk(directory)
+    
+    def find_files(self, directory, filename_pattern):
+        return self.get_inventory(directory).find(filename_pattern)
+    
+    def find_build_files(self, project_path):
+        # Nombres exactos: find_files("build.gradle") también devolvería los build.gradle.kts
+        inventory = self.get_inventory(project_path)
+        build_files = inventory.named("pom.xml")
+        for name in Buildmodel.GRADLE_BUILD_FILES:
+            build_files.extend(inventory.named(name))
+        return build_files
+    
+    def get_gradle(self, project_path):
+        # Scripts de Gradle (build y settings) leídos una sola vez por análisis, con catálogo y propiedades
+        inventory = self.get_inventory(project_path)
+        if self.gradle is None:
+            paths = []
+            for name in Buildmodel.GRADLE_SETTINGS_FILES + Buildmodel.GRADLE_BUILD_FILES:
+                paths.extend(inventory.named(name))
+            self.gradle = Buildmodel.GradleIndex(project_path, paths)
+        return self.gradle
+    
+    def get_poms(self, project_path):
+        # Cada pom.xml se lee una sola vez por análisis, con la herencia y los ${...} ya resueltos
+        inventory = self.get_inventory(project_path)
+        if self.poms is None:
+            self.poms = Buildmodel.PomIndex(inventory.named("pom.xml"))
+        return self.poms
+    
+    def get_corpus(self, project_path):
+        # Las fuentes Java se leen una sola vez por análisis y se comparten entre secciones
+        if self.corpus is None or self.corpus.root != project_path:
+            sources = self.find_java_sources(project_path)
+            corpus = JavaSourceCorpus(project_path, [])
+            for done, path in enumerate(sources, 1):
+                self.check_cancelled()
+                corpus.add(path, self.cache)
+                self.notify("archivos", done, len(sources))
+            self.corpus = corpus
+        return self.corpus
+    
+    def find_java_sources(self, project_path):
+        # Archivos .java únicos bajo los directorios Java (los directorios anidados no los repiten)
+        sources = []
+        seen = set()
+        for java_dir in self.find_java_directories(project_path):
+            for root, dirs, files in self.walk(java_dir):
+                for file in files:
+                    if file.endswith('.java'):
+                        file_path = os.path.join(root, file)
+                        if file_path not in seen:
+                            seen.add(file_path)
+                            sources.append(file_path)
+        return sources
+    
+    def find_java_directories(self, project_path):
+        java_dirs = []
+        for root, dirs, files in self.get_inventory(project_path).walk(project_path):
+            if 'src/main/java' in root:
+                java_dirs.append(root)
+            elif 'src' in root and 'java' in dirs:
+                java_dirs.append(os.path.join(root, 'java'))
+        return java_dirs
+    
+    def is_microservices(self, project_path):
+        # Heurística mejorada para detectar microservicios
+        # 1. Buscar múltiples módulos en Maven/Gradle
+        # 2. Buscar múltiples aplicaciones Spring Boot
+        # 3. Buscar configuraciones de Docker/Kubernetes para múltiples servicios
+        
+        # Verificar si es un proyecto multi-módulo de Maven o de Gradle (include en settings.gradle)
+        poms = self.get_poms(project_path)
+        for pom in poms:
+            if len(pom.modules) > 1:
+                return True
+        gradle = self.get_gradle(project_path)
+        for settings in gradle.settings_models():
+            if len(settings.modules) > 1:
+                return True
+        
+        # Verificar si hay múltiples archivos de aplicación
+        app_files = self.find_files(project_path, "Application.java")
+        if len(app_files) > 1:
+            return True
+        
+        # Verificar configuraciones de Docker/Kubernetes para múltiples servicios
+        docker_files = self.find_files(project_path, "Dockerfile")
+        if len(docker_files) > 1:
+            return True
+        
+        k8s_files = self.find_files(project_path, "deployment.yaml")
+        k8s_files.extend(self.find_files(project_path, "deployment.yml"))
+        k8s_files.extend(self.find_files(project_path, "service.yaml"))
+        k8s_files.extend(self.find_files(project_path, "service.yml"))
+        
+        if len(k8s_files) > 1:
+            return True
+        
+        # Buscar indicadores de Spring Cloud
+        build_files = self.find_build_files(project_path)
+        
+        for build_file in build_files:
+            try:
+                if build_file.endswith('pom.xml'):
+                    for dep in poms.get(build_file).iter_dependencies():
+                        if dep.artifact_id and 'spring-cloud' in dep.artifact_id.lower():
+                            return True
+                
+                else:
+                    model = gradle.get(build_file)
+                    for dep in model.iter_dependencies():
+                        if 'spring-cloud' in dep.coordinates.lower():
+                            return True
+            except:
+                pass
+        
+        return False
+
+
+def render_report(analysis_results, recommendations):
+    """Texto del reporte completo tal como se muestra en la ventana de análisis"""
+    parts = [render_section(result) for result in analysis_results.values()]
+    
+    # Añadir resumen y recomendaciones finales
+    parts.append(render_recommendations(recommendations))
+    return "".join(parts)
+
+def render_section(result):
+    """Texto de una sección del reporte, con el separador que le sigue"""
+    return "".join(result.render_parts()) + "\n"
+
+def render_recommendations(recommendations):
+    """Cierre del reporte: resumen y recomendaciones finales"""
+    parts = ["=== RESUMEN Y RECOMENDACIONES FINALES ===\n\n"]
+    for rec in recommendations:
+        parts.append(f"• {rec}\n")
+    parts.append("\n=== ANÁLISIS COMPLETADO ===\n")
+    return "".join(parts)
+
+def project_to_dict(project_path, analysis_results, recommendations, cache_stats=None):
+    """Resultado de un proyecto como diccionario serializable a JSON"""
+    data = {"project": project_path,
+            "results": {section: result.to_dict() for section, result in analysis_results.items()},
+            "recomendaciones": recommendations}
+    if cache_stats is not None:
+        data["cache"] = cache_stats
+    return data
+
+def analyze_projects(project_paths, sections=None, workers=None, use_cache=True, ignore_globs=()):
+    """Analiza varios proyectos con un mismo analizador y produce los resultados uno a uno.
+
+    Devuelve un generador de (ruta, analysis_results, recomendaciones, estadísticas de caché,
+    error) para que el llamador pueda emitir cada proyecto en cuanto termina.
+    """
+    analyzer = SpringBootAnalyzer(use_cache=use_cache, ignore_globs=ignore_globs)
+    for project_path in project_paths:
+        if not os.path.isdir(project_path):
+            yield project_path, None, None, None, "No es un directorio de proyecto"
+            continue
+        try:
+            analysis_results = analyzer.run(project_path, sections, workers)
+            yield (project_path, analysis_results, analyzer.generate_recommendations(analysis_results),
+                   analyzer.cache_stats(), None)
+        except Exception as e:
+            yield project_path, None, None, None, str(e)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Analizador de proyectos Spring Boot sin interfaz gráfica.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    analyze_parser = subparsers.add_parser('analyze', help='Analiza uno o varios proyectos')
+    analyze_parser.add_argument('paths', nargs='+', metavar='PATH', help='Directorios de proyecto a analizar')
+    analyze_parser.add_argument('--sections', help='Secciones separadas por comas (por defecto todas): ' +
+                                ', '.join(key for key, method in SECTIONS))
+    analyze_parser.add_argument('--format', choices=['text', 'json', 'ndjson'], default='text',
+                                help='json emite un objeto indentado por proyecto; ndjson, un objeto por línea')
+    analyze_parser.add_argument('--workers', type=int, default=1, help='Procesos paralelos por proyecto')
+    analyze_parser.add_argument('--no-cache', action='store_true', help='Analiza todas las fuentes sin usar la caché en disco')
+    analyze_parser.add_argument('--ignore', action='append', default=[], metavar='GLOB',
+                                help='Glob estilo .gitignore a excluir del recorrido (repetible)')
+    
+    args = parser.parse_args(argv)
+    
+    sections = None
+    if args.sections:
+        sections = {name.strip() for name in args.sections.split(',') if name.strip()}
+        unknown = sections - {key for key, method in SECTIONS}
+        if unknown:
+            parser.error(f"Secciones desconocidas: {', '.join(sorted(unknown))}")
+    
+    indent = 2 if args.format == 'json' else None
+    failures = 0
+    results = analyze_projects(args.paths, sections, args.workers, use_cache=not args.no_cache,
+                               ignore_globs=args.ignore)
+    for project_path, analysis_results, recommendations, cache_stats, error in results:
+        if error is not None:
+            failures += 1
+            if args.format != 'text':
+                print(json.dumps({"project": project_path, "error": error}, ensure_ascii=False, indent=indent))
+            else:
+                print(f"Error durante el análisis de {project_path}: {error}", file=sys.stderr)
+        elif args.format != 'text':
+            print(json.dumps(project_to_dict(project_path, analysis_results, recommendations, cache_stats),
+                             ensure_ascii=False, indent=indent))
+        else:
+            print(f"##### {project_path} #####\n")
+            print(render_report(analysis_results, recommendations))
+            if cache_stats is not None:
+                print(f"Caché: {cache_stats['hits']} archivos reutilizados, {cache_stats['misses']} analizados",
+                      file=sys.stderr)
+        sys.stdout.flush()
+    
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,8 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import shutil
-import re
+import Scanutils
+import Javalexer
 
 class App:
     def __init__(self, root):
@@ -87,19 +88,18 @@ class App:
             messagebox.showerror("Error", f"Ocurrió un error al copiar el proyecto: {e}")
 
     def list_methods_from_project(self, directory):
-        # Expresión regular para encontrar métodos de Java.
-        # Puede necesitar ajustes para otros lenguajes o estilos de código.
-        method_regex = re.compile(r'(public|protected|private|static|\s) +[\w\<\>\[\]]+\s+(\w+)\s*\([^)]*\)\s*(\{?|[^;])')
-
-        for root_dir, _, files in os.walk(directory):
+        # Métodos declarados en cada tipo de los archivos Java (analizador léxico de Javalexer:
+        # ignora comentarios y cadenas y no confunde llamadas con declaraciones).
+        for root_dir, _, files in Scanutils.walk(directory):
             for file in files:
                 if file.endswith(".java"): # Se puede extender a otros tipos de archivo, ej: .py, .kt
                     file_path = os.path.join(root_dir, file)
                     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                         content = f.read()
-                        found_methods = method_regex.finditer(content)
-                        for match in found_methods:
-                            method_name = match.group(2)
+                    tokens = Javalexer.tokenize(content)
+                    for declaration in Javalexer.type_declarations(tokens):
+                        for method in Javalexer.method_declarations(tokens, declaration):
+                            method_name = method.name
                             # Añadir a la tabla con una casilla de verificación
                             item_id = self.tree.insert("", "end", values=(os.path.relpath(file_path, directory), method_name))
                             self.methods[item_id] = {'file_path': file_path, 'method_name': method_name, 'checked': tk.BooleanVar(value=False)}
@@ -142,26 +142,70 @@ class App:
         if not messagebox.askyesno("Confirmar Eliminación", f"¿Estás seguro de que quieres eliminar {len(methods_to_delete)} métodos? Esta acción no se puede deshacer."):
             return
 
+        # Nombres a eliminar agrupados por archivo: cada archivo se lee y se escribe una sola vez
+        names_by_file = {}
         for method_data in methods_to_delete:
-            file_path = method_data['file_path']
-            method_name = method_data['method_name']
-            
-            # Expresión regular para encontrar el método completo
-            # ATENCIÓN: Esta es una simplificación y podría fallar con sobrecargas de métodos o código complejo.
-            method_body_regex = re.compile(
-                r'(public|protected|private|static|\s).*?\s+' + re.escape(method_name) + r'\s*\([^)]*\)\s*\{[^{}]*(((?<=\{)[^{}]*)|[^{}]*)*\}', 
-                re.DOTALL
-            )
-            
+            names_by_file.setdefault(method_data['file_path'], set()).add(method_data['method_name'])
+        
+        for file_path, method_names in names_by_file.items():
             with open(file_path, 'r+', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
-                new_content = method_body_regex.sub('', content)
+                new_content = self.remove_methods(content, method_names)
                 f.seek(0)
                 f.write(new_content)
                 f.truncate()
         
         messagebox.showinfo("Éxito", f"Se han eliminado {len(methods_to_delete)} métodos del proyecto en:\n{self.destination_dir}")
 
+    @staticmethod
+    def remove_methods(content, method_names):
+        """Elimina del código las declaraciones completas (anotaciones, firma y cuerpo) de esos métodos.
+        
+        Las sobrecargas se eliminan todas. Las posiciones salen del analizador léxico, así que
+        las llaves dentro de cadenas o comentarios no cortan el cuerpo antes de tiempo.
+        """
+        tokens = Javalexer.tokenize(content)
+        spans = []
+        for declaration in Javalexer.type_declarations(tokens):
+            for method in Javalexer.method_declarations(tokens, declaration):
+                if method.name in method_names:
+                    spans.append(method.char_span(tokens))
+        
+        # Solo los más externos (un método de una clase local de otro que se elimina cae con él)
+        spans.sort()
+        outermost = []
+        for start, end in spans:
+            if not outermost or start >= outermost[-1][1]:
+                outermost.append((start, end))
+        
+        # De atrás hacia delante: lo que queda tras un método ya descuenta los eliminados después
+        removed = []
+        for start, end in reversed(outermost):
+            # Las líneas que solo contenían el método desaparecen enteras
+            line_start = content.rfind('\n', 0, start) + 1
+            line_end = content.find('\n', end)
+            line_end = len(content) if line_end == -1 else line_end + 1
+            rest, position = [], end
+            for removed_start, removed_end in removed:
+                if removed_start >= line_end:
+                    break
+                rest.append(content[position:removed_start])
+                position = removed_end
+            rest.append(content[position:line_end])
+            if content[line_start:start].strip() == '' and ''.join(rest).strip() == '':
+                start, end = line_start, line_end
+            while removed and removed[0][0] < end:
+                end = max(end, removed.pop(0)[1])
+            removed.insert(0, (start, end))
+
+        # Un único join con los trozos que se conservan entre los métodos eliminados
+        pieces, position = [], 0
+        for start, end in removed:
+            pieces.append(content[position:start])
+            position = end
+        pieces.append(content[position:])
+        return ''.join(pieces)
+
 if __name__ == "__main__":
     root = tk.Tk()
     app = App(root)
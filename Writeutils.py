@@ -0,0 +1,141 @@
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _temp_path(path):
+    # Oculto, en el mismo directorio (os.replace no cruza sistemas de archivos) y único por hilo
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def write_atomic(path, content, encoding='utf-8'):
+    """Escribe content en path a través de un temporal del mismo directorio y os.replace.
+
+    Un lector nunca ve el archivo a medias: o el contenido anterior o el nuevo completo.
+    Devuelve los bytes escritos.
+    """
+    temp_path = _temp_path(path)
+    try:
+        with open(temp_path, 'w', encoding=encoding) as f:
+            f.write(content)
+            f.flush()
+            size = os.fstat(f.fileno()).st_size
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return size
+
+
+def copy_atomic(source, path):
+    """Copia source en path (contenido y metadatos, como shutil.copy2) con la misma atomicidad"""
+    temp_path = _temp_path(path)
+    try:
+        shutil.copy2(source, temp_path)
+        size = os.path.getsize(temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return size
+
+
+class BulkWriter:
+    """Escritura de muchos archivos en un pool de hilos.
+
+    Cada directorio de destino se crea una sola vez, desde el hilo que encola, antes de la
+    primera escritura que lo necesita. Las escrituras son atómicas (write_atomic/copy_atomic)
+    y como mucho hay workers * 4 pendientes, así que el contenido encolado no crece con el
+    número de archivos. progress(escritos, encolados) se llama desde los hilos del pool.
+
+        with BulkWriter(progress=...) as writer:
+            writer.write(path, content)
+        writer.stats()  # {'files', 'bytes', 'seconds'}
+
+    El primer error de escritura se relanza al cerrar, cuando ya terminaron las demás.
+    """
+
+    def __init__(self, workers=None, progress=None):
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.progress = progress
+        self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        self.slots = threading.BoundedSemaphore(self.workers * 4)
+        self.lock = threading.Lock()
+        self.directories = set()
+        self.paths = []
+        self.submitted = 0
+        self.files = 0
+        self.bytes = 0
+        self.error = None
+        self.started = time.perf_counter()
+        self.elapsed = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def make_dirs(self, directory):
+        if directory and directory not in self.directories:
+            os.makedirs(directory, exist_ok=True)
+            self.directories.add(directory)
+
+    def write(self, path, content, encoding='utf-8'):
+        """Encola la escritura de content en path y devuelve path"""
+        return self._submit(path, write_atomic, path, content, encoding)
+
+    def copy(self, source, path):
+        """Encola la copia de source en path y devuelve path"""
+        return self._submit(path, copy_atomic, source, path)
+
+    def _submit(self, path, function, *args):
+        if self.error is not None:
+            raise self.error
+        self.make_dirs(os.path.dirname(path))
+        self.slots.acquire()
+        self.paths.append(path)
+        self.submitted += 1
+        self.pool.submit(self._run, function, args)
+        return path
+
+    def _run(self, function, args):
+        try:
+            size = function(*args)
+        except Exception as e:
+            with self.lock:
+                if self.error is None:
+                    self.error = e
+            return
+        finally:
+            self.slots.release()
+        with self.lock:
+            self.files += 1
+            self.bytes += size
+            done = self.files
+        if self.progress:
+            self.progress(done, self.submitted)
+
+    def close(self):
+        """Espera a las escrituras pendientes; relanza el primer error si lo hubo"""
+        if self.elapsed is None:
+            self.pool.shutdown(wait=True)
+            self.elapsed = time.perf_counter() - self.started
+        if self.error is not None:
+            raise self.error
+
+    def stats(self):
+        seconds = self.elapsed if self.elapsed is not None else time.perf_counter() - self.started
+        return {'files': self.files, 'bytes': self.bytes, 'seconds': seconds}
+
+
+def describe_stats(stats):
+    """Resumen legible del rendimiento de un BulkWriter"""
+    seconds = max(stats['seconds'], 1e-9)
+    return (f"{stats['files']} archivos, {stats['bytes'] / 2 ** 20:.1f} MB en {stats['seconds']:.2f} s "
+            f"({stats['files'] / seconds:.0f} archivos/s, {stats['bytes'] / 2 ** 20 / seconds:.1f} MB/s)")